@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import collections.abc
+import concurrent.futures
+import contextlib
 import functools
 import importlib.metadata
 import keyword
+import os
+import queue
 import re
 import sys
+import threading
+import time
 import urllib.parse
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, ClassVar
@@ -668,6 +675,23 @@ class CanCreateSchema(abc.ABC):
         """Return the current schema."""
 
 
+class ExecutionResults(list):
+    """Results of `execute_many` or `to_pyarrow_many`, in input order.
+
+    Attributes
+    ----------
+    elapsed
+        Wall clock time in seconds spent running the query of each result.
+        Expressions that occur more than once in the input are only run once
+        and share their timing.
+
+    """
+
+    def __init__(self, results: Iterable[Any], elapsed: Iterable[float]):
+        super().__init__(results)
+        self.elapsed = list(elapsed)
+
+
 class BaseBackend(abc.ABC, _FileIOHandler):
     """Base backend class.
 
@@ -681,17 +705,23 @@ class BaseBackend(abc.ABC, _FileIOHandler):
     supports_python_udfs = False
     supports_in_memory_tables = True
 
+    _concurrent_queries = False
+    """Whether queries can run concurrently on `_worker_connection`s."""
+
     def __init__(self, *args, **kwargs):
         self._con_args: tuple[Any] = args
         self._con_kwargs: dict[str, Any] = kwargs
         # expression cache
         self._query_cache = RefCountedCache(
-            populate=self._load_into_cache,
+            populate=self._populate_cache,
             lookup=lambda name: self.table(name).op(),
             finalize=self._clean_up_cached_table,
             generate_name=functools.partial(util.gen_name, "cache"),
             key=lambda expr: expr.op(),
         )
+        # thread pools for the asynchronous methods, keyed by whether they run
+        # queries on worker connections
+        self._async_executors: dict[bool, concurrent.futures.Executor] = {}
 
     @property
     @abc.abstractmethod
@@ -937,6 +967,372 @@ class BaseBackend(abc.ABC, _FileIOHandler):
     def execute(self, expr: ir.Expr) -> Any:
         """Execute an expression."""
 
+    @util.experimental
+    def execute_many(
+        self,
+        exprs: Iterable[ir.Expr],
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = "default",
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> ExecutionResults:
+        """Execute several independent expressions.
+
+        All expressions are compiled before any of them runs. Backends that
+        can run queries on separate cursors or connections dispatch them to a
+        pool of worker threads, other backends run them one after another.
+        Identical expressions are only executed once.
+
+        Parameters
+        ----------
+        exprs
+            Ibis expressions to execute
+        params
+            Mapping of scalar parameter expressions to value, shared by all
+            expressions.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        max_workers
+            Maximum number of queries to run at the same time. Defaults to the
+            same number of threads as `concurrent.futures.ThreadPoolExecutor`.
+        kwargs
+            Keyword arguments passed to each execution
+
+        Returns
+        -------
+        ExecutionResults
+            A list of the results in the order of `exprs`, with the time spent
+            running each query in its `elapsed` attribute.
+
+        """
+        return self._run_many(
+            "execute",
+            exprs,
+            params=params,
+            limit=limit,
+            max_workers=max_workers,
+            **kwargs,
+        )
+
+    @util.experimental
+    def to_pyarrow_many(
+        self,
+        exprs: Iterable[ir.Expr],
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> ExecutionResults:
+        """Execute several independent expressions and return pyarrow results.
+
+        See [`execute_many`](#ibis.backends.BaseBackend.execute_many) for how
+        the expressions are run.
+
+        Parameters
+        ----------
+        exprs
+            Ibis expressions to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value, shared by all
+            expressions.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        max_workers
+            Maximum number of queries to run at the same time.
+        kwargs
+            Keyword arguments passed to each execution
+
+        Returns
+        -------
+        ExecutionResults
+            A list of the pyarrow results in the order of `exprs`, with the
+            time spent running each query in its `elapsed` attribute.
+
+        """
+        return self._run_many(
+            "to_pyarrow",
+            exprs,
+            params=params,
+            limit=limit,
+            max_workers=max_workers,
+            **kwargs,
+        )
+
+    def _run_many(
+        self,
+        method: str,
+        exprs: Iterable[ir.Expr],
+        *,
+        max_workers: int | None,
+        **kwargs: Any,
+    ) -> ExecutionResults:
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        elif max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        exprs = list(exprs)
+        # identical expressions are prepared and run once
+        unique = {}
+        for expr in exprs:
+            unique.setdefault(expr.op(), expr)
+
+        # prepare everything before running anything, so that compilation
+        # errors surface before any query is sent and so that the backend's
+        # state is only modified from the calling thread
+        tasks = self._prepare_batch(method, list(unique.values()), **kwargs)
+
+        results = [None] * len(tasks)
+        elapsed = [None] * len(tasks)
+
+        def run(i, task, con):
+            start = time.perf_counter()
+            results[i] = task(con)
+            elapsed[i] = time.perf_counter() - start
+
+        if self._concurrent_queries and max_workers > 1:
+            shared = [i for i, (_, shareable) in enumerate(tasks) if shareable]
+        else:
+            shared = []
+        # queries that can't use a worker connection run on the backend's own
+        # connection in the calling thread
+        local = sorted(set(range(len(tasks))).difference(shared))
+
+        with contextlib.ExitStack() as stack:
+            cons = queue.SimpleQueue()
+            for _ in range(min(max_workers, len(shared))):
+                cons.put(stack.enter_context(self._worker_connection()))
+
+            def run_on_worker(i):
+                con = cons.get()
+                try:
+                    run(i, tasks[i][0], con)
+                finally:
+                    cons.put(con)
+
+            with concurrent.futures.ThreadPoolExecutor(max(cons.qsize(), 1)) as pool:
+                futures = [pool.submit(run_on_worker, i) for i in shared]
+                try:
+                    for i in local:
+                        run(i, tasks[i][0], None)
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        positions = {op: i for i, op in enumerate(unique)}
+        indices = [positions[expr.op()] for expr in exprs]
+        return ExecutionResults(
+            (results[i] for i in indices), (elapsed[i] for i in indices)
+        )
+
+    def _prepare_batch(
+        self, method: str, exprs: list[ir.Expr], **kwargs: Any
+    ) -> list[tuple[Callable[[Any], Any], bool]]:
+        """Prepare each of `exprs`, see `_prepare_many`.
+
+        Backends can override this to share work between the expressions.
+        """
+        return [self._prepare_many(method, expr, **kwargs) for expr in exprs]
+
+    def _prepare_many(
+        self, method: str, expr: ir.Expr, **kwargs: Any
+    ) -> tuple[Callable[[Any], Any], bool]:
+        """Prepare `expr` to be run by `execute_many` or `to_pyarrow_many`.
+
+        Returns a function that runs the query and a flag indicating whether
+        it may run concurrently with other queries. The function is called
+        with a connection from `_worker_connection`, or with `None` when it
+        should use the backend's own connection.
+        """
+        return (lambda _: getattr(self, method)(expr, **kwargs)), False
+
+    def _worker_connection(self) -> contextlib.AbstractContextManager:
+        """Open a connection for running queries from a worker thread."""
+        raise NotImplementedError(
+            f"{self.name} backend doesn't support concurrent queries"
+        )
+
+    @util.experimental
+    async def execute_async(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = "default",
+        **kwargs: Any,
+    ) -> Any:
+        """Execute an expression without blocking the event loop.
+
+        Queries run on a thread pool owned by the backend. Queries that use
+        the backend's own connection run one at a time, while backends that
+        support concurrent queries run them on separate worker connections.
+        Cancelling the awaiting task interrupts the query on the server where
+        the backend supports it.
+
+        Mixing asynchronous and blocking calls on the same backend from
+        different threads at the same time is not supported.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to execute
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        kwargs
+            Keyword arguments
+
+        """
+        return await self._run_async(
+            "execute", expr, params=params, limit=limit, **kwargs
+        )
+
+    @util.experimental
+    async def to_pyarrow_async(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        **kwargs: Any,
+    ) -> pa.Table:
+        """Execute an expression to pyarrow without blocking the event loop.
+
+        See [`execute_async`](#ibis.backends.BaseBackend.execute_async) for
+        how the query is run.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        Table
+            A pyarrow table holding the results of the executed expression.
+
+        """
+        return await self._run_async(
+            "to_pyarrow", expr, params=params, limit=limit, **kwargs
+        )
+
+    async def _run_async(self, method: str, expr: ir.Expr, **kwargs: Any) -> Any:
+        main = self._async_executor(shared=False)
+
+        # preparing modifies the backend's state, so it happens on the same
+        # thread as the queries that use the backend's own connection
+        def prepare():
+            task, shareable = self._prepare_many(method, expr, **kwargs)
+            stack = contextlib.ExitStack()
+            con = None
+            if shareable and self._concurrent_queries:
+                con = stack.enter_context(self._worker_connection())
+            return task, con, stack
+
+        task, con, stack = await self._run_in_thread(main, prepare)
+
+        def run():
+            with stack:
+                return task(con)
+
+        executor = main if con is None else self._async_executor(shared=True)
+        return await self._run_in_thread(executor, run, con, cleanup=stack.close)
+
+    async def _run_in_thread(
+        self,
+        executor: concurrent.futures.Executor,
+        func: Callable[[], Any],
+        con: Any = None,
+        *,
+        cleanup: Callable[[], Any] | None = None,
+    ) -> Any:
+        """Await `func` running on `executor`.
+
+        If the awaiting task is cancelled while `func` runs, the query on
+        `con` is interrupted. If it is cancelled before `func` starts, `func`
+        is skipped and `cleanup` is called instead.
+        """
+        lock = threading.Lock()
+        running = cancelled = False
+        thread = None
+
+        def run():
+            nonlocal running, thread
+            with lock:
+                if cancelled:
+                    if cleanup is not None:
+                        cleanup()
+                    return None
+                running = True
+                thread = threading.get_ident()
+            try:
+                return func()
+            finally:
+                with lock:
+                    running = False
+
+        future = executor.submit(run)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            with lock:
+                cancelled = True
+                if running:
+                    if con is None:
+                        con = self._thread_connection(thread)
+                    self._interrupt(con)
+            if cleanup is not None:
+                # the future may still be cancelled before it starts
+                future.add_done_callback(lambda f: f.cancelled() and cleanup())
+            raise
+
+    def _async_executor(self, *, shared: bool) -> concurrent.futures.Executor:
+        """Return the thread pool that runs asynchronous queries.
+
+        The pool for queries on the backend's own connection has a single
+        thread so that they run one after another.
+        """
+        try:
+            return self._async_executors[shared]
+        except KeyError:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                None if shared else 1, thread_name_prefix=f"ibis-{self.name}"
+            )
+            return self._async_executors.setdefault(shared, executor)
+
+    def _interrupt(self, con: Any = None) -> None:
+        """Interrupt the query running on `con`.
+
+        `con` is a connection from `_worker_connection`, or `None` for the
+        backend's own connection. Must be safe to call from any thread. By
+        default queries aren't interrupted and run to completion.
+        """
+
+    def _thread_connection(self, thread: int) -> Any:
+        """Return the connection used by the thread with identifier `thread`.
+
+        Used to interrupt the queries of the backend's own connection when
+        they actually run on another one, e.g. checked out from a pool.
+        Returns `None` for the backend's own connection.
+        """
+        return None
+
     def add_operation(self, operation: ops.Node) -> Callable:
         """Add a translation function to the backend for a specific operation.
 
@@ -1140,6 +1536,51 @@ class BaseBackend(abc.ABC, _FileIOHandler):
         """
         del self._query_cache[expr.op()]
 
+    def _populate_cache(self, name, expr):
+        options = ibis.options.cache
+        if options.directory is not None:
+            expr = self._persisted(expr, options)
+        self._load_into_cache(name, expr)
+
+    def _persisted(self, expr: ir.Table, options: ibis.config.Cache) -> ir.Table:
+        """Return an in-memory table of the persisted result of `expr`.
+
+        The result is computed and persisted if it isn't already. Expressions
+        that can't be fingerprinted, for example because they reference
+        Python UDFs, are returned unchanged, as well as expressions reading
+        tables which may not outlive their connection.
+        """
+        from ibis.common.caching import PersistentCache
+
+        node = expr.op()
+        if any(op.source._is_ephemeral(op) for op in node.find(ops.DatabaseTable)):
+            return expr
+
+        try:
+            key = node.fingerprint()
+        except TypeError:
+            return expr
+
+        cache = PersistentCache(
+            options.directory,
+            format=options.format,
+            max_size=options.max_size,
+            ttl=options.ttl,
+        )
+        if (table := cache.get(key)) is None:
+            table = self.to_pyarrow(expr)
+            cache.put(key, table)
+        return ibis.memtable(table, schema=expr.schema())
+
+    def _is_ephemeral(self, op: ops.DatabaseTable) -> bool:
+        """Whether the data of a table may not outlive the connection.
+
+        Persisted results identify tables by their name and `db_identity`,
+        which doesn't tell apart in-memory databases or temporary tables of
+        different connections, so results computed from them aren't persisted.
+        """
+        return False
+
     def _load_into_cache(self, name, expr):
         raise NotImplementedError(self.name)
 
@@ -140,7 +140,7 @@ class Backend(SQLBackend, CanCreateSchema):
             database=self._session_dataset.project,
         ).op()
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         self._make_session()
 
         raw_name = op.name
@@ -164,6 +164,8 @@ class Backend(SQLBackend, CanCreateSchema):
                 ),
             )
             load_job.result()
+            return True
+        return False
 
     def _read_file(
         self,
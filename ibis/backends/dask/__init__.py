@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 import dask
 import dask.dataframe as dd
 import pandas as pd
+from dask.delayed import Delayed
 
 import ibis.common.exceptions as com
 
@@ -15,6 +16,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import NoUrl
+from ibis.backends.dask.helpers import shared_dependencies
 from ibis.backends.pandas import BasePandasBackend
 from ibis.formats.pandas import PandasData
 
@@ -22,6 +24,8 @@ if TYPE_CHECKING:
     import pathlib
     from collections.abc import Mapping, MutableMapping
 
+    import pyarrow as pa
+
 
 class Backend(BasePandasBackend, NoUrl):
     name = "dask"
@@ -115,6 +119,42 @@ class Backend(BasePandasBackend, NoUrl):
 
         return DaskExecutor.execute(expr.op(), backend=self, params=params)
 
+    def to_pyarrow_batches(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1000000,
+        **kwargs: Any,
+    ) -> pa.ipc.RecordBatchReader:
+        pa = self._import_pyarrow()
+        table_expr = expr.as_table()
+        schema = table_expr.schema()
+        result = self.compile(table_expr, params=params, limit=limit, **kwargs)
+
+        def partitions():
+            # an empty result is returned as a pandas DataFrame
+            if isinstance(result, pd.DataFrame):
+                yield result
+            else:
+                # the tasks shared by several partitions (e.g. the shuffle of a
+                # sort) are computed once up front, the rest of the graph one
+                # partition at a time as the batches are consumed
+                (optimized,) = dask.optimize(result)
+                graph = dict(optimized.__dask_graph__())
+                keys = optimized.__dask_keys__()
+                shared = shared_dependencies(graph, keys)
+                for task in dask.persist(*(Delayed(key, graph) for key in shared)):
+                    graph.update(task.__dask_graph__())
+                for key in keys:
+                    part = Delayed(key, graph).compute()
+                    yield PandasData.convert_table(part, schema)
+
+        return pa.RecordBatchReader.from_batches(
+            schema.to_pyarrow(), self._frame_batches(partitions(), schema, chunk_size)
+        )
+
     def read_csv(
         self, source: str | pathlib.Path, table_name: str | None = None, **kwargs: Any
     ):
@@ -171,6 +211,7 @@ class Backend(BasePandasBackend, NoUrl):
         table_name = table_name or util.gen_name("read_parquet")
         df = dd.read_parquet(source, **kwargs)
         self.dictionary[table_name] = df
+        self._parquet_sources[table_name] = (df, source, kwargs)
         return self.table(table_name)
 
     def table(self, name: str, schema: sch.Schema | None = None):
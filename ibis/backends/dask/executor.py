@@ -13,6 +13,9 @@ import ibis.expr.operations as ops
 from ibis.backends.dask.convert import DaskConverter
 from ibis.backends.dask.helpers import (
     DaskUtils,
+    DistributedFrame,
+    OverlappingFrame,
+    ShuffledFrame,
     add_globally_consecutive_column,
 )
 from ibis.backends.pandas.executor import PandasExecutor
@@ -20,6 +23,7 @@ from ibis.backends.pandas.rewrites import (
     PandasAggregate,
     PandasJoin,
     PandasLimit,
+    PandasReadParquet,
     PandasResetIndex,
     PandasScalarSubquery,
     plan,
@@ -254,16 +258,67 @@ class DaskExecutor(PandasExecutor, DaskUtils):
     ############################ Window functions #############################
 
     @classmethod
-    def visit(cls, op: ops.WindowFrame, table, start, end, **kwargs):
+    def visit(
+        cls, op: ops.WindowFrame, table, start, end, group_by, order_by, **kwargs
+    ):
+        bounded = start is not None and end is not None
+        if not isinstance(start, dd.Series) and not isinstance(end, dd.Series):
+            frame_visit = super().visit
+
+            def make_frame(df):
+                # group_by and order_by are only checked for being empty
+                return frame_visit(
+                    op,
+                    table=df,
+                    start=start,
+                    end=end,
+                    group_by=op.group_by,
+                    order_by=op.order_by,
+                    **kwargs,
+                )
+
+            group_keys = [group.name for group in op.group_by]
+            if group_keys:
+                return ShuffledFrame(table, make_frame, group_keys=group_keys)
+            elif op.how == "rows" and bounded:
+                lower = -start if op.start.preceding else start
+                upper = -end if op.end.preceding else end
+                keys = [key for key in op.order_by if key.shape.is_columnar()]
+                return OverlappingFrame(
+                    table,
+                    make_frame,
+                    order_keys=[key.name for key in keys],
+                    ascending=[key.ascending for key in keys],
+                    before=max(-lower, 0),
+                    after=max(upper, 0),
+                )
+
+        # other frames over the whole table, and frames bounded by columns, are
+        # computed locally
         table = table.compute()
         if isinstance(start, dd.Series):
             start = start.compute()
         if isinstance(end, dd.Series):
             end = end.compute()
-        return super().visit(op, table=table, start=start, end=end, **kwargs)
+        return super().visit(
+            op,
+            table=table,
+            start=start,
+            end=end,
+            group_by=group_by,
+            order_by=order_by,
+            **kwargs,
+        )
 
     @classmethod
     def visit(cls, op: ops.WindowFunction, func, frame):
+        if isinstance(frame, DistributedFrame):
+            window_visit = super().visit
+            return frame.apply(
+                lambda frame: window_visit(op, func=func, frame=frame),
+                name=op.name,
+                dtype=PandasType.from_ibis(op.dtype),
+            )
         result = super().visit(op, func=func, frame=frame)
         return cls.asseries(result)
 
@@ -279,6 +334,14 @@ class DaskExecutor(PandasExecutor, DaskUtils):
                 "probably tried to execute an expression without a data source"
             )
 
+    @classmethod
+    def visit(cls, op: PandasReadParquet, name, schema, source, filters):
+        _, path, kwargs = source._parquet_sources[name]
+        kwargs = {**kwargs, "columns": list(schema.names)}
+        if filters and "filters" not in kwargs:
+            kwargs["filters"] = list(filters)
+        return dd.read_parquet(path, **kwargs)
+
     @classmethod
     def visit(cls, op: ops.InMemoryTable, name, schema, data):
         df = data.to_frame().reset_index(drop=True)
@@ -391,7 +454,9 @@ class DaskExecutor(PandasExecutor, DaskUtils):
             return cls.visit(node, **kwargs)
 
         node = node.to_expr().as_table().op()
-        node = plan(node, backend=backend, params=params)
+        # only prune the columns of plans reading parquet files, the columns
+        # of in-memory dask dataframes are already selected lazily
+        node = plan(node, backend=backend, params=params, prune_in_memory=False)
         return node.map_clear(fn)
 
     @classmethod
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from typing import Callable
+import abc
+from typing import TYPE_CHECKING, Callable
 
 import dask.array as da
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
+from dask.core import get_dependencies
 
 from ibis.backends.pandas.helpers import PandasUtils
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
 
 class DaskUtils(PandasUtils):
     @classmethod
@@ -132,6 +137,145 @@ class DaskUtils(PandasUtils):
         return df.map_partitions(mapper, meta=(name, dtype))
 
 
+class DistributedFrame(abc.ABC):
+    """A window frame over a dask dataframe computed without collecting it.
+
+    Window functions are evaluated with the pandas executor on chunks of the
+    table's rows, built with `make_frame` from every chunk. The results are
+    then routed back to the partition and position of the rows they belong
+    to, so they line up with the table.
+    """
+
+    def __init__(self, df, make_frame):
+        self.df = df
+        self.make_frame = make_frame
+
+    def tag(self):
+        """Add the partition and the position within it to every row."""
+
+        def tag(df, partition_info=None):
+            number = partition_info["number"] if partition_info else 0
+            return df.assign(__partition__=number, __position__=np.arange(len(df)))
+
+        return self.df.map_partitions(tag)
+
+    @abc.abstractmethod
+    def distribute(self, rows, evaluate, meta):
+        """Evaluate a window function on chunks of the tagged rows."""
+
+    def apply(self, func, name, dtype):
+        columns = list(self.df.columns)
+        make_frame = self.make_frame
+        meta = pd.DataFrame(
+            {
+                "__partition__": pd.Series(dtype="int64"),
+                "__position__": pd.Series(dtype="int64"),
+                "__result__": pd.Series(dtype=dtype),
+            }
+        )
+
+        def evaluate(chunk):
+            if chunk.empty:
+                return meta
+            chunk = chunk.reset_index(drop=True)
+            result = func(make_frame(chunk[columns]))
+            return pd.DataFrame(
+                {
+                    "__partition__": chunk["__partition__"],
+                    "__position__": chunk["__position__"],
+                    "__result__": result.reindex(chunk.index),
+                }
+            )
+
+        def restore(df, results):
+            # rows without a result don't belong to any window frame
+            values = results.set_index("__position__")["__result__"]
+            values = values.reindex(np.arange(len(df)))
+            return pd.Series(values.to_numpy(), index=df.index, name=name)
+
+        rows = self.tag()
+        npartitions = rows.npartitions
+        results = self.distribute(rows, evaluate, meta)
+        if npartitions > 1:
+            results = results.set_index(
+                "__partition__", divisions=[*range(npartitions), npartitions - 1]
+            )
+        return self.df.map_partitions(
+            restore, results, align_dataframes=False, meta=(name, dtype)
+        )
+
+
+class ShuffledFrame(DistributedFrame):
+    """A window frame partitioned by `group_keys`.
+
+    The rows are shuffled so that every group ends up in a single partition,
+    then the window function is evaluated partition by partition.
+    """
+
+    def __init__(self, df, make_frame, group_keys):
+        super().__init__(df, make_frame)
+        self.group_keys = group_keys
+
+    def distribute(self, rows, evaluate, meta):
+        group_keys = self.group_keys
+
+        def apply(chunk):
+            # rows with null group keys don't belong to any group, and the
+            # original order of the rows isn't kept by shuffling
+            chunk = chunk.dropna(subset=group_keys)
+            return evaluate(chunk.sort_values(["__partition__", "__position__"]))
+
+        if rows.npartitions > 1:
+            rows = rows.shuffle(on=group_keys)
+        return rows.map_partitions(apply, meta=meta)
+
+
+class OverlappingFrame(DistributedFrame):
+    """An ungrouped ROWS frame from `before` rows before to `after` rows after.
+
+    The rows are sorted by `order_keys` and repartitioned into chunks of at
+    least `max(before, after)` rows, then every chunk is evaluated together
+    with the rows of the neighbouring chunks its windows reach into.
+    """
+
+    def __init__(self, df, make_frame, order_keys, ascending, before, after):
+        super().__init__(df, make_frame)
+        self.order_keys = order_keys
+        self.ascending = ascending
+        self.before = before
+        self.after = after
+
+    def distribute(self, rows, evaluate, meta):
+        if rows.npartitions == 1:
+            return rows.map_partitions(evaluate, meta=meta)
+
+        if self.order_keys:
+            # break ties by the original order of the rows, like a stable sort
+            rows = rows.sort_values(
+                [*self.order_keys, "__partition__", "__position__"],
+                ascending=[*self.ascending, True, True],
+            )
+
+        # number the rows consecutively, only the partition lengths are computed
+        lengths = rows.map_partitions(len).compute().to_numpy()
+        offsets = np.cumsum(lengths) - lengths
+
+        def number(df, partition_info=None):
+            offset = offsets[partition_info["number"]] if partition_info else 0
+            return df.assign(__row__=np.arange(offset, offset + len(df)))
+
+        rows = rows.map_partitions(number)
+
+        # map_overlap requires the neighbouring partitions to be large enough
+        total = int(lengths.sum())
+        size = max(self.before, self.after, -(-total // rows.npartitions), 1)
+        nchunks = max(total // size, 1)
+        divisions = [i * size for i in range(nchunks)] + [max(total - 1, 0)]
+        rows = rows.set_index("__row__", divisions=divisions)
+
+        return rows.map_overlap(evaluate, self.before, self.after, meta=meta)
+
+
 def add_globally_consecutive_column(
     df: dd.DataFrame | dd.Series,
     name: str = "_ibis_index",
@@ -185,3 +329,32 @@ def add_globally_consecutive_column(
     df = df.map_partitions(pd.DataFrame.rename_axis, None, axis="index")
 
     return df
+
+
+def shared_dependencies(graph: Mapping, keys: Sequence) -> set:
+    """Return the tasks of `graph` that more than one of `keys` depends on.
+
+    Only the shared tasks used directly by tasks that aren't shared (or which
+    are one of `keys` themselves) are returned, since they're enough to
+    compute each of `keys` without running the shared part of the graph.
+    """
+    shared = -1
+    owners = {}
+    dependencies = {}
+    for i, key in enumerate(keys):
+        stack = [key]
+        while stack:
+            k = stack.pop()
+            owner = owners.get(k)
+            if owner in (i, shared):
+                continue
+            owners[k] = i if owner is None else shared
+            if k not in dependencies:
+                dependencies[k] = get_dependencies(graph, k)
+            stack.extend(dependencies[k])
+
+    result = {key for key in keys if owners[key] == shared}
+    for k, owner in owners.items():
+        if owner != shared:
+            result.update(dep for dep in dependencies[k] if owners[dep] == shared)
+    return result
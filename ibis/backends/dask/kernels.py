@@ -28,6 +28,10 @@ reductions = {
     ops.First: lambda x: x.loc[0] if isinstance(x, dd.Series) else x.iat[0],
 }
 
+# window frames are materialized, so they are computed using pandas
+windowed = pandas_kernels.windowed.copy()
+grouped = pandas_kernels.grouped.copy()
+
 serieswise = {
     **pandas_kernels.serieswise,
     ops.StringAscii: lambda arg: arg.map(
@@ -5,12 +5,15 @@ import re
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
+from dask.callbacks import Callback
 from dask.dataframe.utils import tm
 from pytest import param
 
 import ibis
 import ibis.expr.operations as ops
+from ibis.backends.pandas.rewrites import PandasReadParquet, plan
 
 
 def make_dask_data_frame(npartitions):
@@ -126,3 +129,73 @@ def test_invalid_connection_parameter_types(npartitions):
     con = ibis.dask.connect()
     with pytest.raises(TypeError, match=expected_msg):
         con.from_dataframe("file.csv")
+
+
+def test_to_pyarrow_batches_per_partition(client, table):
+    reader = client.to_pyarrow_batches(table, chunk_size=1)
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [1, 1, 1]
+    assert pa.Table.from_batches(batches).to_pydict() == {
+        "a": [1, 2, 3],
+        "b": ["a", "b", "c"],
+    }
+
+
+class CountTasks(Callback):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def _pretask(self, key, dsk, state):
+        self.count += 1
+
+
+def test_to_pyarrow_batches_runs_graph_once():
+    df = pd.DataFrame({"a": range(80, 0, -1)})
+    con = ibis.dask.connect({"t": dd.from_pandas(df, npartitions=8)})
+    expr = con.table("t").order_by("a")
+
+    with CountTasks() as executed:
+        con.execute(expr)
+    with CountTasks() as streamed:
+        batches = list(con.to_pyarrow_batches(expr))
+
+    assert streamed.count == executed.count
+    assert pa.Table.from_batches(batches).column("a").to_pylist() == list(range(1, 81))
+
+
+def test_to_pyarrow_batches_computes_partitions_lazily():
+    df = pd.DataFrame({"a": range(80)})
+    con = ibis.dask.connect({"t": dd.from_pandas(df, npartitions=8)})
+    t = con.table("t")
+    expr = t.filter(t.a % 2 == 0).mutate(b=t.a + 1)
+
+    with CountTasks() as executed:
+        con.execute(expr)
+    with CountTasks() as streamed:
+        reader = con.to_pyarrow_batches(expr)
+        first = reader.read_next_batch()
+        assert streamed.count < executed.count
+
+        batches = [first, *reader]
+        assert streamed.count == executed.count
+    result = pa.Table.from_batches(batches)
+    assert result.column("b").to_pylist() == list(range(1, 81, 2))
+
+
+def test_read_parquet_reads_used_columns(tmp_path):
+    df = pd.DataFrame({"a": range(10), "b": list("abcdefghij"), "c": np.arange(10.0)})
+    path = tmp_path / "data.parquet"
+    df.to_parquet(path)
+
+    con = ibis.dask.connect()
+    t = con.read_parquet(path, table_name="t")
+    expr = t.filter(t.a >= 5)[["b"]]
+
+    (read,) = plan(expr.op(), backend=con, params={}).find(PandasReadParquet)
+    assert set(read.schema) == {"a", "b"}
+    assert read.filters == (("a", ">=", 5),)
+
+    result = expr.execute()
+    expected = df.loc[df.a >= 5, ["b"]].reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
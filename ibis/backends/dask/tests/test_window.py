@@ -524,3 +524,97 @@ def events(npartitions) -> dd.DataFrame:
     df.at[5, "measurement"] = 42.0
     df.at[7, "measurement"] = 11.0
     return dd.from_pandas(df, npartitions=npartitions)
+
+
+@pytest.fixture
+def partitioned_df():
+    rng = np.random.default_rng(42)
+    n = 100
+    return pd.DataFrame(
+        {
+            "key": rng.choice(["a", "b", "c", None], n),
+            "order": rng.permutation(n),
+            "value": rng.integers(0, 100, n),
+        }
+    )
+
+
+def distributed_window_expr(t, window):
+    return t.mutate(
+        total=t.value.sum().over(window),
+        first=t.value.first().over(window),
+        lagged=t.value.lag().over(group_by="key", order_by="order"),
+    ).order_by("order")
+
+
+@pytest.mark.parametrize(
+    "window",
+    [
+        pytest.param(
+            ibis.window(group_by="key", order_by="order"), id="grouped_cumulative"
+        ),
+        pytest.param(
+            ibis.rows_window(
+                preceding=3, following=1, group_by="key", order_by="order"
+            ),
+            id="grouped_rows",
+        ),
+        pytest.param(
+            ibis.range_window(
+                preceding=10, following=0, group_by="key", order_by="order"
+            ),
+            id="grouped_range",
+        ),
+        pytest.param(
+            ibis.rows_window(preceding=5, following=2, order_by="order"), id="rows"
+        ),
+        pytest.param(
+            ibis.rows_window(preceding=30, following=0, order_by=ibis.desc("order")),
+            id="rows_larger_than_partitions",
+        ),
+    ],
+)
+@pytest.mark.parametrize("nparts", [1, 4, 7])
+def test_distributed_window(partitioned_df, window, nparts):
+    con = ibis.dask.connect({"t": dd.from_pandas(partitioned_df, npartitions=nparts)})
+    result = distributed_window_expr(con.table("t"), window).execute()
+
+    pandas_con = ibis.pandas.connect({"t": partitioned_df})
+    expected = distributed_window_expr(pandas_con.table("t"), window).execute()
+
+    tm.assert_frame_equal(result.reset_index(drop=True), expected, check_dtype=False)
+
+
+def test_grouped_window_is_not_collected(monkeypatch, partitioned_df):
+    con = ibis.dask.connect({"t": dd.from_pandas(partitioned_df, npartitions=4)})
+    t = con.table("t")
+    expr = t.mutate(total=t.value.sum().over(group_by="key", order_by="order"))
+
+    def compute(self, **kwargs):
+        raise AssertionError("the table was collected")
+
+    with monkeypatch.context() as m:
+        m.setattr(dd.DataFrame, "compute", compute)
+        result = con.compile(expr)
+
+    assert isinstance(result, dd.DataFrame)
+    assert result.npartitions == 4
+
+
+def test_window_on_local_cluster(partitioned_df):
+    distributed = pytest.importorskip("distributed")
+
+    window = ibis.rows_window(preceding=2, following=2, order_by="order")
+    cluster = distributed.LocalCluster(
+        n_workers=2, threads_per_worker=1, dashboard_address=":0"
+    )
+    with cluster:
+        with distributed.Client(cluster):
+            data = dd.from_pandas(partitioned_df, npartitions=4)
+            con = ibis.dask.connect({"t": data})
+            result = distributed_window_expr(con.table("t"), window).execute()
+
+    pandas_con = ibis.pandas.connect({"t": partitioned_df})
+    expected = distributed_window_expr(pandas_con.table("t"), window).execute()
+
+    tm.assert_frame_equal(result.reset_index(drop=True), expected, check_dtype=False)
@@ -36,6 +36,8 @@ if TYPE_CHECKING:
     import torch
     from fsspec import AbstractFileSystem
 
+    import ibis.expr.datatypes as dt
+
 
 def normalize_filenames(source_list):
     # Promote to list
@@ -44,6 +46,28 @@ def normalize_filenames(source_list):
     return list(map(util.normalize_filename, source_list))
 
 
+def _column_to_pandas(col: pa.ChunkedArray, dtype: dt.DataType) -> Any:
+    import pyarrow.types as pat
+
+    if pat.is_nested(col.type) or pat.is_null(col.type) or dtype.is_null():
+        # nested values are returned as python objects and pyarrow / duckdb
+        # type null literal columns as int32, but `to_pylist()` renders them
+        # as None
+        return col.to_pylist()
+    elif pat.is_timestamp(col.type):
+        # convert timestamps natively, only materializing python datetimes
+        # when the values don't fit in pandas' nanosecond resolution
+        try:
+            col = col.cast(pa.timestamp("ns", tz=col.type.tz))
+        except pa.ArrowInvalid:
+            return col.to_pandas(timestamp_as_object=True)
+    return col.to_pandas()
+
+
+# settings that are local to a connection and that worker cursors need to
+# share with the backend's connection
+_LOCAL_SETTINGS = ("TimeZone", "search_path")
+
 _UDF_INPUT_TYPE_MAPPING = {
     InputType.PYARROW: duckdb.functional.ARROW,
     InputType.PYTHON: duckdb.functional.NATIVE,
@@ -76,6 +100,7 @@ class _Settings:
 class Backend(SQLBackend, CanCreateSchema, UrlFromPath):
     name = "duckdb"
     compiler = DuckDBCompiler()
+    supports_bound_parameters = True
 
     def _define_udf_translation_rules(self, expr):
         """No-op: UDF translation rules are defined in the compiler."""
@@ -117,11 +142,13 @@ class Backend(SQLBackend, CanCreateSchema, UrlFromPath):
 
         return sg.select(
             *(
-                self.compiler.f.st_aswkb(
-                    sg.column(col, quoted=self.compiler.quoted)
-                ).as_(col)
-                if col in geocols
-                else col
+                (
+                    self.compiler.f.st_aswkb(
+                        sg.column(col, quoted=self.compiler.quoted)
+                    ).as_(col)
+                    if col in geocols
+                    else col
+                )
                 for col in table_expr.columns
             )
         ).from_(sql.subquery())
@@ -250,6 +277,33 @@ class Backend(SQLBackend, CanCreateSchema, UrlFromPath):
     def _load_into_cache(self, name, expr):
         self.create_table(name, expr, schema=expr.schema(), temp=True)
 
+    def _is_ephemeral(self, op: ops.DatabaseTable) -> bool:
+        # in-memory and temporary databases have no path; the table is looked
+        # up in every database when it isn't qualified
+        namespace = op.namespace
+        query = """
+            SELECT coalesce(bool_or(d.path IS NULL), TRUE)
+            FROM (
+                SELECT database_name, schema_name, table_name AS name
+                FROM duckdb_tables()
+                UNION ALL
+                SELECT database_name, schema_name, view_name
+                FROM duckdb_views()
+                WHERE NOT internal
+            ) AS t
+            JOIN duckdb_databases() AS d USING (database_name)
+            WHERE t.name = $name
+            AND ($database IS NULL OR t.database_name = $database)
+            AND ($schema IS NULL OR t.schema_name = $schema)
+        """
+        params = {
+            "name": op.name,
+            "database": namespace.database,
+            "schema": namespace.schema,
+        }
+        [result] = self.con.execute(query, params).fetchone()
+        return result
+
     def _clean_up_cached_table(self, op):
         self.drop_table(op.name)
 
@@ -1201,8 +1255,8 @@ class Backend(SQLBackend, CanCreateSchema, UrlFromPath):
         """
         self._run_pre_execute_hooks(expr)
         table_expr = expr.as_table()
-        sql = self.compile(table_expr, limit=limit, params=params)
-        return self.con.sql(sql)
+        sql, bound = self._compile_parameterized(table_expr, limit=limit, params=params)
+        return self.con.sql(sql, params=bound.get("parameters"))
 
     def to_pyarrow_batches(
         self,
@@ -1236,12 +1290,12 @@ class Backend(SQLBackend, CanCreateSchema, UrlFromPath):
         """
         self._run_pre_execute_hooks(expr)
         table = expr.as_table()
-        sql = self.compile(table, limit=limit, params=params)
+        sql, bound = self._compile_parameterized(table, limit=limit, params=params)
 
         def batch_producer(cur):
             yield from cur.fetch_record_batch(rows_per_batch=chunk_size)
 
-        result = self.raw_sql(sql)
+        result = self.raw_sql(sql, **bound)
         return pa.RecordBatchReader.from_batches(
             expr.as_table().schema().to_pyarrow(), batch_producer(result)
         )
@@ -1265,30 +1319,103 @@ class Backend(SQLBackend, CanCreateSchema, UrlFromPath):
         **_: Any,
     ) -> Any:
         """Execute an expression."""
+        table = self._to_duckdb_relation(expr, params=params, limit=limit).arrow()
+        return self._pandas_result(expr, table)
+
+    def _pandas_result(self, expr: ir.Expr, table: pa.Table) -> Any:
         import pandas as pd
-        import pyarrow.types as pat
 
-        table = self._to_duckdb_relation(expr, params=params, limit=limit).arrow()
+        schema = expr.as_table().schema()
 
         df = pd.DataFrame(
             {
-                name: (
-                    col.to_pylist()
-                    if (
-                        pat.is_nested(col.type)
-                        or
-                        # pyarrow / duckdb type null literals columns as int32?
-                        # but calling `to_pylist()` will render it as None
-                        col.null_count
-                    )
-                    else col.to_pandas(timestamp_as_object=True)
+                name: _column_to_pandas(col, dtype)
+                for name, col, dtype in zip(
+                    table.column_names, table.columns, schema.types
                 )
-                for name, col in zip(table.column_names, table.columns)
-            }
+            },
+            copy=False,
         )
-        df = DuckDBPandasData.convert_table(df, expr.as_table().schema())
+        df = DuckDBPandasData.convert_table(df, schema)
         return expr.__pandas_result__(df)
 
+    _concurrent_queries = True
+
+    def _worker_connection(self) -> contextlib.AbstractContextManager:
+        con = self.con.cursor()
+        # cursors start with the database's default settings, apply those of
+        # the session that are local to a connection, like the time zone
+        for name in _LOCAL_SETTINGS:
+            [value] = self.con.execute("SELECT current_setting(?)", [name]).fetchone()
+            con.execute(f"SET {name} = {sge.convert(value).sql(self.dialect)}")
+        return contextlib.closing(con)
+
+    def _interrupt(self, con: duckdb.DuckDBPyConnection | None = None) -> None:
+        (self.con if con is None else con).interrupt()
+
+    def _prepare_batch(self, method: str, exprs: list[ir.Expr], **kwargs: Any):
+        # look up the temporary tables once for the whole batch
+        if any(expr.op().find(ops.DatabaseTable) for expr in exprs):
+            kwargs["temporary"] = self._temporary_tables()
+        return super()._prepare_batch(method, exprs, **kwargs)
+
+    def _temporary_tables(self) -> frozenset[str]:
+        return frozenset(
+            name
+            for (name,) in self.con.sql(
+                "SELECT table_name FROM duckdb_tables() WHERE temporary "
+                "UNION ALL "
+                "SELECT view_name FROM duckdb_views() "
+                "WHERE temporary AND NOT internal"
+            ).fetchall()
+        )
+
+    def _prepare_many(
+        self,
+        method: str,
+        expr: ir.Expr,
+        *,
+        params: Mapping | None = None,
+        limit: int | str | None = None,
+        temporary: frozenset[str] | None = None,
+        **_: Any,
+    ):
+        self._run_pre_execute_hooks(expr)
+        sql, bound = self._compile_parameterized(
+            expr.as_table(), limit=limit, params=params
+        )
+        parameters = bound.get("parameters")
+
+        op = expr.op()
+        # registering in-memory tables is zero-copy, so they're registered
+        # again on every worker cursor that runs the query
+        memtables = {node.name: node for node in op.find(ops.InMemoryTable)}
+        # whereas temporary tables and views, like those created by the
+        # `read_*` methods, are only visible to the backend's own connection
+        if tables := op.find(ops.DatabaseTable):
+            if temporary is None:
+                temporary = self._temporary_tables()
+            temporary = temporary.difference(memtables)
+            shareable = not any(
+                table.name in temporary and table.namespace.database in (None, "temp")
+                for table in tables
+            )
+        else:
+            shareable = True
+
+        def run(con):
+            if con is None:
+                con = self.con
+            else:
+                for name, node in memtables.items():
+                    con.register(name, node.data.to_pyarrow(node.schema))
+            table = con.sql(sql, params=parameters).arrow()
+            if method == "execute":
+                return self._pandas_result(expr, table)
+            return expr.__pyarrow_result__(table)
+
+        return run, shareable
+
     @util.experimental
     def to_torch(
         self,
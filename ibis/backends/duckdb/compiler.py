@@ -279,6 +279,9 @@ class DuckDBCompiler(SQLGlotCompiler):
 
         return self.cast(arg, to)
 
+    def visit_ScalarParameter(self, op, *, dtype, **_):
+        return self.cast(sge.Parameter(this=sge.convert(op.counter)), dtype)
+
     def visit_NonNullLiteral(self, op, *, value, dtype):
         if dtype.is_interval():
             if dtype.unit.short == "ns":
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import subprocess
 import sys
 
 import duckdb
 import pandas as pd
+import pandas.testing as tm
 import pyarrow as pa
 import pytest
 from pytest import param
@@ -276,3 +278,211 @@ def test_invalid_connect(tmp_path):
     url = f"duckdb://{tmp_path}?read_only=invalid_value"
     with pytest.raises(ValueError):
         ibis.connect(url)
+
+
+def test_compile_cache():
+    con = ibis.duckdb.connect()
+    t = ibis.memtable({"a": [1, 2, 3], "b": list("abc")})
+    x = ibis.param("int64")
+
+    expr = t.filter(t.a > x).b
+    con.clear_compile_cache()
+
+    assert con.execute(expr, params={x: 1}).tolist() == ["b", "c"]
+    assert con.compile_cache_info().misses == 1
+
+    # an equal expression built from scratch hits the cache
+    expr = t.filter(t.a > x).b
+    assert con.execute(expr, params={x: 1}).tolist() == ["b", "c"]
+    assert con.compile_cache_info().hits == 1
+
+    # a different parameter value is a different query
+    assert con.execute(expr, params={x: 2}).tolist() == ["c"]
+    assert con.compile_cache_info()[:2] == (1, 2)
+    assert con.compile_cache_info().currsize == 2
+
+    con.clear_compile_cache()
+    assert con.compile_cache_info() == (0, 0, 128, 0)
+
+
+def test_bind_params(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "bind_params", True)
+
+    con = ibis.duckdb.connect()
+    t = ibis.memtable({"a": [1, 2, 3], "b": list("abc")})
+    x = ibis.param("int64")
+    y = ibis.param("string")
+
+    expr = t.filter((t.a > x) | (t.b == y)).order_by("a").a
+    sql, bound = con._compile_parameterized(expr, params={x: 2, y: "a"})
+    assert "$1" in sql and "$2" in sql
+    assert bound == {"parameters": [2, "a"]}
+
+    con.clear_compile_cache()
+    assert con.execute(expr, params={x: 2, y: "a"}).tolist() == [1, 3]
+    assert con.execute(expr, params={x: 0, y: "z"}).tolist() == [1, 2, 3]
+    assert con.to_pyarrow(expr, params={x: 5, y: "b"}).to_pylist() == [2]
+
+    # the query is compiled once and only the values change between calls
+    assert con.compile_cache_info()[:2] == (2, 1)
+
+    # parameters without a value are still an error
+    with pytest.raises(KeyError):
+        con.execute(expr, params={x: 2})
+    monkeypatch.setattr(ibis.options.sql, "bind_params", False)
+    with pytest.raises(KeyError):
+        con.execute(expr)
+
+
+def test_execute_many(tmp_path, mocker):
+    con = ibis.duckdb.connect()
+    t = con.create_table("t", pa.table({"a": [1, 2, 3], "b": list("xyy")}))
+    tmp = con.create_table("tmp", schema=ibis.schema({"a": "int64"}), temp=True)
+    m = ibis.memtable({"a": [4, 5]})
+    path = tmp_path / "f.csv"
+    path.write_text("a\n6\n")
+    csv = con.read_csv(path)
+
+    spy = mocker.spy(con, "_worker_connection")
+    catalog = mocker.spy(con, "_temporary_tables")
+    exprs = [
+        t.a.sum(),
+        t.group_by("b").agg(n=t.a.sum()).order_by("b"),
+        m.a.sum(),
+        t.a.sum(),
+        tmp.count(),
+        csv.a.sum(),
+    ]
+    results = con.execute_many(exprs, max_workers=2)
+
+    assert results[0] == results[3] == 6
+    tm.assert_frame_equal(results[1], pd.DataFrame({"b": ["x", "y"], "n": [1, 5]}))
+    assert results[2] == 9
+    assert results[4] == 0
+    assert results[5] == 6
+    assert all(elapsed > 0 for elapsed in results.elapsed)
+    # the temporary table and the csv view are only visible to `con`, the
+    # other queries run on worker cursors
+    assert spy.call_count == 2
+    # the temporary tables are looked up once per batch
+    assert catalog.call_count == 1
+
+    results = con.to_pyarrow_many(exprs, max_workers=1)
+    assert [r.as_py() for r in results[::2]] == [6, 9, 0]
+    assert spy.call_count == 2
+
+    with pytest.raises(ValueError, match="max_workers"):
+        con.execute_many(exprs, max_workers=0)
+
+
+def test_execute_many_session_settings():
+    con = ibis.duckdb.connect()
+    con.settings["TimeZone"] = "America/New_York"
+    exprs = [
+        con.sql(f"SELECT current_setting('TimeZone') AS tz, {i} AS i") for i in range(2)
+    ]
+
+    results = con.execute_many(exprs, max_workers=2)
+
+    assert [df.tz.iat[0] for df in results] == ["America/New_York"] * 2
+
+
+def test_execute_async():
+    con = ibis.duckdb.connect()
+    t = con.create_table("t", pa.table({"a": [1, 2, 3]}))
+    slow = con.sql(
+        "SELECT count(*) AS n FROM range(100000) a(x), range(100000) b(y) "
+        "WHERE (x * y) % 7 = 3"
+    )
+
+    async def run():
+        results = await asyncio.gather(
+            t.a.sum().execute_async(),
+            con.to_pyarrow_async(t),
+            con.execute_async(ibis.memtable({"b": [1, 2]})),
+        )
+
+        query = asyncio.ensure_future(con.execute_async(slow))
+        await asyncio.sleep(0.1)
+        query.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await query
+        return results
+
+    total, table, df = asyncio.run(run())
+    assert total == 6
+    assert table.num_rows == 3
+    assert df.b.tolist() == [1, 2]
+    # the query was interrupted and the connection is still usable
+    assert con.execute(t.count()) == 3
+
+
+def test_execute_nulls_and_timestamps():
+    con = ibis.duckdb.connect()
+    t = ibis.memtable(
+        {
+            "a": [1, None, 3],
+            "ts": pd.to_datetime(["2020-01-01", None, "2021-01-01"]),
+            "arr": [[1], None, [2, 3]],
+        }
+    )
+    expr = t.mutate(
+        n=ibis.null(),
+        big=ibis.timestamp("9999-01-01 00:00:00"),
+        tz=t.ts.cast("timestamp('UTC')"),
+    )
+    result = con.execute(expr)
+
+    assert result.a.dtype == "float64"
+    assert result.a.isna().tolist() == [False, True, False]
+    assert result.ts.dtype == "datetime64[ns]"
+    assert result.tz.dtype == pd.DatetimeTZDtype("ns", "UTC")
+    assert result.arr.tolist() == [[1], None, [2, 3]]
+    assert result.n.tolist() == [None, None, None]
+    # values out of range for pandas' nanosecond timestamps are kept as objects
+    assert result.big.dtype == object
+    assert result.big.iat[0].year == 9999
+
+
+def test_persistent_cache(tmp_path, monkeypatch, mocker):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(ibis.options.cache, "directory", str(cache_dir))
+    path = str(tmp_path / "test.ddb")
+
+    def expensive(t):
+        return t.group_by("b").agg(n=t.a.sum()).order_by("b")
+
+    con = ibis.duckdb.connect(path)
+    t = con.create_table("t", pd.DataFrame({"a": [1, 2, 3], "b": list("xyy")}))
+    with expensive(t).cache() as cached:
+        expected = cached.execute()
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+    con.disconnect()
+
+    # a new connection to the same database reads the persisted result
+    # instead of recomputing it
+    con = ibis.duckdb.connect(path)
+    spy = mocker.spy(con, "to_pyarrow")
+    with expensive(con.table("t")).cache() as cached:
+        result = cached.execute()
+    spy.assert_not_called()
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("temp", [False, True], ids=["in_memory", "temp"])
+def test_persistent_cache_ephemeral_tables(tmp_path, monkeypatch, temp):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(ibis.options.cache, "directory", str(cache_dir))
+
+    def connect():
+        return ibis.duckdb.connect(str(tmp_path / "test.ddb") if temp else ":memory:")
+
+    # equivalent tables of different connections holding different data
+    a, b = connect(), connect()
+    assert a.db_identity == b.db_identity
+    a.create_table("t", {"x": [1, 2, 3]}, temp=temp)
+    b.create_table("t", {"x": [100]}, temp=temp)
+
+    assert a.table("t").cache().x.sum().execute() == 6
+    assert b.table("t").cache().x.sum().execute() == 100
+    assert not cache_dir.exists()
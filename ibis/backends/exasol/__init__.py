@@ -201,7 +201,7 @@ class Backend(SQLBackend):
             finally:
                 self.con.execute(drop_view)
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         schema = op.schema
         if null_columns := [col for col, dtype in schema.items() if dtype.is_null()]:
             raise com.IbisTypeError(
@@ -253,6 +253,8 @@ class Backend(SQLBackend):
                     self.con.ext.insert_multi(name, rows)
 
             atexit.register(self._clean_up_tmp_table, ident)
+            return True
+        return False
 
     def _clean_up_tmp_table(self, ident: sge.Identifier) -> None:
         with self._safe_raw_sql(
@@ -260,6 +262,9 @@ class Backend(SQLBackend):
         ):
             pass
 
+    def _clean_up_in_memory_table(self, name: str) -> None:
+        self._clean_up_tmp_table(sg.to_identifier(name, quoted=self.compiler.quoted))
+
     def create_table(
         self,
         name: str,
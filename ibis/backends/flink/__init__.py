@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 import sqlglot as sg
 import sqlglot.expressions as sge
 
+import ibis
 import ibis.common.exceptions as exc
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
@@ -22,7 +23,6 @@ from ibis.backends.flink.ddl import (
     RenameTable,
 )
 from ibis.backends.sql import SQLBackend
-from ibis.backends.tests.errors import Py4JJavaError
 from ibis.expr.operations.udf import InputType
 from ibis.util import gen_name
 
@@ -939,49 +939,20 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
         limit: int | str | None = None,
         **kwargs: Any,
     ):
-        import pyarrow as pa
-        import pyarrow_hotfix  # noqa: F401
-
         ibis_table = expr.as_table()
 
-        if params is None and limit is None:
-            # Note (mehmet): `_from_pyflink_table_to_pyarrow_batches()` does not
-            # support args `params` and `limit`.
-            pyflink_table = self._from_ibis_table_to_pyflink_table(ibis_table)
-            if pyflink_table:
-                # Note (mehmet): `_from_pyflink_table_to_pyarrow_batches()` supports
-                # only expressions that are registered as tables in Flink.
-                return self._from_pyflink_table_to_pyarrow_batches(
-                    table=pyflink_table,
-                    chunk_size=chunk_size,
-                )
-
-        # Note (mehmet): In the following, the entire result is fetched
-        # into a dataframe before converting it to arrow batches.
-        df = self.execute(ibis_table, limit=limit, **kwargs)
-        # TODO (mehmet): `limit` is discarded in `execute()`. Is this intentional?
-        df = df.head(limit)
-
-        ibis_schema = ibis_table.schema()
-        arrow_schema = ibis_schema.to_pyarrow()
-        arrow_table = pa.Table.from_pandas(df, schema=arrow_schema)
-        return arrow_table.to_reader()
-
-    def _from_ibis_table_to_pyflink_table(self, table: ir.Table) -> Table | None:
-        try:
-            table_name = table.get_name()
-        except AttributeError:
-            # `table` is not a registered table in Flink.
-            return None
-
-        qualified_name = sg.table(table_name, quoted=self.compiler.quoted).sql(
-            self.name
+        # `compile()` discards `limit`, so push it into the query here rather
+        # than truncating the fetched result
+        if limit == "default":
+            limit = ibis.options.sql.default_limit
+        if limit is not None:
+            ibis_table = ibis_table.limit(limit)
+
+        self._register_udfs(ibis_table)
+        sql = self.compile(ibis_table, params=params, **kwargs)
+        return self._from_pyflink_table_to_pyarrow_batches(
+            table=self._table_env.sql_query(sql), chunk_size=chunk_size
         )
-        try:
-            return self._table_env.from_path(qualified_name)
-        except Py4JJavaError:
-            # `table` is not a registered table in Flink.
-            return None
 
     def _from_pyflink_table_to_pyarrow_batches(
         self,
@@ -1180,7 +1180,7 @@ class Backend(SQLBackend):
 
         return "\n".join(["Query:", util.indent(query, 2), "", *results.iloc[:, 0]])
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         schema = op.schema
         if null_columns := [col for col, dtype in schema.items() if dtype.is_null()]:
             raise com.IbisTypeError(
@@ -1219,6 +1219,8 @@ class Backend(SQLBackend):
             with self._safe_raw_sql(create_stmt) as cur:
                 for row in data:
                     cur.execute(insert_stmt, row)
+            return True
+        return False
 
 
 def fetchall(cur):
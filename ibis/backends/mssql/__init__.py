@@ -7,7 +7,6 @@ import datetime
 import struct
 from contextlib import closing
 from functools import partial
-from itertools import repeat
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
@@ -59,6 +58,11 @@ class Backend(SQLBackend, CanCreateDatabase, CanCreateSchema, NoUrl):
     name = "mssql"
     compiler = MSSQLCompiler()
     supports_create_or_replace = False
+    _bulk_insert = True
+    # SQL Server binds at most 2100 parameters per statement and allows at
+    # most 1000 rows in a VALUES clause
+    _max_insert_params = 2000
+    _max_insert_rows = 1000
 
     @property
     def version(self) -> str:
@@ -74,6 +78,7 @@ class Backend(SQLBackend, CanCreateDatabase, CanCreateSchema, NoUrl):
         port: int = 1433,
         database: str | None = None,
         driver: str | None = None,
+        pool_size: int | None = None,
         **kwargs: Any,
     ) -> None:
         """Connect to MSSQL database.
@@ -103,6 +108,9 @@ class Backend(SQLBackend, CanCreateDatabase, CanCreateSchema, NoUrl):
             - ODBC Driver 18 for SQL Server
 
             See https://learn.microsoft.com/en-us/sql/connect/odbc/windows/system-requirements-installation-and-driver-files
+        pool_size
+            If given, run queries on a pool of at most this many connections,
+            so that multiple threads can use the backend at the same time.
         kwargs
             Additional keyword arguments to pass to PyODBC.
         """
@@ -113,7 +121,8 @@ class Backend(SQLBackend, CanCreateDatabase, CanCreateSchema, NoUrl):
         if user is None and password is None:
             kwargs.setdefault("Trusted_Connection", "yes")
 
-        con = pyodbc.connect(
+        connect = partial(
+            pyodbc.connect,
             user=user,
             server=host,
             port=port,
@@ -122,14 +131,15 @@ class Backend(SQLBackend, CanCreateDatabase, CanCreateSchema, NoUrl):
             driver=driver,
             **kwargs,
         )
+        self._init_connections(connect, pool_size)
 
+    def _setup_connection(self, con: pyodbc.Connection) -> pyodbc.Connection:
         # -155 is the code for datetimeoffset
         con.add_output_converter(-155, datetimeoffset_to_datetime)
 
         with closing(con.cursor()) as cur:
             cur.execute("SET DATEFIRST 1")
-
-        self.con = con
+        return con
 
     def get_schema(
         self, name: str, schema: str | None = None, database: str | None = None
@@ -247,17 +257,17 @@ class Backend(SQLBackend, CanCreateDatabase, CanCreateSchema, NoUrl):
 
     @contextlib.contextmanager
     def begin(self):
-        con = self.con
-        cur = con.cursor()
-        try:
-            yield cur
-        except Exception:
-            con.rollback()
-            raise
-        else:
-            con.commit()
-        finally:
-            cur.close()
+        with self._checkout() as con:
+            cur = con.cursor()
+            try:
+                yield cur
+            except Exception:
+                con.rollback()
+                raise
+            else:
+                con.commit()
+            finally:
+                cur.close()
 
     @contextlib.contextmanager
     def _safe_raw_sql(self, query, *args, **kwargs):
@@ -428,6 +438,10 @@ GO"""
 
         if temp:
             properties.append(sge.TemporaryProperty())
+            # the table only exists in the session of the connection that
+            # creates it, so with a pool it's created and read on the
+            # backend's own connection
+            self._temp_tables.add(name)
 
         if obj is not None:
             if not isinstance(obj, ir.Expr):
@@ -492,7 +506,7 @@ GO"""
             name, schema=schema, source=self, namespace=ops.Namespace(database=database)
         ).to_expr()
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         schema = op.schema
         if null_columns := [col for col, dtype in schema.items() if dtype.is_null()]:
             raise com.IbisTypeError(
@@ -528,21 +542,11 @@ GO"""
                 # properties=sg.exp.Properties(expressions=[sge.TemporaryProperty()]),
             )
 
-            df = op.data.to_frame()
-            data = df.itertuples(index=False)
-            cols = ", ".join(
-                ident.sql(self.dialect)
-                for ident in map(
-                    partial(sg.to_identifier, quoted=quoted), schema.keys()
-                )
-            )
-            specs = ", ".join(repeat("?", len(schema)))
             table = sg.table(name, quoted=quoted)
-            sql = f"INSERT INTO {table.sql(self.dialect)} ({cols}) VALUES ({specs})"
-
             with self._safe_raw_sql(create_stmt) as cur:
-                if not df.empty:
-                    cur.executemany(sql, data)
+                self._insert_arrow(cur, table, op.data.to_pyarrow(schema))
+            return True
+        return False
 
     def _to_sqlglot(
         self, expr: ir.Expr, *, limit: str | None = None, params=None, **_: Any
@@ -27,7 +27,7 @@ from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compiler import TRUE, C
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping
 
     import pandas as pd
     import pyarrow as pa
@@ -37,6 +37,8 @@ class Backend(SQLBackend, CanCreateDatabase):
     name = "mysql"
     compiler = MySQLCompiler()
     supports_create_or_replace = False
+    _bulk_insert = True
+    _insert_placeholder = "%s"
 
     def _from_url(self, url: str, **kwargs):
         """Connect to a backend using a URL `url`.
@@ -103,6 +105,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         port: int = 3306,
         database: str | None = None,
         autocommit: bool = True,
+        pool_size: int | None = None,
         **kwargs,
     ) -> None:
         """Create an Ibis client using the passed connection parameters.
@@ -121,6 +124,9 @@ class Backend(SQLBackend, CanCreateDatabase):
             Database to connect to
         autocommit
             Autocommit mode
+        pool_size
+            If given, run queries on a pool of at most this many connections,
+            so that multiple threads can use the backend at the same time.
         kwargs
             Additional keyword arguments passed to `pymysql.connect`
 
@@ -155,7 +161,8 @@ class Backend(SQLBackend, CanCreateDatabase):
             month : int32
 
         """
-        con = pymysql.connect(
+        connect = partial(
+            pymysql.connect,
             user=user,
             host=host,
             port=port,
@@ -165,14 +172,18 @@ class Backend(SQLBackend, CanCreateDatabase):
             conv=pymysql.converters.conversions,
             **kwargs,
         )
+        self._init_connections(connect, pool_size)
 
+    def _setup_connection(self, con: pymysql.Connection) -> pymysql.Connection:
         with contextlib.closing(con.cursor()) as cur:
             try:
                 cur.execute("SET @@session.time_zone = 'UTC'")
             except Exception as e:  # noqa: BLE001
                 warnings.warn(f"Unable to set session timezone to UTC: {e}")
+        return con
 
-        self.con = con
+    def _ping(self, con: pymysql.Connection) -> None:
+        con.ping(reconnect=False)
 
     @property
     def current_database(self) -> str:
@@ -229,24 +240,25 @@ class Backend(SQLBackend, CanCreateDatabase):
 
     @contextlib.contextmanager
     def begin(self):
-        con = self.con
-        cur = con.cursor()
-        try:
-            yield cur
-        except Exception:
-            con.rollback()
-            raise
-        else:
-            con.commit()
-        finally:
-            cur.close()
+        with self._checkout() as con:
+            cur = con.cursor()
+            try:
+                yield cur
+            except Exception:
+                con.rollback()
+                raise
+            else:
+                con.commit()
+            finally:
+                cur.close()
 
     # TODO(kszucs): should make it an abstract method or remove the use of it
     # from .execute()
     @contextlib.contextmanager
     def _safe_raw_sql(self, *args, **kwargs):
-        with contextlib.closing(self.raw_sql(*args, **kwargs)) as result:
-            yield result
+        with self._checkout():
+            with contextlib.closing(self.raw_sql(*args, **kwargs)) as result:
+                yield result
 
     def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
         with contextlib.suppress(AttributeError):
@@ -336,6 +348,10 @@ class Backend(SQLBackend, CanCreateDatabase):
 
         if temp:
             properties.append(sge.TemporaryProperty())
+            # the table only exists in the session of the connection that
+            # creates it, so with a pool it's created and read on the
+            # backend's own connection
+            self._temp_tables.add(name)
 
         if obj is not None:
             if not isinstance(obj, ir.Expr):
@@ -398,7 +414,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             name, schema=schema, source=self, namespace=ops.Namespace(database=database)
         ).to_expr()
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         schema = op.schema
         if null_columns := [col for col, dtype in schema.items() if dtype.is_null()]:
             raise com.IbisTypeError(
@@ -435,21 +451,50 @@ class Backend(SQLBackend, CanCreateDatabase):
             )
             create_stmt_sql = create_stmt.sql(self.name)
 
-            columns = schema.keys()
-            df = op.data.to_frame()
-            data = df.itertuples(index=False)
-            cols = ", ".join(
-                ident.sql(self.name)
-                for ident in map(partial(sg.to_identifier, quoted=quoted), columns)
-            )
-            specs = ", ".join(repeat("%s", len(columns)))
             table = sg.table(name, quoted=quoted)
-            sql = f"INSERT INTO {table.sql(self.name)} ({cols}) VALUES ({specs})"
             with self.begin() as cur:
                 cur.execute(create_stmt_sql)
+                self._insert_arrow(cur, table, op.data.to_pyarrow(schema))
+            return True
+        return False
 
-                if not df.empty:
-                    cur.executemany(sql, data)
+    def _insert_arrow(
+        self,
+        cursor,
+        table: sge.Table,
+        data: pa.Table,
+        columns: Iterable[str] | None = None,
+    ) -> None:
+        """Bulk load `data` into the existing `table` using `cursor`.
+
+        pymysql interpolates parameters client side, so the rows are rendered
+        as literals directly and as many as fit in the server's
+        `max_allowed_packet` are sent in each `INSERT ... VALUES` statement.
+        """
+        if not data.num_columns or not data.num_rows:
+            return
+
+        cursor.execute("SELECT @@max_allowed_packet")
+        [(max_packet,)] = cursor.fetchall()
+        # the packet holds the statement after a one byte command
+        max_size = max_packet - 1
+
+        encoding = cursor.connection.encoding
+        template = f"({', '.join(repeat(self._insert_placeholder, data.num_columns))})"
+        prefix = f"INSERT INTO {self._insert_target(table, data, columns)} VALUES "
+        empty = len(prefix.encode(encoding))
+        rows, size = [], empty
+        for batch in data.to_batches():
+            for values in zip(*(column.to_pylist() for column in batch.columns)):
+                row = cursor.mogrify(template, values)
+                # including the separator
+                row_size = len(row.encode(encoding)) + 2
+                if rows and size + row_size > max_size:
+                    cursor.execute(prefix + ", ".join(rows))
+                    rows, size = [], empty
+                rows.append(row)
+                size += row_size
+        cursor.execute(prefix + ", ".join(rows))
 
     @util.experimental
     def to_pyarrow_batches(
@@ -5,6 +5,8 @@ from operator import methodcaller
 
 import pandas as pd
 import pandas.testing as tm
+import pyarrow as pa
+import pymysql
 import pytest
 import sqlglot as sg
 from pytest import param
@@ -12,6 +14,7 @@ from pytest import param
 import ibis
 import ibis.expr.datatypes as dt
 from ibis import udf
+from ibis.backends.mysql import Backend
 from ibis.util import gen_name
 
 MYSQL_TYPES = [
@@ -185,3 +188,40 @@ def test_builtin_agg_udf(con):
     result = expr.execute()
     expected = '["0","1","2","3","4"]'
     assert result == expected
+
+
+class FakeCursor(pymysql.cursors.Cursor):
+    # renders literals like a real cursor without connecting to a server
+    def __init__(self, max_allowed_packet):
+        con = pymysql.Connection(defer_connect=True)
+        con.server_status = 0
+        super().__init__(con)
+        self.max_allowed_packet = max_allowed_packet
+        self.statements = []
+
+    def execute(self, sql):
+        self.statements.append(sql)
+
+    def fetchall(self):
+        return [(self.max_allowed_packet,)]
+
+
+def test_insert_statements_fit_max_allowed_packet():
+    data = pa.table({"a": range(50), "b": [f"it's ü{i}" for i in range(50)]})
+    con = Backend()
+
+    small = FakeCursor(max_allowed_packet=200)
+    con._insert_arrow(small, sg.table("t"), data)
+    _, *inserts = small.statements
+    assert len(inserts) > 1
+    assert all(len(sql.encode()) < 200 for sql in inserts)
+
+    large = FakeCursor(max_allowed_packet=2**30)
+    con._insert_arrow(large, sg.table("t"), data)
+    _, insert = large.statements
+
+    # the same rows are inserted whatever the number of statements
+    prefix, rows = insert.split(" VALUES ")
+    chunks = [sql.split(" VALUES ") for sql in inserts]
+    assert {head for head, _ in chunks} == {prefix}
+    assert ", ".join(chunk for _, chunk in chunks) == rows
@@ -26,8 +26,10 @@ from ibis.backends.sql import STAR, SQLBackend
 from ibis.backends.sql.compiler import TRUE, C
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     import pandas as pd
-    import pyrrow as pa
+    import pyarrow as pa
 
 
 def metadata_row_to_type(
@@ -74,6 +76,9 @@ def metadata_row_to_type(
 class Backend(SQLBackend):
     name = "oracle"
     compiler = OracleCompiler()
+    _bulk_insert = True
+    # number of rows sent to the server per `executemany` call
+    _max_insert_rows = 2**14
 
     @cached_property
     def version(self):
@@ -421,7 +426,7 @@ class Backend(SQLBackend):
 
         super().drop_table(name, database=database, schema=schema, force=force)
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         schema = op.schema
 
         # only register if we haven't already done so
@@ -452,16 +457,36 @@ class Backend(SQLBackend):
                 properties=sge.Properties(expressions=[sge.TemporaryProperty()]),
             ).sql(self.name, pretty=True)
 
-            data = op.data.to_frame().itertuples(index=False)
-            specs = ", ".join(f":{i}" for i, _ in enumerate(schema))
-            table = sg.table(name, quoted=quoted).sql(self.name)
-            insert_stmt = f"INSERT INTO {table} VALUES ({specs})"
+            table = sg.table(name, quoted=quoted)
             with self.begin() as cur:
                 cur.execute(create_stmt)
-                for row in data:
-                    cur.execute(insert_stmt, row)
+                self._insert_arrow(cur, table, op.data.to_pyarrow(schema))
+
+            atexit.register(self._clean_up_tmp_table, name)
+            return True
+        return False
+
+    def _insert_arrow(
+        self,
+        cursor,
+        table: sge.Table,
+        data: pa.Table,
+        columns: Iterable[str] | None = None,
+    ) -> None:
+        """Bulk load `data` into `table` with array DML.
+
+        Oracle doesn't support multi-row `VALUES`, instead each chunk of rows
+        is sent to the server in a single round trip with `executemany`.
+        """
+        if not (ncols := data.num_columns) or not data.num_rows:
+            return
 
-        atexit.register(self._clean_up_tmp_table, name)
+        target = self._insert_target(table, data, columns)
+        specs = ", ".join(f":{i}" for i in range(ncols))
+        sql = f"INSERT INTO {target} VALUES ({specs})"
+        for batch in data.to_batches(max_chunksize=self._max_insert_rows):
+            rows = list(zip(*(column.to_pylist() for column in batch.columns)))
+            cursor.executemany(sql, rows)
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         name = util.gen_name("oracle_metadata")
@@ -567,3 +592,6 @@ class Backend(SQLBackend):
 
     def _clean_up_cached_table(self, op):
         self._clean_up_tmp_table(op.name)
+
+    def _clean_up_in_memory_table(self, name: str) -> None:
+        self._clean_up_tmp_table(name)
@@ -19,7 +19,7 @@ from ibis.formats.pyarrow import PyArrowData
 
 if TYPE_CHECKING:
     import pathlib
-    from collections.abc import Mapping, MutableMapping
+    from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 
 
 class BasePandasBackend(BaseBackend, NoUrl):
@@ -52,6 +52,9 @@ class BasePandasBackend(BaseBackend, NoUrl):
         """
         self.dictionary = dictionary or {}
         self.schemas: MutableMapping[str, sch.Schema] = {}
+        # tables registered from parquet files, which are read lazily, mapped
+        # to the registered dataframe and the arguments they were read with
+        self._parquet_sources: dict[str, tuple[Any, Any, dict[str, Any]]] = {}
 
     def disconnect(self) -> None:
         pass
@@ -272,9 +275,17 @@ class BasePandasBackend(BaseBackend, NoUrl):
         **kwargs: Any,
     ) -> pa.Table:
         table_expr = expr.as_table()
-        output = pa.Table.from_pandas(
-            self.execute(table_expr, params=params, limit=limit, **kwargs)
-        )
+        df = self.execute(table_expr, params=params, limit=limit, **kwargs)
+        table = self._frame_to_pyarrow(df, table_expr.schema())
+        return expr.__pyarrow_result__(table)
+
+    def _is_ephemeral(self, op: ops.DatabaseTable) -> bool:
+        # the tables are dataframes of the process
+        return True
+
+    @staticmethod
+    def _frame_to_pyarrow(df: pd.DataFrame, schema: sch.Schema) -> pa.Table:
+        output = pa.Table.from_pandas(df)
 
         # cudf.pandas adds a column with the name `__index_level_0__` (and maybe
         # other index level columns) but these aren't part of the known schema
@@ -282,8 +293,17 @@ class BasePandasBackend(BaseBackend, NoUrl):
         output = output.drop(
             filter(lambda col: col.startswith("__index_level_"), output.column_names)
         )
-        table = PyArrowData.convert_table(output, table_expr.schema())
-        return expr.__pyarrow_result__(table)
+        return PyArrowData.convert_table(output, schema)
+
+    def _frame_batches(
+        self, frames: Iterable[pd.DataFrame], schema: sch.Schema, chunk_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        for df in frames:
+            # convert at most `chunk_size` rows at a time so that only one
+            # chunk of the result is held in arrow format at any point
+            for start in range(0, len(df), chunk_size):
+                chunk = df.iloc[start : start + chunk_size]
+                yield from self._frame_to_pyarrow(chunk, schema).to_batches()
 
     def to_pyarrow_batches(
         self,
@@ -295,18 +315,64 @@ class BasePandasBackend(BaseBackend, NoUrl):
         **kwargs: Any,
     ) -> pa.ipc.RecordBatchReader:
         pa = self._import_pyarrow()
-        pa_table = self.to_pyarrow(
-            expr.as_table(), params=params, limit=limit, **kwargs
-        )
+        table_expr = expr.as_table()
+        schema = table_expr.schema()
+        df = self.execute(table_expr, params=params, limit=limit, **kwargs)
         return pa.RecordBatchReader.from_batches(
-            pa_table.schema, pa_table.to_batches(max_chunksize=chunk_size)
+            schema.to_pyarrow(), self._frame_batches([df], schema, chunk_size)
         )
 
 
 class Backend(BasePandasBackend):
     name = "pandas"
 
+    class Options(BasePandasBackend.Options):
+        """Pandas options.
+
+        Attributes
+        ----------
+        low_memory : bool
+            Compute expressions with pandas' copy-on-write mode, releasing
+            intermediate results eagerly and reusing them in place when
+            nothing else needs them.
+
+        """
+
+        low_memory: bool = False
+
     def execute(self, query, params=None, limit="default", **kwargs):
+        return self._execute(query, params=params, limit=limit)
+
+    def memory_report(
+        self, expr: ir.Expr, params: Mapping[ir.Scalar, Any] | None = None
+    ) -> pd.DataFrame:
+        """Execute an expression, reporting the memory used to compute it.
+
+        The memory allocated by python and numpy is traced while computing each
+        node of the expression's plan, in the order they're computed. The
+        expression is computed in low memory mode if the `low_memory` option
+        is set.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to execute.
+        params
+            Mapping of scalar parameter expressions to value.
+
+        Returns
+        -------
+        DataFrame
+            A row for each node, with its `node` type, the size of its
+            `result` in bytes, the `current` traced memory in bytes after
+            computing it, and the `peak` traced memory while computing it.
+
+        """
+        report = []
+        self._execute(expr, params=params, report=report)
+        return pd.DataFrame(report, columns=["node", "result", "current", "peak"])
+
+    def _execute(self, query, params=None, limit="default", report=None):
         from ibis.backends.pandas.executor import PandasExecutor
 
         if limit != "default" and limit is not None:
@@ -323,7 +389,15 @@ class Backend(BasePandasBackend):
         params = params or {}
         params = {k.op() if isinstance(k, ir.Expr) else k: v for k, v in params.items()}
 
-        return PandasExecutor.execute(query.op(), backend=self, params=params)
+        return PandasExecutor.execute(
+            query.op(),
+            backend=self,
+            params=params,
+            # the options are only registered when the backend is looked up
+            # through the ibis namespace
+            low_memory=getattr(ibis.config.options.pandas, "low_memory", False),
+            report=report,
+        )
 
     def _load_into_cache(self, name, expr):
         self.create_table(name, expr.execute())
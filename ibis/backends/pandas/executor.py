@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import contextlib
 import operator
-from functools import reduce
+import tracemalloc
+from functools import partial, reduce
 
 import numpy as np
 import pandas as pd
@@ -27,12 +29,24 @@ from ibis.backends.pandas.rewrites import (
     plan,
 )
 from ibis.common.dispatch import Dispatched
-from ibis.common.exceptions import OperationNotDefinedError, UnboundExpressionError
+from ibis.common.exceptions import (
+    IbisError,
+    OperationNotDefinedError,
+    UnboundExpressionError,
+)
+from ibis.common.graph import Graph, _recursive_lookup
 from ibis.formats.pandas import PandasData, PandasType
 from ibis.util import any_of, gen_name
 
 # ruff: noqa: F811
 
+# relations which are always computed into a new dataframe, so they can be
+# modified in place by their only consumer
+_owned_relations = (ops.Project, ops.Filter, ops.Sort, PandasAggregate, PandasJoin)
+
+# relations returning dataframes which aren't owned by the plan
+_source_relations = (ops.DatabaseTable, ops.InMemoryTable)
+
 
 class PandasExecutor(Dispatched, PandasUtils):
     name = "pandas"
@@ -500,21 +514,179 @@ class PandasExecutor(Dispatched, PandasUtils):
         if start is None and end is None:
             return frame
         elif op.how == "rows":
-            return RowsFrame(parent=frame)
+            return RowsFrame(parent=frame, start=start, end=end)
         elif op.how == "range":
             if len(order_keys) != 1:
                 raise NotImplementedError(
                     "Only single column order by is supported for range window frames"
                 )
-            return RangeFrame(parent=frame, order_key=order_keys[0])
+            return RangeFrame(
+                parent=frame,
+                order_key=order_keys[0],
+                ascending=ascending[0],
+                start=start,
+                end=end,
+            )
         else:
             raise NotImplementedError(f"Unsupported window frame type: {op.how}")
 
+    @classmethod
+    def window_kernel(cls, op: ops.Reduction):
+        """Return a vectorized kernel computing `op` over a sliding window.
+
+        The kernel is called with the frame's rows and the window bounds of
+        every row. Returns None if there is no such kernel for `op`.
+        """
+        windowed = cls.kernels.windowed
+        if isinstance(op, ops.CountStar):
+            func, arg = windowed[ops.Count], None
+        elif isinstance(op, ops.Arbitrary):
+            how = {"first": ops.First, "last": ops.Last}.get(op.how)
+            func, arg = windowed.get(how), op.arg
+        elif isinstance(op, (ops.Variance, ops.StandardDev)):
+            ddof = {"pop": 0, "sample": 1}[op.how]
+            func, arg = partial(windowed[type(op)], ddof=ddof), op.arg
+        else:
+            func, arg = windowed.get(type(op)), getattr(op, "arg", None)
+
+        if func is None:
+            return None
+        elif isinstance(op, (ops.Sum, ops.Mean)):
+            supported = arg.dtype.is_numeric() or arg.dtype.is_boolean()
+        elif isinstance(op, (ops.Min, ops.Max, ops.Variance, ops.StandardDev)):
+            supported = arg.dtype.is_numeric()
+        else:
+            supported = True
+        if not supported or (arg is not None and arg.dtype.is_decimal()):
+            return None
+
+        where = op.where
+
+        def kernel(df, lo, hi):
+            if arg is None:
+                col = pd.Series(True, index=df.index)
+            else:
+                col = df[arg.name]
+            if where is None:
+                mask = None
+            else:
+                mask = df[where.name].to_numpy(dtype=bool, na_value=False)
+            return func(col, mask, lo, hi)
+
+        return kernel
+
+    @classmethod
+    def group_kernel(cls, op: ops.Reduction, df):
+        """Plan computing `op` for all groups of `df` at once.
+
+        Returns the column of `df` to reduce, with the values excluded by
+        `where` masked out, and a kernel computing the reduction of the
+        grouped column with a builtin groupby method. Returns None if `op`
+        must be computed by applying it to every group separately.
+        """
+        if not isinstance(op, ops.Reduction):
+            return None
+
+        where = getattr(op, "where", None)
+        if where is None:
+            mask = None
+        else:
+            mask = df[where.name].to_numpy(dtype=bool, na_value=False)
+
+        if isinstance(op, ops.CountStar):
+            values = pd.Series(True if mask is None else mask, index=df.index)
+            return values, operator.methodcaller("sum")
+
+        method = cls.kernels.grouped.get(type(op))
+        if method is None and not isinstance(op, (ops.First, ops.Last, ops.Arbitrary)):
+            return None
+
+        arg = op.arg
+        dtype = arg.dtype
+        if dtype.is_nested() or dtype.is_decimal():
+            return None
+
+        col = df[arg.name]
+        if isinstance(op, (ops.First, ops.Last, ops.Arbitrary)):
+            if isinstance(op, ops.Arbitrary):
+                how = op.how
+            else:
+                how = "first" if isinstance(op, ops.First) else "last"
+            if how not in ("first", "last"):
+                return None
+
+            # the first or last row of every group, including null values
+            values = pd.Series(np.arange(len(df)), index=df.index)
+            if mask is not None:
+                values = values.where(mask)
+
+            def kernel(grouped):
+                positions = grouped.min() if how == "first" else grouped.max()
+                valid = positions.notna()
+                result = col.take(positions.fillna(0).astype(np.int64))
+                return pd.Series(result.to_numpy(), index=positions.index).where(valid)
+
+            return values, kernel
+
+        if isinstance(op, (ops.Min, ops.Max)):
+            supported = dtype.is_numeric() or dtype.is_temporal()
+        elif isinstance(op, (ops.Count, ops.CountDistinct, ops.ApproxCountDistinct)):
+            supported = True
+        elif isinstance(op, (ops.Sum, ops.Mean)):
+            supported = dtype.is_numeric() or dtype.is_boolean()
+        else:
+            supported = dtype.is_numeric()
+        if not supported:
+            return None
+
+        if isinstance(op, (ops.Variance, ops.StandardDev)):
+            kwargs = {"ddof": {"pop": 0, "sample": 1}[op.how]}
+        elif isinstance(op, ops.Quantile):
+            if not isinstance(op.quantile, ops.Literal):
+                return None
+            kwargs = {"q": op.quantile.value}
+        else:
+            kwargs = {}
+
+        if mask is None:
+            values = col
+        elif isinstance(op, ops.Sum) and col.dtype.kind in "biu":
+            # keep the sum of integers exact
+            values = col.where(mask, 0)
+        elif col.dtype.kind in "iu":
+            # masking a numpy integer column would convert it to floats, so
+            # mask a nullable one and only convert results containing nulls
+            values = col.convert_dtypes().where(mask)
+            reduce = operator.methodcaller(method, **kwargs)
+
+            def kernel(grouped):
+                result = reduce(grouped)
+                if not isinstance(result.dtype, pd.api.extensions.ExtensionDtype):
+                    return result
+                elif result.hasnans:
+                    return result.astype(np.float64)
+                else:
+                    return result.astype(result.dtype.numpy_dtype)
+
+            return values, kernel
+        else:
+            values = col.where(mask)
+
+        return values, operator.methodcaller(method, **kwargs)
+
     @classmethod
     def visit(cls, op: ops.WindowFunction, func, frame):
         if isinstance(op.func, ops.Analytic):
             order_keys = [key.name for key in op.frame.order_by]
             return frame.apply_analytic(func, order_keys=order_keys)
+        elif isinstance(frame, (RowsFrame, RangeFrame)) and (
+            kernel := cls.window_kernel(op.func)
+        ):
+            return frame.apply_window(kernel, func)
+        elif isinstance(frame, GroupedFrame) and (
+            plan := cls.group_kernel(op.func, frame.df)
+        ):
+            return frame.apply_kernel(*plan)
         else:
             return frame.apply_reduction(func)
 
@@ -599,9 +771,30 @@ class PandasExecutor(Dispatched, PandasUtils):
     @classmethod
     def visit(cls, op: PandasAggregate, parent, groups, metrics):
         if groups:
-            parent = parent.groupby([col.name for col in groups.values()])
-            metrics = {k: parent.apply(v) for k, v in metrics.items()}
-            result = cls.concat(metrics, axis=1).reset_index()
+            keys = [col.name for col in groups.values()]
+
+            # group the columns reduced by the builtin groupby methods together
+            columns = {key: parent[key] for key in keys}
+            kernels = {}
+            for name, node in op.metrics.items():
+                if (plan := cls.group_kernel(node, parent)) is not None:
+                    values, kernel = plan
+                    column = gen_name("value")
+                    columns[column] = values
+                    kernels[name] = (column, kernel)
+            grouped = pd.DataFrame(columns).groupby(keys)
+
+            # fall back to applying the other reductions to every group
+            fallback = parent.groupby(keys)
+
+            results = {}
+            for name, func in metrics.items():
+                if name in kernels:
+                    column, kernel = kernels[name]
+                    results[name] = kernel(grouped[column])
+                else:
+                    results[name] = fallback.apply(func)
+            result = cls.concat(results, axis=1).reset_index()
             renames = {v.name: k for k, v in op.groups.items()}
             return result.rename(columns=renames)
         else:
@@ -766,14 +959,191 @@ class PandasExecutor(Dispatched, PandasUtils):
         return rel.iat[0, 0]
 
     @classmethod
-    def execute(cls, node, backend, params):
-        def fn(node, _, **kwargs):
-            return cls.visit(node, **kwargs)
+    def visit_low_memory(cls, op: ops.Node, owned, **kwargs):
+        return cls.visit(op, **kwargs)
+
+    @classmethod
+    def visit_low_memory(cls, op: ops.Filter, owned, parent, predicates):
+        if not predicates:
+            return parent
+        pred = reduce(operator.and_, predicates)
+        if len(pred) != len(parent):
+            raise RuntimeError(
+                "Selection predicate length does not match underlying table"
+            )
+        # validate the predicate like `.loc`, e.g. nulls in an object column
+        positions = pd.RangeIndex(len(pred))[pred].to_numpy()
+        return cls.take_columns(parent, positions, owned)
+
+    @classmethod
+    def visit_low_memory(cls, op: ops.Sort, owned, parent, keys):
+        ascending = [key.ascending for key in op.keys]
+        keys = {gen_name("sort_key"): col for col in keys}
+        order = pd.DataFrame(keys, index=parent.index).reset_index(drop=True)
+        order = order.sort_values(by=list(keys), ascending=ascending, kind="mergesort")
+        return cls.take_columns(parent, order.index.to_numpy(), owned)
+
+    @classmethod
+    def take_columns(cls, df, indexer, owned):
+        """Take rows from a dataframe one column at a time.
+
+        The result keeps its columns in separate blocks, so that they can be
+        released one by one too. If `owned`, the dataframe isn't used anywhere
+        else and its columns are removed from it as soon as they're taken.
+        """
+        if not df.columns.is_unique:
+            return df.take(indexer).reset_index(drop=True)
+
+        columns = {}
+        for name in df.columns.tolist():
+            column = df.pop(name) if owned else df[name]
+            columns[name] = column.take(indexer).reset_index(drop=True)
+        if not columns:
+            return pd.DataFrame(index=pd.RangeIndex(len(indexer)))
+        return pd.concat(columns, axis=1, copy=False)
+
+    @staticmethod
+    def memory_bounds(column):
+        """Memory range of the values of a numpy backed column, or None."""
+        if isinstance(column.dtype, np.dtype):
+            return np.byte_bounds(column.to_numpy())
+        return None
+
+    @classmethod
+    def unshare(cls, result, sources):
+        """Copy the columns of a result sharing memory with the `sources`.
+
+        `sources` are the memory ranges of the columns of the tables read
+        by the plan, with None standing for columns which aren't backed by
+        numpy, any of which is assumed to be shared with the result's.
+        """
+        bounds = [bound for bound in sources if bound is not None]
+        opaque = len(bounds) < len(sources)
+
+        def shared(column):
+            if (values := cls.memory_bounds(column)) is None:
+                return opaque
+            lo, hi = values
+            return any(lo < end and start < hi for start, end in bounds)
+
+        if isinstance(result, pd.Series):
+            return result.copy() if shared(result) else result
+        elif isinstance(result, pd.DataFrame):
+            # the result may be one of the tables itself
+            result = result.copy(deep=False)
+            for i, (_, column) in enumerate(result.items()):
+                if shared(column):
+                    result.isetitem(i, column.copy())
+        return result
+
+    @classmethod
+    def evaluate(cls, node, low_memory=False, report=None):
+        """Compute a plan, returning the result of its root node.
 
+        With `low_memory` the plan is computed with pandas' copy-on-write mode
+        enabled, so that selecting columns, renaming and resetting indexes
+        share memory with their inputs. Intermediate results are released as
+        soon as their last consumer starts, and filters and sorts take their
+        rows one column at a time, removing the columns from inputs which
+        nothing else uses. The columns of the result still sharing memory
+        with the tables of the backend are copied, since copy-on-write only
+        protects the tables while the plan is computed.
+
+        If `report` is a list, a row with the memory traced while computing
+        each node is appended to it, see `Backend.memory_report`.
+        """
+        if not low_memory and report is None:
+
+            def fn(node, _, **kwargs):
+                return cls.visit(node, **kwargs)
+
+            return node.map_clear(fn)
+
+        graph, dependents = Graph.from_bfs(node).toposort()
+        remaining = {k: len(set(v)) for k, v in dependents.items()}
+        results = {}
+        sources = []
+
+        if low_memory:
+            # copy-on-write and `DataFrame.isetitem` were added in pandas 1.5
+            if not hasattr(pd.DataFrame, "isetitem"):
+                raise IbisError(
+                    "The `low_memory` option requires pandas >= 1.5.0, "
+                    f"found {pd.__version__}"
+                )
+            context = pd.option_context("mode.copy_on_write", True)
+        else:
+            context = contextlib.nullcontext()
+
+        trace = report is not None and not tracemalloc.is_tracing()
+        if trace:
+            tracemalloc.start()
+        try:
+            with context:
+                for op, children in graph.items():
+                    # relations computed into new dataframes which are used
+                    # only by this node are handed over to it
+                    owned = low_memory and any(
+                        remaining[child] == 1 and children.count(child) == 1
+                        for child in children
+                        if isinstance(child, _owned_relations)
+                    )
+                    kwargs = {
+                        k: _recursive_lookup(v, results)
+                        for k, v in zip(op.__argnames__, op.__args__)
+                    }
+                    for child in set(children):
+                        remaining[child] -= 1
+                        if not remaining[child]:
+                            del results[child]
+
+                    if report is not None:
+                        tracemalloc.reset_peak()
+                    if low_memory:
+                        results[op] = cls.visit_low_memory(op, owned, **kwargs)
+                        if isinstance(op, _source_relations):
+                            columns = results[op].items()
+                            sources.extend(cls.memory_bounds(c) for _, c in columns)
+                    else:
+                        results[op] = cls.visit(op, **kwargs)
+                    del kwargs
+
+                    if report is not None:
+                        current, peak = tracemalloc.get_traced_memory()
+                        report.append(
+                            {
+                                "node": type(op).__name__,
+                                "result": cls.nbytes(results[op]),
+                                "current": current,
+                                "peak": peak,
+                            }
+                        )
+
+                result = results.pop(node)
+                if low_memory:
+                    result = cls.unshare(result, sources)
+        finally:
+            if trace:
+                tracemalloc.stop()
+
+        return result
+
+    @staticmethod
+    def nbytes(result):
+        """Size of the data of a result, without following python objects."""
+        if isinstance(result, pd.DataFrame):
+            return int(result.memory_usage(index=False).sum())
+        elif isinstance(result, pd.Series):
+            return int(result.memory_usage(index=False))
+        else:
+            return 0
+
+    @classmethod
+    def execute(cls, node, backend, params, low_memory=False, report=None):
         original = node
         node = node.to_expr().as_table().op()
         node = plan(node, backend=backend, params=params)
-        df = node.map_clear(fn)
+        df = cls.evaluate(node, low_memory=low_memory, report=report)
 
         # TODO(kszucs): add a flag to disable this conversion because it can be
         # expensive for columns with object dtype
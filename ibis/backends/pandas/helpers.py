@@ -126,6 +126,11 @@ class UngroupedFrame:
     def groups(self):
         yield self.df
 
+    def partitions(self):
+        """Return the rows and the bounds of the partition each row belongs to."""
+        n = len(self.df)
+        return self.df, np.zeros(n, dtype=np.int64), np.full(n, n, dtype=np.int64)
+
     def apply_reduction(self, func, **kwargs):
         result = func(self.df, **kwargs)
         data = [result] * len(self.df)
@@ -145,20 +150,49 @@ class GroupedFrame:
         for _, df in self.groupby:
             yield df
 
+    def partitions(self):
+        """Return the rows and the bounds of the partition each row belongs to.
+
+        The rows of each group are made contiguous, keeping their order within
+        the group. Rows with null group keys are dropped, like `groups` does.
+        """
+        codes = self.groupby.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+        order = np.argsort(codes, kind="stable")
+        order = order[codes[order] >= 0]
+        codes = codes[order]
+        offsets = np.zeros(self.groupby.ngroups + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=self.groupby.ngroups), out=offsets[1:])
+        return self.df.iloc[order], offsets[codes], offsets[codes + 1]
+
     def apply_analytic(self, func, **kwargs):
         results = [func(df, **kwargs) for df in self.groups()]
         return pd.concat(results)
 
-    def apply_reduction(self, func, **kwargs):
+    def broadcast(self, result):
+        """Broadcast a result computed for every group to the group's rows."""
         name = gen_name("result")
-        result = self.groupby.apply(func, **kwargs).rename(name)
+        result = result.rename(name)
         df = self.df.merge(result, left_on=self.group_keys, right_index=True)
         return df[name]
 
+    def apply_reduction(self, func, **kwargs):
+        return self.broadcast(self.groupby.apply(func, **kwargs))
+
+    def apply_kernel(self, values, kernel):
+        """Apply a kernel computing a reduction of `values` for all groups at once.
+
+        `kernel` is called with `values` grouped like the frame and must
+        return the result for every group.
+        """
+        grouped = values.groupby([self.df[key] for key in self.group_keys])
+        return self.broadcast(kernel(grouped))
+
 
 class RowsFrame:
-    def __init__(self, parent):
+    def __init__(self, parent, start=None, end=None):
         self.parent = parent
+        self.start = start
+        self.end = end
 
     @staticmethod
     def adjust(length, index, start_offset, end_offset):
@@ -185,6 +219,39 @@ class RowsFrame:
     def apply_analytic(self, func, **kwargs):
         return self.parent.apply_analytic(func, **kwargs)
 
+    def bounds(self):
+        """Compute the window bounds of every row.
+
+        Returns the rows with each partition made contiguous, and the start
+        (inclusive) and end (exclusive) positions of the window of every row,
+        or None if the offsets vary per row.
+        """
+        if isinstance(self.start, pd.Series) or isinstance(self.end, pd.Series):
+            return None
+
+        df, first, last = self.parent.partitions()
+        index = np.arange(len(df), dtype=np.int64)
+        if self.start is None:
+            lo = first
+        else:
+            lo = np.clip(index + self.start, first, last)
+        if self.end is None:
+            hi = last
+        else:
+            hi = np.clip(index + self.end + 1, first, last)
+        return df, lo, np.maximum(lo, hi)
+
+    def apply_window(self, kernel, func):
+        """Apply a vectorized window kernel, falling back to `func` per row.
+
+        `kernel` is called with the rows and the window bounds of every row,
+        see `bounds`, and must return the result for every row.
+        """
+        if (bounds := self.bounds()) is None:
+            return self.apply_reduction(func)
+        df, lo, hi = bounds
+        return pd.Series(kernel(df, lo, hi), index=df.index)
+
     def apply_reduction(self, func, **kwargs):
         results = {}
         for df in self.parent.groups():
@@ -199,9 +266,12 @@ class RowsFrame:
 
 
 class RangeFrame:
-    def __init__(self, parent, order_key):
+    def __init__(self, parent, order_key, ascending=True, start=None, end=None):
         self.parent = parent
         self.order_key = order_key
+        self.ascending = ascending
+        self.start = start
+        self.end = end
 
     @staticmethod
     def predicate(col, i, start, end):
@@ -216,6 +286,43 @@ class RangeFrame:
     def apply_analytic(self, func, **kwargs):
         return self.parent.apply_analytic(func, **kwargs)
 
+    def bounds(self):
+        """Compute the window bounds of every row, see `RowsFrame.bounds`.
+
+        Returns None if the offsets vary per row or the order key contains
+        nulls, which never fall into any window.
+        """
+        if isinstance(self.start, pd.Series) or isinstance(self.end, pd.Series):
+            return None
+
+        df, first, last = self.parent.partitions()
+        keys = df[self.order_key]
+        if keys.isna().any():
+            return None
+
+        keys = keys.to_numpy()
+        lo, hi = first.copy(), last.copy()
+        # the rows are sorted by the order key within each partition, so the
+        # window bounds can be found with a binary search per partition
+        runs = np.flatnonzero(np.diff(first, prepend=-1))
+        for s, e in zip(first[runs], last[runs]):
+            values = keys[s:e] if self.ascending else keys[s:e][::-1]
+            if self.start is not None:
+                h = np.searchsorted(values, values + self.start, side="left")
+                if self.ascending:
+                    lo[s:e] = s + h
+                else:
+                    hi[s:e] = e - h[::-1]
+            if self.end is not None:
+                h = np.searchsorted(values, values + self.end, side="right")
+                if self.ascending:
+                    hi[s:e] = s + h
+                else:
+                    lo[s:e] = e - h[::-1]
+        return df, lo, np.maximum(lo, hi)
+
+    apply_window = RowsFrame.apply_window
+
     def apply_reduction(self, func, **kwargs):
         results = {}
         for df in self.parent.groups():
@@ -10,12 +10,13 @@ try:
     import regex as re
 except ImportError:
     import re
-from functools import reduce
+from functools import partial, reduce
 from urllib.parse import parse_qs, urlsplit
 
 import numpy as np
 import pandas as pd
 import toolz
+from pandas.api.indexers import BaseIndexer
 
 import ibis.expr.operations as ops
 from ibis.backends.pandas.helpers import isnull
@@ -275,6 +276,143 @@ reductions = {
     ops.ArrayCollect: lambda x: x.tolist(),
 }
 
+# reductions computed for all groups at once by the builtin groupby methods,
+# which skip nulls so the values excluded by `where` are set to null
+grouped = {
+    ops.Min: "min",
+    ops.Max: "max",
+    ops.Sum: "sum",
+    ops.Mean: "mean",
+    ops.Count: "count",
+    ops.Median: "median",
+    ops.ApproxMedian: "median",
+    ops.CountDistinct: "nunique",
+    ops.ApproxCountDistinct: "nunique",
+    ops.Variance: "var",
+    ops.StandardDev: "std",
+    ops.Quantile: "quantile",
+}
+
+
+class WindowBounds(BaseIndexer):
+    """Rolling window indexer with precomputed window bounds."""
+
+    def get_window_bounds(
+        self, num_values=0, min_periods=None, center=None, closed=None, step=None
+    ):
+        return self.start, self.end
+
+
+def rolling(col, mask, lo, hi):
+    if mask is not None:
+        col = col.where(mask)
+    values = pd.Series(col.to_numpy(dtype="float64", na_value=np.nan))
+    return values.rolling(WindowBounds(start=lo, end=hi), min_periods=0)
+
+
+def prefix_sum(values, lo, hi):
+    sums = np.zeros(len(values) + 1, dtype=values.dtype)
+    np.cumsum(values, out=sums[1:])
+    return sums[hi] - sums[lo]
+
+
+def window_sum(col, mask, lo, hi):
+    dtype = col.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biu":
+        if np.can_cast(dtype, np.int64):
+            # exact, unlike the floating point rolling sum
+            values = col.to_numpy(dtype=np.int64)
+            if mask is not None:
+                values = np.where(mask, values, 0)
+            return prefix_sum(values, lo, hi)
+    return rolling(col, mask, lo, hi).sum().to_numpy()
+
+
+def window_count(col, mask, lo, hi):
+    valid = col.notna().to_numpy()
+    if mask is not None:
+        valid = valid & mask
+    return prefix_sum(valid.astype(np.int64), lo, hi)
+
+
+def window_extremum(col, mask, lo, hi, how):
+    dtype = col.dtype
+    if not (isinstance(dtype, np.dtype) and dtype.kind in "iu"):
+        return getattr(rolling(col, mask, lo, hi), how)().to_numpy()
+
+    # exact, unlike the floating point rolling kernels which round integers
+    # beyond 2**53
+    ufunc = np.minimum if how == "min" else np.maximum
+    values = col.to_numpy()
+    valid = hi > lo
+    if mask is not None:
+        info = np.iinfo(dtype)
+        values = np.where(mask, values, info.max if how == "min" else info.min)
+        valid = valid & (prefix_sum(mask.astype(np.int64), lo, hi) > 0)
+
+    # the extremum of a window is the extremum of the two (overlapping) spans
+    # of the largest power of two length fitting in it, so compute the spans
+    # of every length in turn and look up the windows that need them
+    starts, ends = lo[valid], hi[valid]
+    exponents = np.log2(ends - starts).astype(np.int64)
+    extrema = np.empty(len(starts), dtype=dtype)
+    spans = values
+    for k in range(exponents.max(initial=-1) + 1):
+        if k:
+            half = 1 << (k - 1)
+            spans = ufunc(spans[:-half], spans[half:])
+        rows = np.flatnonzero(exponents == k)
+        extrema[rows] = ufunc(spans[starts[rows]], spans[ends[rows] - (1 << k)])
+
+    result = np.zeros(len(valid), dtype=dtype)
+    result[valid] = extrema
+    return pd.Series(result).where(valid, None).to_numpy()
+
+
+def window_take(col, positions, valid):
+    result = col.take(np.where(valid, positions, 0)).reset_index(drop=True)
+    return result.where(valid, None).to_numpy()
+
+
+def window_first(col, mask, lo, hi):
+    if mask is None:
+        positions = lo
+    else:
+        # position of the first selected row at or after each position
+        n = len(col)
+        positions = np.where(mask, np.arange(n), n)
+        positions = np.minimum.accumulate(positions[::-1])[::-1]
+        positions = np.append(positions, n)[lo]
+    return window_take(col, positions, positions < hi)
+
+
+def window_last(col, mask, lo, hi):
+    if mask is None:
+        positions = hi - 1
+    else:
+        # position of the last selected row before each position
+        positions = np.where(mask, np.arange(len(col)), -1)
+        positions = np.maximum.accumulate(positions)
+        positions = np.insert(positions, 0, -1)[hi]
+    return window_take(col, positions, positions >= lo)
+
+
+windowed = {
+    ops.Min: partial(window_extremum, how="min"),
+    ops.Max: partial(window_extremum, how="max"),
+    ops.Sum: window_sum,
+    ops.Mean: lambda col, mask, lo, hi: rolling(col, mask, lo, hi).mean().to_numpy(),
+    ops.Count: window_count,
+    ops.First: window_first,
+    ops.Last: window_last,
+    ops.Variance: lambda col, mask, lo, hi, ddof: (
+        rolling(col, mask, lo, hi).var(ddof=ddof).to_numpy()
+    ),
+    ops.StandardDev: lambda col, mask, lo, hi, ddof: (
+        rolling(col, mask, lo, hi).std(ddof=ddof).to_numpy()
+    ),
+}
+
 generic = {
     ops.Abs: abs,
     ops.Acos: np.arccos,
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from typing import Any
+
 from public import public
 
 import ibis
@@ -8,9 +11,11 @@ import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 from ibis.common.annotations import attribute
 from ibis.common.collections import FrozenDict
+from ibis.common.deferred import Item
+from ibis.common.graph import Graph
 from ibis.common.patterns import replace
 from ibis.common.typing import VarTuple  # noqa: TCH001
-from ibis.expr.rewrites import replace_parameter
+from ibis.expr.rewrites import d, name, p, replace_parameter
 from ibis.expr.schema import Schema
 from ibis.util import gen_name
 
@@ -113,6 +118,24 @@ class PandasLimit(PandasRelation):
         return self.parent.schema
 
 
+@public
+class PandasReadParquet(PandasRelation):
+    """A table registered from parquet files, reading only what's needed.
+
+    Reads the columns of `schema`, skipping the data that doesn't pass
+    `filters`, given in the format of `pyarrow.parquet.read_table`. Filters
+    may not remove every row that doesn't match, so the predicates they
+    were made from are still applied.
+    """
+
+    name: str
+    schema: Schema
+    source: Any
+    filters: VarTuple[tuple] = ()
+
+    values = FrozenDict()
+
+
 @public
 class PandasScalarSubquery(PandasValue):
     # variant with no integrity checks
@@ -321,7 +344,312 @@ def bind_unbound_table(_, backend, **kwargs):
     return ops.DatabaseTable(name=_.name, schema=_.schema, source=backend)
 
 
-def plan(node, backend, params):
+def rebind(value, old, new):
+    """Replace the fields of the `old` relation in `value` with fields of `new`."""
+    rule = p.Field(old, name) >> d.Field(new, name)
+    return value.replace(rule, filter=ops.Value)
+
+
+def is_pushable(value):
+    """Whether a value gives the same result for a row regardless of the others."""
+    return not value.find(
+        (ops.WindowFunction, ops.Reduction, ops.RandomScalar, ops.RandomUUID),
+        filter=ops.Value,
+    )
+
+
+# operations which don't raise whatever the values of a row are
+_infallible = (
+    ops.Field,
+    ops.Literal,
+    ops.Comparison,
+    ops.LogicalBinary,
+    ops.Not,
+    ops.IsNull,
+    ops.NotNull,
+    ops.InValues,
+    ops.Between,
+)
+
+
+def is_infallible(value):
+    """Whether a value can be computed for any row without raising."""
+    nodes = value.find(ops.Value, filter=ops.Value)
+    return all(isinstance(node, _infallible) for node in nodes)
+
+
+def sink_filter(parent, predicates):
+    """Filter `parent`, moving the predicates as close to the sources as possible.
+
+    The predicates must be pushable and reference the fields of `parent`.
+    Returns a relation with the same schema and rows as the filtered parent.
+    """
+    if isinstance(parent, ops.Filter):
+        # the predicates may only be valid for the rows kept by the filter
+        # below, e.g. a cast guarded by a comparison, so they're evaluated on
+        # its output instead of being merged into it or pushed below it
+        return ops.Filter(parent, predicates)
+    elif isinstance(parent, ops.Sort):
+        preds = [rebind(pred, parent, parent.parent) for pred in predicates]
+        inner = sink_filter(parent.parent, preds)
+        keys = [rebind(key, parent.parent, inner) for key in parent.keys]
+        return ops.Sort(inner, keys)
+    elif isinstance(parent, (ops.SelfReference, ops.JoinTable)):
+        preds = [rebind(pred, parent, parent.parent) for pred in predicates]
+        return parent.copy(parent=sink_filter(parent.parent, preds))
+    elif isinstance(parent, PandasRename):
+        rule = p.Field(parent, name) >> Item(parent.values, name)
+        preds = [pred.replace(rule, filter=ops.Value) for pred in predicates]
+        inner = sink_filter(parent.parent, preds)
+        return PandasRename(inner, parent.mapping)
+    elif isinstance(parent, ops.Project) and all(
+        map(is_pushable, parent.values.values())
+    ):
+        # only push the predicates which reference columns that are passed
+        # through, to avoid computing the other values twice
+        passed = {k for k, v in parent.values.items() if isinstance(v, ops.Field)}
+        below, above = [], []
+        for pred in predicates:
+            fields = pred.find(ops.Field, filter=ops.Value)
+            if all(field.name in passed for field in fields if field.rel == parent):
+                below.append(pred)
+            else:
+                above.append(pred)
+        if not below:
+            return ops.Filter(parent, predicates)
+
+        rule = p.Field(parent, name) >> Item(parent.values, name)
+        preds = [pred.replace(rule, filter=ops.Value) for pred in below]
+        inner = sink_filter(parent.parent, preds)
+        values = {k: rebind(v, parent.parent, inner) for k, v in parent.values.items()}
+        proj = ops.Project(inner, values)
+        if above:
+            return ops.Filter(proj, [rebind(pred, parent, proj) for pred in above])
+        return proj
+    elif type(parent) is PandasJoin and parent.how != "outer":
+        left, right = parent.left, parent.right
+        left_preds, right_preds, above = [], [], []
+        for pred in predicates:
+            names = {field.name for field in pred.find(ops.Field, filter=ops.Value)}
+            # the predicates may only be valid for the rows kept by the join,
+            # e.g. a cast of the matching rows, so they're only evaluated on
+            # the rows it drops if they can't fail
+            safe = is_infallible(pred)
+            if not names:
+                above.append(pred)
+            elif (
+                names <= left.schema.keys()
+                and parent.how != "right"
+                and (safe or parent.how == "left")
+            ):
+                left_preds.append(rebind(pred, parent, left))
+            elif (
+                names <= right.schema.keys()
+                and parent.how in ("inner", "right")
+                and (safe or parent.how == "right")
+            ):
+                right_preds.append(rebind(pred, parent, right))
+            else:
+                above.append(pred)
+        if not left_preds and not right_preds:
+            return ops.Filter(parent, predicates)
+
+        new_left = sink_filter(left, left_preds) if left_preds else left
+        new_right = sink_filter(right, right_preds) if right_preds else right
+
+        def rebind_sides(value):
+            return rebind(rebind(value, left, new_left), right, new_right)
+
+        join = parent.copy(
+            left=new_left,
+            right=new_right,
+            left_on=tuple(map(rebind_sides, parent.left_on)),
+            right_on=tuple(map(rebind_sides, parent.right_on)),
+        )
+        if above:
+            return ops.Filter(join, [rebind(pred, parent, join) for pred in above])
+        return join
+    else:
+        return ops.Filter(parent, predicates)
+
+
+@replace(ops.Filter)
+def push_down_filter(_, **kwargs):
+    pushable = [pred for pred in _.predicates if is_pushable(pred)]
+    if not pushable:
+        return _
+
+    inner = sink_filter(_.parent, pushable)
+    if rest := [pred for pred in _.predicates if pred not in pushable]:
+        return ops.Filter(inner, [rebind(pred, _.parent, inner) for pred in rest])
+    return inner
+
+
+def prune_columns(node, backend):
+    """Narrow the relations of a plan to the columns needed by their consumers.
+
+    Unused values are dropped from projections and aggregations, and tables
+    consumed by anything but projections are projected to the used columns.
+    Tables registered from parquet files only read the used columns.
+    """
+    graph, dependents = Graph.from_bfs(node).toposort()
+
+    needed = defaultdict(set)
+    needed[node] = set(node.schema)
+    # nodes which are still used once the unused values are dropped
+    live = {node}
+
+    def require(values):
+        for value in values:
+            for op in value.find(ops.Value, filter=ops.Value):
+                if isinstance(op, ops.Field):
+                    needed[op.rel].add(op.name)
+                elif not isinstance(op, ops.WindowFrame):
+                    # subqueries need all the columns of their relations,
+                    # while window frames only use the referenced fields
+                    for rel in op.__children__:
+                        if isinstance(rel, ops.Relation):
+                            needed[rel].update(rel.schema)
+
+    # visit the consumers of every node before the node itself
+    for op in reversed(graph):
+        if op not in live:
+            continue
+        elif not isinstance(op, ops.Relation):
+            live.update(op.__children__)
+            continue
+
+        names = needed[op]
+        children = op.__children__
+        if isinstance(op, ops.Project):
+            # keep at least one column to keep the number of rows
+            if not any(op.values[k].shape.is_columnar() for k in names):
+                columnar = (k for k, v in op.values.items() if v.shape.is_columnar())
+                names = needed[op] = names | {next(columnar, next(iter(op.values)))}
+            values = [v for k, v in op.values.items() if k in names]
+            children = (op.parent, *values)
+            require(values)
+        elif isinstance(op, PandasAggregate):
+            metrics = [v for k, v in op.metrics.items() if k in names]
+            if not metrics:
+                metrics = list(op.metrics.values())
+            children = (op.parent, *op.groups.values(), *metrics)
+            require(op.groups.values())
+            require(metrics)
+        elif isinstance(op, PandasRename):
+            needed[op.parent].update(k for k, v in op.mapping.items() if v in names)
+        elif isinstance(op, PandasJoin):
+            needed[op.left].update(names & op.left.schema.keys())
+            needed[op.right].update(names & op.right.schema.keys())
+            require(v for v in children if isinstance(v, ops.Value))
+        elif isinstance(op, (ops.Filter, ops.Sort, ops.SelfReference, ops.JoinTable)):
+            needed[op.parent].update(names)
+            require(v for v in children if isinstance(v, ops.Value))
+        elif isinstance(op, PandasLimit):
+            needed[op.parent].update(names)
+            needed[op.n].update(op.n.schema)
+            needed[op.offset].update(op.offset.schema)
+        else:
+            for child in children:
+                if isinstance(child, ops.Relation):
+                    needed[child].update(child.schema)
+            require(v for v in children if isinstance(v, ops.Value))
+        live.update(children)
+
+    sources = getattr(backend, "_parquet_sources", {})
+
+    def fn(op, _, **kwargs):
+        if isinstance(op, ops.Project):
+            values = kwargs["values"]
+            kwargs["values"] = {k: v for k, v in values.items() if k in needed[op]}
+        elif isinstance(op, PandasAggregate):
+            metrics = kwargs["metrics"]
+            if needed[op] & metrics.keys():
+                kwargs["metrics"] = {
+                    k: v for k, v in metrics.items() if k in needed[op]
+                }
+        elif isinstance(op, PandasRename):
+            parent = kwargs["parent"]
+            kwargs["mapping"] = {
+                k: v for k, v in kwargs["mapping"].items() if k in parent.schema
+            }
+
+        op = op.__rebuild__(kwargs)
+        if not isinstance(op, (ops.DatabaseTable, ops.InMemoryTable)):
+            return op
+
+        names = needed[op] or {op.schema.names[0]}
+        if isinstance(op, ops.DatabaseTable) and op.name in sources:
+            df, _, _ = sources[op.name]
+            if backend.dictionary.get(op.name) is df:
+                schema = {k: v for k, v in op.schema.items() if k in names}
+                return PandasReadParquet(op.name, schema, backend)
+
+        if names == set(op.schema) or all(
+            isinstance(rel, ops.Project)
+            for rel in dependents[op]
+            if isinstance(rel, ops.Relation)
+        ):
+            return op
+        return ops.Project(op, {k: ops.Field(op, k) for k in op.schema if k in names})
+
+    return node.map(fn, filter=live.__contains__)[node]
+
+
+# mapping of comparisons to their parquet filter operators, and to the
+# operators with the operands swapped
+_parquet_comparisons = {
+    ops.Equals: ("==", "=="),
+    ops.NotEquals: ("!=", "!="),
+    ops.Less: ("<", ">"),
+    ops.LessEqual: ("<=", ">="),
+    ops.Greater: (">", "<"),
+    ops.GreaterEqual: (">=", "<="),
+}
+
+
+def to_parquet_filter(pred, rel):
+    """Convert a predicate to a parquet filter, or return None if it can't be."""
+    if isinstance(pred, ops.InValues):
+        column, values = pred.value, pred.options
+        if all(isinstance(v, ops.Literal) and v.value is not None for v in values):
+            value = [v.value for v in values]
+        else:
+            return None
+        op = "in"
+    elif type(pred) in _parquet_comparisons:
+        op, swapped = _parquet_comparisons[type(pred)]
+        column, literal = pred.left, pred.right
+        if isinstance(column, ops.Literal):
+            column, literal, op = literal, column, swapped
+        if not isinstance(literal, ops.Literal) or literal.value is None:
+            return None
+        value = literal.value
+    else:
+        return None
+
+    if not (isinstance(column, ops.Field) and column.rel == rel):
+        return None
+    dtype = column.dtype
+    if not (dtype.is_numeric() or dtype.is_string() or dtype.is_boolean()):
+        return None
+    return (column.name, op, value)
+
+
+@replace(ops.Filter)
+def push_down_parquet_filter(_, **kwargs):
+    if not isinstance(_.parent, PandasReadParquet) or _.parent.filters:
+        return _
+
+    filters = (to_parquet_filter(pred, _.parent) for pred in _.predicates)
+    if not (filters := tuple(f for f in filters if f is not None)):
+        return _
+
+    table = _.parent.copy(filters=filters)
+    return ops.Filter(table, [rebind(pred, _.parent, table) for pred in _.predicates])
+
+
+def plan(node, backend, params, prune_in_memory=True):
     ctx = {"params": params, "backend": backend}
     node = node.replace(rewrite_scalar_subquery)
     node = node.replace(
@@ -333,4 +661,9 @@ def plan(node, backend, params):
         | bind_unbound_table,
         context=ctx,
     )
+    node = node.replace(push_down_filter)
+    sources = getattr(backend, "_parquet_sources", {})
+    if prune_in_memory or any(t.name in sources for t in node.find(ops.DatabaseTable)):
+        node = prune_columns(node, backend)
+    node = node.replace(push_down_parquet_filter)
     return node
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pandas.testing as tm
 import pytest
@@ -67,3 +68,142 @@ def test_unbound_table_execution():
     con = ibis.pandas.connect({"t": pd.DataFrame({"a": ["a", "ab", "abc"]})})
     result = con.execute(expr)
     assert result.tolist() == [1, 2, 3]
+
+
+def test_filters_pushed_through_sort_and_filter(ibis_table, dataframe):
+    t = ibis_table
+    expr = (
+        t.filter(t.plain_int64 > 1)
+        .order_by(ibis.desc("plain_int64"))
+        .filter(lambda t: t.dup_strings == "d")
+    )
+    result = expr.execute()
+    df = dataframe
+    expected = df[(df.plain_int64 > 1) & (df.dup_strings == "d")]
+    expected = expected.sort_values("plain_int64", ascending=False)
+    tm.assert_frame_equal(result, expected.reset_index(drop=True))
+
+
+@pytest.fixture
+def low_memory(monkeypatch):
+    monkeypatch.setattr(ibis.options.pandas, "low_memory", True)
+
+
+@pytest.mark.parametrize(
+    "make_expr",
+    [
+        lambda t: t.filter(t.plain_int64 > 1).order_by("dup_strings"),
+        lambda t: t.order_by(ibis.desc("plain_strings")).mutate(x=t.plain_int64 + 1),
+        lambda t: t.view().filter(lambda t: t.dup_strings == "d"),
+        lambda t: t.group_by("dup_strings").agg(n=t.plain_int64.sum()),
+    ],
+)
+def test_low_memory(ibis_table, dataframe, low_memory, make_expr):
+    original = dataframe.copy()
+    expr = make_expr(ibis_table)
+    result = expr.execute()
+
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(ibis.options.pandas, "low_memory", False)
+        expected = expr.execute()
+
+    tm.assert_frame_equal(result, expected)
+    tm.assert_frame_equal(dataframe, original)
+
+
+def test_low_memory_reductions(low_memory):
+    df = pd.DataFrame(
+        {
+            "g": list("aabbab"),
+            "x": [1, 5, 2, None, 3, 4],
+            "i": [2**60 + 1, 3, 7, 2**60, 5, 1],
+        }
+    )
+    con = Backend().connect({"t": df})
+    t = con.table("t")
+    w = ibis.window(group_by="g", order_by="i", preceding=1, following=0)
+    where = t.i > 2
+    metrics = {
+        "sum": t.x.sum(where=where),
+        "count": t.x.count(where=where),
+        "min": t.i.min(where=where),
+        "max": t.i.max(where=where),
+        "mean": t.x.mean(where=where),
+        "first": t.x.first(where=where),
+    }
+    exprs = [
+        t.mutate(**{name: m.over(w) for name, m in metrics.items()}).order_by("i"),
+        t.group_by("g").agg(**metrics).order_by("g"),
+    ]
+    for expr in exprs:
+        result = expr.execute()
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(ibis.options.pandas, "low_memory", False)
+            expected = expr.execute()
+        tm.assert_frame_equal(result, expected, check_exact=True)
+    tm.assert_frame_equal(con.table("t").execute(), df)
+
+
+def test_low_memory_requires_copy_on_write(ibis_table, low_memory, monkeypatch):
+    monkeypatch.delattr(pd.DataFrame, "isetitem")
+    with pytest.raises(com.IbisError, match="pandas >= 1.5.0"):
+        ibis_table.execute()
+
+
+@pytest.mark.parametrize(
+    "make_expr",
+    [
+        lambda t: t.select("plain_int64", "plain_strings"),
+        lambda t: t.rename(x="plain_int64").select("x", "plain_strings"),
+        lambda t: t.plain_int64,
+    ],
+)
+def test_low_memory_result_is_not_shared(ibis_table, dataframe, low_memory, make_expr):
+    original = dataframe.copy()
+    result = make_expr(ibis_table).execute()
+
+    if isinstance(result, pd.Series):
+        result.iloc[0] = 99
+    else:
+        result.iloc[0, 0] = 99
+        result.iloc[0, 1] = "changed"
+    tm.assert_frame_equal(dataframe, original)
+
+
+@pytest.mark.parametrize("low_memory", [False, True])
+def test_filter_null_predicate(monkeypatch, low_memory):
+    monkeypatch.setattr(ibis.options.pandas, "low_memory", low_memory)
+    con = ibis.pandas.connect({"t": pd.DataFrame({"s": ["a", None, "ba"]})})
+    t = con.table("t")
+    with pytest.raises(ValueError, match="NA / NaN"):
+        t.filter(t.s.contains("a")).execute()
+
+
+def test_memory_report(core_client, ibis_table):
+    expr = ibis_table.filter(ibis_table.plain_int64 > 1)
+    report = core_client.memory_report(expr)
+    assert list(report.columns) == ["node", "result", "current", "peak"]
+    assert report.node.iloc[-1] == "Filter"
+    assert (report.peak >= report.current).all()
+
+
+def test_low_memory_releases_intermediates(monkeypatch):
+    df = pd.DataFrame({f"c{i}": np.arange(100_000, dtype="float64") for i in range(4)})
+    con = Backend().connect({"t": df})
+    t = con.table("t")
+    expr = t.mutate(x=t.c0 * 2).order_by(ibis.desc("c1")).filter(lambda t: t.x > 10)
+
+    peaks = {}
+    for low_memory in (False, True):
+        monkeypatch.setattr(ibis.options.pandas, "low_memory", low_memory)
+        peaks[low_memory] = con.memory_report(expr).peak.max()
+    assert peaks[True] < peaks[False]
+
+
+def test_stacked_filters_evaluated_in_order():
+    con = ibis.pandas.connect({"t": pd.DataFrame({"s": ["x", "1", "3"]})})
+    t = con.table("t")
+    # the cast is only valid for the rows kept by the first filter
+    expr = t.filter(t.s != "x").filter(t.s.cast("int64") > 1)
+    result = expr.execute()
+    assert result.s.tolist() == ["3"]
@@ -6,7 +6,9 @@ import pandas.testing as tm
 import pytest
 
 import ibis
+import ibis.expr.operations as ops
 from ibis.backends.conftest import is_older_than
+from ibis.backends.pandas.rewrites import PandasJoin, plan
 
 # SEMI and ANTI are checked in backend tests
 mutating_join_type = pytest.mark.parametrize(
@@ -675,3 +677,47 @@ def test_chain_join():
         }
     )
     tm.assert_frame_equal(result, expected)
+
+
+def test_join_plan_prunes_columns_and_pushes_down_filters(
+    client, left, right, df1, df2
+):
+    joined = left.join(right, "key")
+    expr = joined.filter(joined.value > 3, joined.other_value < 5)[["key", "value"]]
+
+    node = plan(expr.op(), backend=client, params={})
+    (join,) = node.find(PandasJoin)
+    assert join.left.find(ops.Filter)
+    assert join.right.find(ops.Filter)
+    assert set(join.right.schema) == {"1_key", "1_other_value"}
+    # the filters are only evaluated below the join
+    assert set(node.find(ops.Filter)) == set(join.find(ops.Filter))
+
+    result = expr.execute()
+    expected = pd.merge(df1, df2, on="key")
+    expected = expected.loc[(expected.value > 3) & (expected.other_value < 5)]
+    expected = expected[["key", "value"]].reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_join_filter_not_pushed_to_dropped_rows():
+    con = ibis.pandas.connect(
+        {
+            "t": pd.DataFrame({"key": [1, 2], "s": ["x", "3"]}),
+            "u": pd.DataFrame({"key": [2], "v": ["7"]}),
+        }
+    )
+    t, u = con.tables.t, con.tables.u
+    # the casts are only valid for the rows kept by the join
+    expr = (
+        t.join(u, "key")
+        .filter(t.s.cast("int64") > 1, u.v.cast("int64") > 1)
+        .select("key", "s")
+    )
+
+    node = plan(expr.op(), backend=con, params={})
+    (join,) = node.find(PandasJoin)
+    assert not join.find(ops.Filter)
+
+    result = expr.execute()
+    assert result.to_dict("list") == {"key": [2], "s": ["3"]}
@@ -13,6 +13,7 @@ import ibis
 import ibis.expr.datatypes as dt
 from ibis import _
 from ibis.backends.pandas import Backend
+from ibis.backends.pandas.executor import PandasExecutor
 from ibis.backends.pandas.tests.conftest import TestConf as tm
 
 
@@ -196,6 +197,61 @@ def test_group_by_rename_key(t, df):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("window", [False, True], ids=["aggregate", "window"])
+@pytest.mark.parametrize(
+    "reduction",
+    [
+        param(lambda t: t.ints.sum(), id="sum"),
+        param(lambda t: t.ints.sum(where=t.flag), id="sum_where"),
+        param(lambda t: t.value.mean(where=t.flag), id="mean_where"),
+        param(lambda t: t.value.min(), id="min"),
+        param(lambda t: t.ints.max(), id="max"),
+        param(lambda t: t.strings.count(where=t.flag), id="count_where"),
+        param(lambda t: t.ints.nunique(where=t.flag), id="nunique_where"),
+        param(lambda t: t.big.nunique(where=t.flag), id="nunique_where_big"),
+        param(lambda t: t.big.min(where=t.flag), id="min_where_big"),
+        param(lambda t: t.big.max(where=t.key != "a"), id="max_where_empty_group"),
+        param(lambda t: t.big.sum(where=t.flag), id="sum_where_big"),
+        param(lambda t: t.strings.first(), id="first"),
+        param(lambda t: t.value.last(where=t.flag), id="last_where"),
+        param(lambda t: t.value.std(how="pop"), id="std_pop"),
+        param(lambda t: t.ints.var(where=t.flag), id="var_where"),
+        param(lambda t: t.value.quantile(0.25), id="quantile"),
+    ],
+)
+def test_builtin_group_by_reductions(monkeypatch, reduction, window):
+    n = 100
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "key": rng.choice(list("abcde"), size=n),
+            "ints": rng.integers(-10, 10, size=n),
+            # not every one of these is exactly representable as a float
+            "big": 2**53 + rng.integers(-10, 10, size=n),
+            "value": np.where(rng.random(n) < 0.2, np.nan, rng.random(n)),
+            "strings": pd.Series(rng.choice(list("xyz"), size=n)).where(
+                rng.random(n) > 0.2
+            ),
+            "flag": rng.random(n) < 0.7,
+        }
+    )
+    t = ibis.pandas.connect({"t": df}).table("t")
+
+    if window:
+        expr = t.mutate(result=reduction(t).over(group_by="key"))
+    else:
+        expr = t.group_by("key").agg(result=reduction(t)).order_by("key")
+    result = expr.execute()
+
+    # compare against applying the reduction to every group separately
+    monkeypatch.setattr(PandasExecutor, "group_kernel", lambda op, df: None)
+    expected = expr.execute()
+
+    # integers are compared with a tolerance by default
+    exact = expected.result.dtype.kind in "iu"
+    tm.assert_frame_equal(result, expected, check_exact=exact)
+
+
 @pytest.mark.parametrize("reduction", ["mean", "sum", "count", "std", "var"])
 @pytest.mark.parametrize(
     "where",
@@ -11,6 +11,7 @@ import pytest
 import ibis
 import ibis.expr.datatypes as dt
 from ibis.backends.pandas import Backend
+from ibis.backends.pandas.executor import PandasExecutor
 from ibis.backends.pandas.tests.conftest import TestConf as tm
 from ibis.legacy.udf.vectorized import reduction
 
@@ -639,3 +640,72 @@ event_id measured_on  measurement  grouper  bfill
         parse_dates=["measured_on"],
     )
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "window",
+    [
+        pytest.param(dict(preceding=2, following=0), id="trailing"),
+        pytest.param(dict(preceding=1, following=3), id="centered"),
+        pytest.param(dict(preceding=0, following=None), id="reverse_expanding"),
+    ],
+)
+@pytest.mark.parametrize("how", ["rows", "range"])
+@pytest.mark.parametrize("group_by", [None, "key"])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize(
+    "reduction",
+    [
+        pytest.param(lambda t: t.value.sum(), id="sum"),
+        pytest.param(lambda t: t.ints.sum(where=t.flag), id="sum_where"),
+        pytest.param(lambda t: t.value.mean(), id="mean"),
+        pytest.param(lambda t: t.value.min(), id="min"),
+        pytest.param(lambda t: t.value.count(), id="count"),
+        pytest.param(lambda t: t.value.std(), id="std"),
+        pytest.param(lambda t: t.value.first(), id="first"),
+        pytest.param(lambda t: t.ints.last(), id="last"),
+    ],
+)
+def test_vectorized_window_reductions(
+    monkeypatch, window, how, group_by, ascending, reduction
+):
+    n = 50
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "key": rng.choice(list("abc"), size=n),
+            "order": rng.permutation(n) // 2,
+            "value": np.where(rng.random(n) < 0.2, np.nan, rng.random(n)),
+            "ints": rng.integers(-10, 10, size=n),
+            "flag": rng.random(n) < 0.7,
+        }
+    )
+    t = ibis.pandas.connect({"t": df}).table("t")
+
+    order_by = t.order if ascending else t.order.desc()
+    make_window = ibis.rows_window if how == "rows" else ibis.range_window
+    w = make_window(group_by=group_by, order_by=order_by, **window)
+    expr = t.mutate(result=reduction(t).over(w)).order_by("key", "order", "ints")
+    result = expr.execute()
+
+    # compare against evaluating the reduction for every row separately
+    monkeypatch.setattr(PandasExecutor, "window_kernel", lambda op: None)
+    expected = expr.execute()
+
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["rows", "range"])
+def test_vectorized_window_min_max_integers_exact(how):
+    # beyond 2**53 not every integer is exactly representable as a float
+    big = 2**53
+    df = pd.DataFrame({"order": range(5), "value": big + np.arange(1, 6)})
+    t = ibis.pandas.connect({"t": df}).table("t")
+
+    make_window = ibis.rows_window if how == "rows" else ibis.range_window
+    w = make_window(order_by=t.order, preceding=2, following=0)
+    expr = t.mutate(lo=t.value.min().over(w), hi=t.value.max().over(w))
+    result = expr.execute()
+
+    expected = df.assign(lo=big + np.array([1, 1, 1, 2, 3]), hi=big + np.arange(1, 6))
+    tm.assert_frame_equal(result, expected, check_exact=True)
@@ -18,13 +18,13 @@ from ibis.backends.pandas.rewrites import (
     replace_parameter,
     rewrite_join,
 )
-from ibis.backends.polars.compiler import translate
+from ibis.backends.polars.compiler import python_callback, translate
 from ibis.backends.sql.dialects import Polars
 from ibis.formats.polars import PolarsSchema
 from ibis.util import gen_name, normalize_filename
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     import pandas as pd
     import pyarrow as pa
@@ -406,6 +406,26 @@ class Backend(BaseBackend, NoUrl):
 
         return translate(node, ctx=self._context)
 
+    def python_callbacks(self, expr: ir.Expr) -> list[ops.Node]:
+        """Return the operations of an expression computed by python callbacks.
+
+        Python callbacks hold the GIL and are opaque to the polars query
+        optimizer, so the parts of a query using them are computed single
+        threaded and block optimizations like predicate pushdown.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to check.
+
+        Returns
+        -------
+        list[ops.Node]
+            The operations which are translated to python callbacks.
+
+        """
+        return expr.op().find(python_callback)
+
     def _get_sql_string_view_schema(self, name, table, query) -> sch.Schema:
         raise NotImplementedError("table.sql() not yet supported in polars")
 
@@ -500,9 +520,22 @@ class Backend(BaseBackend, NoUrl):
         chunk_size: int = 1_000_000,
         **kwargs: Any,
     ):
-        self._import_pyarrow()
-        table = self._to_pyarrow_table(expr, params=params, limit=limit, **kwargs)
-        return table.to_reader(chunk_size)
+        pa = self._import_pyarrow()
+
+        # the streaming engine computes the result in chunks, falling back to
+        # the default engine for queries it doesn't support; the result is
+        # then converted to arrow one slice at a time rather than all at once
+        df = self._to_dataframe(
+            expr, params=params, limit=limit, streaming=True, **kwargs
+        )
+        schema = expr.as_table().schema().to_pyarrow()
+        return pa.RecordBatchReader.from_batches(
+            schema, _arrow_batches(df, schema, chunk_size)
+        )
+
+    def _is_ephemeral(self, op: ops.DatabaseTable) -> bool:
+        # the tables are frames of the process
+        return True
 
     def _load_into_cache(self, name, expr):
         self.create_table(name, self.compile(expr).cache())
@@ -518,3 +551,11 @@ class Backend(BaseBackend, NoUrl):
 
     def drop_view(self, *_, **__) -> ir.Table:
         raise NotImplementedError(self.name)
+
+
+def _arrow_batches(
+    df: pl.DataFrame, schema: pa.Schema, chunk_size: int
+) -> Iterator[pa.RecordBatch]:
+    for frame in df.iter_slices(chunk_size):
+        table = frame.to_arrow().rename_columns(schema.names).cast(schema)
+        yield from table.to_batches(max_chunksize=chunk_size)
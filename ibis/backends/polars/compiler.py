@@ -537,9 +537,15 @@ def string_unary(op, **kw):
     return method()
 
 
+# not available in older versions of polars
+_native_string_reverse = hasattr(pl.col("").str, "reverse")
+
+
 @translate.register(ops.Reverse)
 def reverse(op, **kw):
     arg = translate(op.arg, **kw)
+    if _native_string_reverse:
+        return arg.str.reverse()
     return arg.map_elements(lambda x: x[::-1])
 
 
@@ -895,14 +901,14 @@ def date_from_ymd(op, **kw):
 def atan2(op, **kw):
     left = translate(op.left, **kw)
     right = translate(op.right, **kw)
-    return pl.map_batches([left, right], lambda cols: np.arctan2(cols[0], cols[1]))
+    return pl.arctan2(left, right)
 
 
 @translate.register(ops.Modulus)
 def modulus(op, **kw):
     left = translate(op.left, **kw)
     right = translate(op.right, **kw)
-    return pl.map_batches([left, right], lambda cols: np.mod(cols[0], cols[1]))
+    return left % right
 
 
 @translate.register(ops.TimestampFromYMDHMS)
@@ -1095,36 +1101,57 @@ def between(op, **kw):
 
 
 _bitwise_binops = {
+    ops.BitwiseOr: operator.or_,
+    ops.BitwiseAnd: operator.and_,
+    ops.BitwiseXor: operator.xor,
+}
+
+_bitwise_shifts = {
     ops.BitwiseRightShift: np.right_shift,
     ops.BitwiseLeftShift: np.left_shift,
-    ops.BitwiseOr: np.bitwise_or,
-    ops.BitwiseAnd: np.bitwise_and,
-    ops.BitwiseXor: np.bitwise_xor,
 }
 
 
+def _shift_factor(op):
+    """Return the power of two a shift multiplies or divides by.
+
+    Returns None if the number of bits isn't a literal, or if the power of
+    two doesn't fit in the result type.
+    """
+    if not isinstance(op.right, ops.Literal):
+        return None
+    bits = op.right.value
+    if bits is None or not 0 <= bits < op.dtype.nbytes * 8 - 1:
+        return None
+    return 2**bits
+
+
 @translate.register(ops.BitwiseBinary)
 def bitwise_binops(op, **kw):
-    ufunc = _bitwise_binops.get(type(op))
-    if ufunc is None:
+    if type(op) not in _bitwise_binops and type(op) not in _bitwise_shifts:
         raise com.OperationNotDefinedError(f"{type(op).__name__} not supported")
-    left = translate(op.left, **kw)
-    right = translate(op.right, **kw)
 
-    if isinstance(op.right, ops.Literal):
-        result = left.map_batches(lambda col: ufunc(col, op.right.value))
-    elif isinstance(op.left, ops.Literal):
-        result = right.map_batches(lambda col: ufunc(op.left.value, col))
-    else:
-        result = pl.map_batches([left, right], lambda cols: ufunc(cols[0], cols[1]))
+    dtype = PolarsType.from_ibis(op.dtype)
+    left = translate(op.left, **kw).cast(dtype)
+    right = translate(op.right, **kw).cast(dtype)
 
-    return result.cast(PolarsType.from_ibis(op.dtype))
+    if (func := _bitwise_binops.get(type(op))) is not None:
+        return func(left, right)
+    elif (factor := _shift_factor(op)) is None:
+        ufunc = _bitwise_shifts[type(op)]
+        result = pl.map_batches([left, right], lambda cols: ufunc(cols[0], cols[1]))
+        return result.cast(dtype)
+    elif isinstance(op, ops.BitwiseLeftShift):
+        # integer multiplication wraps around like shifting does
+        return left * pl.lit(factor, dtype)
+    else:
+        return left // pl.lit(factor, dtype)
 
 
 @translate.register(ops.BitwiseNot)
 def bitwise_not(op, **kw):
     arg = translate(op.arg, **kw)
-    return arg.map_batches(lambda x: np.invert(x))
+    return ~arg
 
 
 _binops = {
@@ -1353,3 +1380,35 @@ def execute_timestamp_range(op, **kw):
     start = translate(op.start, **kw)
     stop = translate(op.stop, **kw)
     return pl.datetime_ranges(start, stop, f"{step}{unit}", closed="left")
+
+
+@singledispatch
+def python_callback(op) -> bool:
+    """Whether an operation is translated to a python callback.
+
+    Callbacks hold the GIL and are opaque to the polars query optimizer, so
+    they're computed single threaded and block optimizations like predicate
+    pushdown and streaming.
+    """
+    return False
+
+
+@python_callback.register(ops.ElementWiseVectorizedUDF)
+@python_callback.register(ops.RegexSplit)
+def python_callback_always(op):
+    return True
+
+
+@python_callback.register(ops.ScalarUDF)
+def python_callback_scalar_udf(op):
+    return op.__input_type__ in _UDF_INVOKERS
+
+
+@python_callback.register(ops.Reverse)
+def python_callback_reverse(op):
+    return not _native_string_reverse
+
+
+@python_callback.register(ops.BitwiseBinary)
+def python_callback_bitwise(op):
+    return type(op) in _bitwise_shifts and _shift_factor(op) is None
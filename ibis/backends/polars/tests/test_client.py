@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import ibis
+
+pl = pytest.importorskip("polars")
+
+
+@pytest.fixture
+def con():
+    return ibis.polars.connect(
+        {"t": pl.DataFrame({"a": list(range(10)), "b": list("abcdefghij")})}
+    )
+
+
+@pytest.mark.parametrize(
+    "transform",
+    [
+        pytest.param(lambda t: t.filter(t.a > 2), id="streaming"),
+        pytest.param(lambda t: t.order_by(ibis.desc("a")), id="fallback"),
+    ],
+)
+def test_to_pyarrow_batches(con, transform):
+    expr = transform(con.table("t")).mutate(c=lambda t: t.a * 2)
+    reader = con.to_pyarrow_batches(expr, chunk_size=3)
+    assert reader.schema == expr.schema().to_pyarrow()
+
+    batches = list(reader)
+    assert all(batch.num_rows <= 3 for batch in batches)
+
+    expected = con.to_pyarrow(expr)
+    assert pa.Table.from_batches(batches, schema=reader.schema).equals(expected)
+
+
+def test_to_pyarrow_batches_streaming(con, tmp_path, mocker):
+    path = tmp_path / "t.parquet"
+    pq.write_table(pa.table({"a": np.arange(100_000)}), path, row_group_size=10_000)
+    t = con.read_parquet(path)
+    expr = t.filter(t.a % 2 == 0)
+
+    collect = mocker.spy(pl.LazyFrame, "collect")
+    to_arrow = mocker.spy(pl.DataFrame, "to_arrow")
+    reader = con.to_pyarrow_batches(expr, chunk_size=1_000)
+    assert collect.call_args.kwargs["streaming"]
+
+    # the result is converted to arrow one slice at a time
+    assert reader.read_next_batch().num_rows == 1_000
+    assert to_arrow.call_count == 1
+    assert to_arrow.spy_return.num_rows == 1_000
+
+    result = pa.Table.from_batches(reader)
+    assert result.column("a").to_pylist() == list(range(2_000, 100_000, 2))
+
+
+def test_to_pyarrow_batches_error(con, tmp_path):
+    path = tmp_path / "t.parquet"
+    pq.write_table(pa.table({"a": ["x", "y"]}), path)
+    t = con.read_parquet(path)
+
+    with pytest.raises(pl.exceptions.ComputeError):
+        con.to_pyarrow_batches(t.select(b=t.a.cast("int64"))).read_all()
+
+
+def test_python_callbacks(con):
+    t = con.table("t")
+
+    @ibis.udf.scalar.python
+    def double(x: int) -> int:
+        return 2 * x
+
+    native = t.select(
+        t.b.reverse(), t.a % 3, t.a.atan2(1), t.a & 6, ~t.a, t.a << 2, t.a >> 1
+    )
+    assert con.python_callbacks(native) == []
+
+    udf, shift = double(t.a), t.a << t.a
+    callbacks = con.python_callbacks(t.select(x=udf, y=shift))
+    assert set(callbacks) == {udf.op(), shift.op()}
+
+
+def test_bitwise_shift_by_literal(con):
+    t = con.table("t")
+    expr = t.select(
+        left=t.a << 3, right=(t.a - 5) >> 2, big=t.a << 62, column=t.a << t.a
+    )
+    result = con.execute(expr)
+
+    a = np.arange(10)
+    assert result.left.tolist() == np.left_shift(a, 3).tolist()
+    assert result.right.tolist() == np.right_shift(a - 5, 2).tolist()
+    assert result.big.tolist() == np.left_shift(a, 62).tolist()
+    assert result.column.tolist() == np.left_shift(a, a).tolist()
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import inspect
+import io
 import textwrap
 from functools import partial
 from itertools import repeat, takewhile
@@ -30,6 +32,8 @@ from ibis.backends.sql.compiler import TRUE, C, ColGen, F
 from ibis.common.exceptions import InvalidDecoratorError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     import pandas as pd
     import pyarrow as pa
 
@@ -44,6 +48,12 @@ class Backend(SQLBackend):
     name = "postgres"
     compiler = PostgresCompiler()
     supports_python_udfs = True
+    supports_bound_parameters = True
+    _bulk_insert = True
+    _insert_placeholder = "%s"
+    # psycopg2 interpolates parameters client side, so this only bounds the
+    # size of the fallback VALUES statements
+    _max_insert_params = 2**15
 
     def _from_url(self, url: str, **kwargs):
         """Connect to a backend using a URL `url`.
@@ -101,7 +111,19 @@ class Backend(SQLBackend):
 
         return self.connect(**kwargs)
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _is_ephemeral(self, op: ops.DatabaseTable) -> bool:
+        # temporary tables only live in the session and are looked up first
+        name = sg.table(op.name, db=op.namespace.schema, quoted=True).sql(self.dialect)
+        query = (
+            "SELECT coalesce("
+            "(SELECT relpersistence = 't' FROM pg_class WHERE oid = to_regclass(%s)), "
+            "TRUE)"
+        )
+        with self._safe_raw_sql(query, vars=(name,)) as cur:
+            [(result,)] = cur.fetchall()
+        return result
+
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         schema = op.schema
         if null_columns := [col for col, dtype in schema.items() if dtype.is_null()]:
             raise exc.IbisTypeError(
@@ -138,33 +160,57 @@ class Backend(SQLBackend):
             )
             create_stmt_sql = create_stmt.sql(self.dialect)
 
-            columns = schema.keys()
-            df = op.data.to_frame()
-            data = df.itertuples(index=False)
-            cols = ", ".join(
-                ident.sql(self.dialect)
-                for ident in map(partial(sg.to_identifier, quoted=quoted), columns)
-            )
-            specs = ", ".join(repeat("%s", len(columns)))
             table = sg.table(name, quoted=quoted)
-            sql = f"INSERT INTO {table.sql(self.dialect)} ({cols}) VALUES ({specs})"
             with self.begin() as cur:
                 cur.execute(create_stmt_sql)
-                extras.execute_batch(cur, sql, data, 128)
+                self._insert_arrow(cur, table, op.data.to_pyarrow(schema))
+            return True
+        return False
+
+    def _insert_arrow(
+        self,
+        cursor,
+        table: sge.Table,
+        data: pa.Table,
+        columns: Iterable[str] | None = None,
+    ) -> None:
+        """Bulk load `data` into `table` with `COPY ... FROM STDIN`.
+
+        The data is written as CSV by pyarrow, skipping the construction of
+        a Python object per value. Data with types that don't round trip
+        through CSV is inserted with multi-row `VALUES` statements instead.
+        """
+        import pyarrow.csv as pcsv
+
+        if not data.num_rows:
+            return
+
+        if not all(map(_is_csv_roundtrippable, sch.schema(data.schema).types)):
+            super()._insert_arrow(cursor, table, data, columns=columns)
+            return
+
+        target = self._insert_target(table, data, columns)
+
+        # arrow writes nulls as unquoted empty fields and always quotes
+        # strings, matching how postgres' CSV format tells NULL and '' apart
+        buf = io.BytesIO()
+        pcsv.write_csv(data, buf, pcsv.WriteOptions(include_header=False))
+        buf.seek(0)
+        cursor.copy_expert(f"COPY {target} FROM STDIN WITH (FORMAT csv)", buf)
 
     @contextlib.contextmanager
     def begin(self):
-        con = self.con
-        cursor = con.cursor()
-        try:
-            yield cursor
-        except Exception:
-            con.rollback()
-            raise
-        else:
-            con.commit()
-        finally:
-            cursor.close()
+        with self._checkout() as con:
+            cursor = con.cursor()
+            try:
+                yield cursor
+            except Exception:
+                con.rollback()
+                raise
+            else:
+                con.commit()
+            finally:
+                cursor.close()
 
     def _fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
         import pandas as pd
@@ -185,6 +231,84 @@ class Backend(SQLBackend):
         df = PostgresPandasData.convert_table(df, schema)
         return df
 
+    def _copy_to_pyarrow(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1_000_000,
+    ) -> pa.ipc.RecordBatchReader | None:
+        """Fetch the result of `expr` in bulk with `COPY ... TO STDOUT`.
+
+        The CSV output of the server is parsed by pyarrow directly, skipping
+        the construction of a Python object per value. This doesn't stream:
+        the whole CSV output is buffered in memory before the first batch is
+        returned, batches are then parsed from it as they are consumed.
+
+        Returns `None` if the result has types that don't round trip through
+        CSV. Values pyarrow fails to parse, such as infinite or BC timestamps,
+        raise; the cursor path can't represent them either.
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pcsv
+
+        schema = expr.as_table().schema()
+        if not all(map(_is_csv_roundtrippable, schema.types)):
+            return None
+
+        self._run_pre_execute_hooks(expr)
+        sql = self.compile(expr, limit=limit, params=params)
+        buf = io.BytesIO()
+        with self.begin() as cur:
+            cur.copy_expert(f"COPY ({sql}) TO STDOUT WITH (FORMAT csv)", buf)
+
+        arrow_schema = schema.to_pyarrow()
+        if not buf.tell():
+            return pa.RecordBatchReader.from_batches(arrow_schema, [])
+
+        buf.seek(0)
+        reader = pcsv.open_csv(
+            buf,
+            read_options=pcsv.ReadOptions(column_names=arrow_schema.names),
+            parse_options=pcsv.ParseOptions(newlines_in_values=True),
+            convert_options=pcsv.ConvertOptions(
+                column_types=arrow_schema,
+                # NULLs are unquoted empty fields, empty strings are quoted
+                null_values=[""],
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=False,
+                true_values=["t"],
+                false_values=["f"],
+            ),
+        )
+
+        def batches():
+            for batch in reader:
+                for offset in range(0, batch.num_rows, chunk_size):
+                    yield batch.slice(offset, chunk_size)
+
+        return pa.RecordBatchReader.from_batches(arrow_schema, batches())
+
+    @util.experimental
+    def to_pyarrow_batches(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1_000_000,
+        **kwargs: Any,
+    ) -> pa.ipc.RecordBatchReader:
+        reader = self._copy_to_pyarrow(
+            expr, params=params, limit=limit, chunk_size=chunk_size
+        )
+        if reader is None:
+            return super().to_pyarrow_batches(
+                expr, params=params, limit=limit, chunk_size=chunk_size, **kwargs
+            )
+        return reader
+
     @property
     def version(self):
         version = f"{self.con.server_version:0>6}"
@@ -205,6 +329,7 @@ class Backend(SQLBackend):
         port: int = 5432,
         database: str | None = None,
         schema: str | None = None,
+        pool_size: int | None = None,
         **kwargs: Any,
     ) -> None:
         """Create an Ibis client connected to PostgreSQL database.
@@ -223,6 +348,9 @@ class Backend(SQLBackend):
             Database to connect to
         schema
             PostgreSQL schema to use. If `None`, use the default `search_path`.
+        pool_size
+            If given, run queries on a pool of at most this many connections,
+            so that multiple threads can use the backend at the same time.
         kwargs
             Additional keyword arguments to pass to the backend client connection.
 
@@ -259,7 +387,8 @@ class Backend(SQLBackend):
 
         """
         psycopg2.extras.register_default_json(loads=lambda x: x)
-        self.con = psycopg2.connect(
+        connect = partial(
+            psycopg2.connect,
             host=host,
             port=port,
             user=user,
@@ -268,9 +397,22 @@ class Backend(SQLBackend):
             options=(f"-csearch_path={schema}" * (schema is not None)) or None,
             **kwargs,
         )
+        self._init_connections(connect, pool_size)
 
-        with self.begin() as cur:
+    def _setup_connection(self, con: psycopg2.extensions.connection):
+        with con.cursor() as cur:
             cur.execute("SET TIMEZONE = UTC")
+        con.commit()
+        return con
+
+    def _ping(self, con: psycopg2.extensions.connection) -> None:
+        super()._ping(con)
+        # don't leave the connection idle in a transaction
+        con.rollback()
+
+    def _interrupt(self, con: Any = None) -> None:
+        # sends a cancel request to the server over a separate connection
+        (self.con if con is None else con).cancel()
 
     def list_tables(
         self, like: str | None = None, schema: str | None = None
@@ -609,6 +751,10 @@ $$""".format(**self._get_udf_source(udf_node))
 
         if temp:
             properties.append(sge.TemporaryProperty())
+            # the table only exists in the session of the connection that
+            # creates it, so with a pool it's created and read on the
+            # backend's own connection
+            self._temp_tables.add(name)
 
         if obj is not None:
             if not isinstance(obj, ir.Expr):
@@ -693,11 +839,14 @@ $$""".format(**self._get_udf_source(udf_node))
         )
         with self._safe_raw_sql(drop_stmt):
             pass
+        self._forget_memtables(name)
+        self._temp_tables.discard(name)
 
     @contextlib.contextmanager
     def _safe_raw_sql(self, *args, **kwargs):
-        with contextlib.closing(self.raw_sql(*args, **kwargs)) as result:
-            yield result
+        with self._checkout():
+            with contextlib.closing(self.raw_sql(*args, **kwargs)) as result:
+                yield result
 
     def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
         with contextlib.suppress(AttributeError):
@@ -719,15 +868,44 @@ $$""".format(**self._get_udf_source(udf_node))
             raise
 
         try:
+            if (parameters := kwargs.pop("parameters", None)) is not None:
+                query = self._prepare(cursor, query, len(parameters))
+                kwargs["vars"] = parameters
             cursor.execute(query, **kwargs)
         except Exception:
             con.rollback()
+            if parameters is not None:
+                with contextlib.suppress(psycopg2.Error):
+                    self._sync_prepared(cursor)
             cursor.close()
             raise
         else:
             con.commit()
             return cursor
 
+    def _prepare(self, cursor, query: str, nparams: int) -> str:
+        """Return a statement executing `query`, preparing it first if needed.
+
+        Prepared statements live as long as the session, so each distinct
+        query is only parsed and planned by the server once.
+        """
+        name = f"ibis_{hashlib.sha256(query.encode()).hexdigest()[:32]}"
+        # names of the server-side prepared statements of the session
+        prepared = self._session_state().setdefault("prepared", set())
+        if name not in prepared:
+            cursor.execute(f"PREPARE {name} AS {query}")
+            prepared.add(name)
+        return f"EXECUTE {name} ({', '.join(repeat('%s', nparams))})"
+
+    def _sync_prepared(self, cursor) -> None:
+        """Reload the names of the session's prepared statements.
+
+        Called after a failed parameterized query, when it's unknown whether
+        the statement it prepared survived the rollback.
+        """
+        cursor.execute("SELECT name FROM pg_prepared_statements")
+        self._session_state()["prepared"] = {name for (name,) in cursor.fetchall()}
+
     def _to_sqlglot(
         self, expr: ir.Expr, limit: str | None = None, params=None, **kwargs: Any
     ):
@@ -741,3 +919,14 @@ $$""".format(**self._get_udf_source(udf_node))
         if conversions:
             table_expr = table_expr.mutate(**conversions)
         return super()._to_sqlglot(table_expr, limit=limit, params=params)
+
+
+def _is_csv_roundtrippable(dtype: dt.DataType) -> bool:
+    return (
+        dtype.is_boolean()
+        or dtype.is_integer()
+        or dtype.is_floating()
+        or dtype.is_string()
+        or dtype.is_date()
+        or dtype.is_timestamp()
+    )
@@ -392,6 +392,9 @@ class PostgresCompiler(SQLGlotCompiler):
     def visit_EndsWith(self, op, *, arg, end):
         return self.f.right(arg, self.f.length(end)).eq(end)
 
+    def visit_ScalarParameter(self, op, *, dtype, **_):
+        return self.cast(sge.Parameter(this=sge.convert(op.counter)), dtype)
+
     def visit_NonNullLiteral(self, op, *, value, dtype):
         if dtype.is_binary():
             return self.cast("".join(map(r"\x{:0>2x}".format, value)), dt.binary)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -33,6 +34,12 @@ if TYPE_CHECKING:
     import pyarrow as pa
 
 
+def _arrow_schema(df: DataFrame) -> pa.Schema:
+    from pyspark.sql.pandas.types import to_arrow_schema
+
+    return to_arrow_schema(df.schema)
+
+
 def normalize_filenames(source_list):
     # Promote to list
     source_list = util.promote_list(source_list)
@@ -57,6 +64,7 @@ class _PySparkCursor:
 
         """
         self.query = query
+        self._rows = None
 
     def fetchall(self):
         """Fetch all rows."""
@@ -64,7 +72,14 @@ class _PySparkCursor:
         return result
 
     def fetchmany(self, nrows: int):
-        raise NotImplementedError()
+        """Fetch the next `nrows` rows.
+
+        Rows are computed one partition at a time, so only a single partition
+        of the result is held by the driver.
+        """
+        if self._rows is None:
+            self._rows = self.query.toLocalIterator()
+        return list(itertools.islice(self._rows, nrows))
 
     @property
     def columns(self):
@@ -101,6 +116,12 @@ class Backend(SQLBackend, CanCreateDatabase):
 
         treat_nan_as_null: bool = False
 
+    def _compile_cache_key(self, expr: ir.Expr, **kwargs: Any) -> tuple | None:
+        # the compiled query depends on the `treat_nan_as_null` option
+        if (key := super()._compile_cache_key(expr, **kwargs)) is not None:
+            key += (ibis.options.pyspark.treat_nan_as_null,)
+        return key
+
     def _from_url(self, url: str, **kwargs) -> Backend:
         """Construct a PySpark backend from a URL `url`."""
         from urllib.parse import parse_qs, urlparse
@@ -242,10 +263,11 @@ class Backend(SQLBackend, CanCreateDatabase):
             spark_udf = pandas_udf(udf_func, udf_return, PandasUDFType.GROUPED_AGG)
             self._session.udf.register(udf_name, spark_udf)
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         schema = PySparkSchema.from_ibis(op.schema)
         df = self._session.createDataFrame(data=op.data.to_frame(), schema=schema)
         df.createOrReplaceTempView(op.name)
+        return True
 
     def _fetch_from_cursor(self, cursor, schema):
         df = cursor.query.toPandas()  # blocks until finished
@@ -516,6 +538,9 @@ class Backend(SQLBackend, CanCreateDatabase):
         t.unpersist()
         assert not t.is_cached
 
+    def _clean_up_in_memory_table(self, name: str) -> None:
+        self._session.catalog.dropTempView(name)
+
     def read_delta(
         self,
         source: str | Path,
@@ -744,11 +769,20 @@ class Backend(SQLBackend, CanCreateDatabase):
         from ibis.formats.pyarrow import PyArrowData
 
         table_expr = expr.as_table()
-        output = pa.Table.from_pandas(
-            self.execute(table_expr, params=params, limit=limit, **kwargs),
-            preserve_index=False,
-        )
-        table = PyArrowData.convert_table(output, table_expr.schema())
+        schema = table_expr.schema()
+        if (df := self._arrow_query(table_expr, params, limit, **kwargs)) is not None:
+            batches = df._collect_as_arrow()
+            output = (
+                pa.Table.from_batches(batches)
+                if batches
+                else _arrow_schema(df).empty_table()
+            )
+        else:
+            output = pa.Table.from_pandas(
+                self.execute(table_expr, params=params, limit=limit, **kwargs),
+                preserve_index=False,
+            )
+        table = PyArrowData.convert_table(output, schema)
         return expr.__pyarrow_result__(table)
 
     def to_pyarrow_batches(
@@ -761,9 +795,46 @@ class Backend(SQLBackend, CanCreateDatabase):
         **kwargs: Any,
     ) -> pa.ipc.RecordBatchReader:
         pa = self._import_pyarrow()
-        pa_table = self.to_pyarrow(
-            expr.as_table(), params=params, limit=limit, **kwargs
-        )
-        return pa.RecordBatchReader.from_batches(
-            pa_table.schema, pa_table.to_batches(max_chunksize=chunk_size)
-        )
+
+        from ibis.formats.pyarrow import PyArrowData
+
+        table_expr = expr.as_table()
+        schema = table_expr.schema()
+        if (df := self._arrow_query(table_expr, params, limit, **kwargs)) is None:
+            pa_table = self.to_pyarrow(table_expr, params=params, limit=limit, **kwargs)
+            return pa.RecordBatchReader.from_batches(
+                pa_table.schema, pa_table.to_batches(max_chunksize=chunk_size)
+            )
+
+        def batches():
+            # the query runs once the first batch is read
+            for batch in df._collect_as_arrow():
+                table = PyArrowData.convert_table(
+                    pa.Table.from_batches([batch]), schema
+                )
+                yield from table.to_batches(max_chunksize=chunk_size)
+
+        return pa.RecordBatchReader.from_batches(schema.to_pyarrow(), batches())
+
+    def _arrow_query(
+        self,
+        expr: ir.Table,
+        params: Mapping[ir.Scalar, Any] | None,
+        limit: int | str | None,
+        **kwargs: Any,
+    ) -> DataFrame | None:
+        """Compile `expr` to a Spark DataFrame whose result can be collected as Arrow.
+
+        Collecting as Arrow skips the construction of a `Row` object per row
+        of the result on the driver. Returns `None` if the result has types
+        that Spark can't convert to Arrow.
+        """
+        self._run_pre_execute_hooks(expr)
+        df = self._session.sql(self.compile(expr, params=params, limit=limit, **kwargs))
+        try:
+            _arrow_schema(df)
+        except TypeError:
+            # some types, like nested structs, aren't supported by older
+            # versions of spark's arrow conversion
+            return None
+        return df
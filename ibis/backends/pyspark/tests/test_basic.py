@@ -131,3 +131,45 @@ def test_connect_without_explicit_session():
     con = ibis.pyspark.connect()
     result = con.sql("SELECT CAST(1 AS BIGINT) as foo").to_pandas()
     tm.assert_frame_equal(result, pd.DataFrame({"foo": [1]}))
+
+
+def test_to_pyarrow_skips_rows(t, mocker):
+    from pyspark.sql import DataFrame
+
+    collect = mocker.spy(DataFrame, "collect")
+    to_pandas = mocker.spy(DataFrame, "toPandas")
+
+    result = t.order_by("id").to_pyarrow()
+
+    assert not collect.called
+    assert not to_pandas.called
+    assert result.column("id").to_pylist() == list(range(10))
+    assert result.schema == t.schema().to_pyarrow()
+
+
+def test_to_pyarrow_batches(t):
+    reader = t.order_by("id").to_pyarrow_batches(chunk_size=3)
+
+    assert reader.schema == t.schema().to_pyarrow()
+    batches = list(reader)
+    assert all(len(batch) <= 3 for batch in batches)
+    assert sum(len(batch) for batch in batches) == 10
+
+
+def test_cursor_fetchmany(con):
+    cursor = con.raw_sql("SELECT id FROM basic_table ORDER BY id")
+
+    assert [row.id for row in cursor.fetchmany(4)] == [0, 1, 2, 3]
+    assert [row.id for row in cursor.fetchmany(4)] == [4, 5, 6, 7]
+    assert [row.id for row in cursor.fetchmany(4)] == [8, 9]
+    assert cursor.fetchmany(4) == []
+
+
+def test_memtable(con):
+    t = ibis.memtable({"a": [1, 2, 3], "b": list("xyy")})
+    expr = t.group_by("b").agg(n=t.a.sum()).order_by("b")
+    expected = pd.DataFrame({"b": ["x", "y"], "n": [1, 5]})
+
+    tm.assert_frame_equal(con.execute(expr), expected)
+    # the second execution finds the memtable already registered
+    tm.assert_frame_equal(con.execute(expr), expected)
@@ -2,14 +2,11 @@
 
 from __future__ import annotations
 
-from functools import partial
-from itertools import repeat
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import psycopg2
 import sqlglot as sg
 import sqlglot.expressions as sge
-from psycopg2 import extras
 
 import ibis
 import ibis.common.exceptions as com
@@ -18,6 +15,7 @@ import ibis.expr.types as ir
 from ibis import util
 from ibis.backends.postgres import Backend as PostgresBackend
 from ibis.backends.risingwave.compiler import RisingwaveCompiler
+from ibis.backends.sql import SQLBackend
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -28,6 +26,10 @@ class Backend(PostgresBackend):
     name = "risingwave"
     compiler = RisingwaveCompiler()
     supports_python_udfs = False
+    supports_bound_parameters = False
+
+    # risingwave doesn't support `COPY ... FROM STDIN`
+    _insert_arrow = SQLBackend._insert_arrow
 
     def do_connect(
         self,
@@ -100,6 +102,10 @@ class Backend(PostgresBackend):
         with self.begin() as cur:
             cur.execute("SET TIMEZONE = UTC")
 
+    def _copy_to_pyarrow(self, expr: ir.Expr, **_: Any) -> None:
+        # RisingWave doesn't support `COPY ... TO STDOUT`
+        return None
+
     def create_table(
         self,
         name: str,
@@ -208,7 +214,7 @@ class Backend(PostgresBackend):
             name, schema=schema, source=self, namespace=ops.Namespace(database=database)
         ).to_expr()
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         schema = op.schema
         if null_columns := [col for col, dtype in schema.items() if dtype.is_null()]:
             raise com.IbisTypeError(
@@ -244,16 +250,9 @@ class Backend(PostgresBackend):
             )
             create_stmt_sql = create_stmt.sql(self.dialect)
 
-            columns = schema.keys()
-            df = op.data.to_frame()
-            data = df.itertuples(index=False)
-            cols = ", ".join(
-                ident.sql(self.dialect)
-                for ident in map(partial(sg.to_identifier, quoted=quoted), columns)
-            )
-            specs = ", ".join(repeat("%s", len(columns)))
             table = sg.table(name, quoted=quoted)
-            sql = f"INSERT INTO {table.sql(self.dialect)} ({cols}) VALUES ({specs})"
             with self.begin() as cur:
                 cur.execute(create_stmt_sql)
-                extras.execute_batch(cur, sql, data, 128)
+                self._insert_arrow(cur, table, op.data.to_pyarrow(schema))
+            return True
+        return False
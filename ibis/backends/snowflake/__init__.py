@@ -568,7 +568,7 @@ $$"""
 
         return self._filter_with_like(tables + views, like=like)
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         import pyarrow.parquet as pq
 
         raw_name = op.name
@@ -587,6 +587,8 @@ $$"""
                 finally:
                     with contextlib.suppress(Exception):
                         shutil.rmtree(tmpdir.name)
+                return True
+            return False
 
     def create_database(self, name: str, force: bool = False) -> None:
         current_database = self.current_database
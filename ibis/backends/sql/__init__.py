@@ -1,26 +1,35 @@
 from __future__ import annotations
 
 import abc
+import contextlib
+import threading
+import weakref
+from itertools import repeat
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import sqlglot as sg
 import sqlglot.expressions as sge
 
 import ibis
+import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import BaseBackend
 from ibis.backends.sql.compiler import STAR
+from ibis.backends.sql.pool import ConnectionPool
+from ibis.backends.sql.rewrites import BIND
+from ibis.common.caching import LRUCache
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     import pandas as pd
     import pyarrow as pa
 
     from ibis.backends.sql.compiler import SQLGlotCompiler
+    from ibis.common.caching import CacheInfo
     from ibis.expr.schema import SchemaLike
 
 
@@ -28,6 +37,163 @@ class SQLBackend(BaseBackend):
     compiler: ClassVar[SQLGlotCompiler]
     name: ClassVar[str]
 
+    # whether the driver can bind scalar parameter values compiled to
+    # positional placeholders, see `ibis.options.sql.bind_params`
+    supports_bound_parameters = False
+
+    # whether `insert` loads in-memory data with `_insert_arrow` rather than
+    # registering it as a memtable and inserting from that
+    _bulk_insert: ClassVar[bool] = False
+    # DB-API placeholder for the positional parameters of bulk inserts
+    _insert_placeholder: ClassVar[str] = "?"
+    # maximum number of parameters a single statement can bind and maximum
+    # number of rows of a VALUES clause; bulk inserts are split into chunks
+    # that respect both
+    _max_insert_params: ClassVar[int] = 999
+    _max_insert_rows: ClassVar[int | None] = None
+
+    # whether memtables are uploaded as session scoped temporary tables, which
+    # must be uploaded again on every pooled connection that uses them
+    _session_memtables: ClassVar[bool] = True
+    # seconds an idle pooled connection can go without a health check
+    _pool_ping_after: ClassVar[float] = 30.0
+    _pool: ConnectionPool | None = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # compiled SQL strings keyed on the (immutable) expression node
+        self._compile_cache = LRUCache(maxsize=ibis.options.sql.compile_cache_size)
+        # memtables uploaded over the current connection, mapped to the
+        # finalizers that schedule dropping them once their node is collected
+        self._memtables: dict[str, weakref.finalize] = {}
+        self._collected_memtables: list[str] = []
+        # the pooled connection checked out by each thread, if any
+        self._local = threading.local()
+        # the same, keyed on the thread's identifier so that other threads
+        # can interrupt its queries
+        self._checked_out: dict[int, Any] = {}
+        # state of the session of the backend's own connection, see
+        # `_session_state`
+        self._session_info = {}
+        # temporary tables created on the backend's own connection, see
+        # `_checkout`
+        self._temp_tables: set[str] = set()
+
+    @property
+    def con(self) -> Any:
+        """The driver connection used by the current thread."""
+        try:
+            return self._local.con
+        except AttributeError:
+            return self._con
+
+    @con.setter
+    def con(self, con: Any) -> None:
+        self._con = con
+
+    def _init_connections(
+        self, connect: Callable[[], Any], pool_size: int | None = None
+    ) -> None:
+        """Open the backend's connection with `connect`.
+
+        If `pool_size` is given, queries are run on a pool of at most that
+        many additional connections instead, see `_checkout`. Every connection
+        is set up with `_setup_connection`.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        self.con = self._setup_connection(connect())
+        self._session_info = {}
+        self._temp_tables = set()
+        if pool_size is not None:
+            self._pool = ConnectionPool(
+                lambda: self._setup_connection(connect()),
+                size=int(pool_size),
+                ping=self._ping,
+                ping_after=self._pool_ping_after,
+            )
+
+    def _setup_connection(self, con: Any) -> Any:
+        """Apply the session settings to a newly opened connection."""
+        return con
+
+    def _ping(self, con: Any) -> None:
+        """Raise an exception if `con` can no longer be used."""
+        cur = con.cursor()
+        try:
+            cur.execute("SELECT 1")
+            cur.fetchall()
+        finally:
+            cur.close()
+
+    @contextlib.contextmanager
+    def _checkout(self) -> Iterator[Any]:
+        """Run the queries of the enclosed block on a single connection.
+
+        Without a pool that's the backend's connection. With a pool, a
+        connection is checked out for the duration of the block, unless the
+        current thread already holds one, and its session is brought up to
+        date with the backend's state first, see `_sync_session`.
+
+        Temporary tables are only visible to the session that created them,
+        so while the backend has any, the block runs on the backend's own
+        connection as if there were no pool.
+        """
+        if self._pool is None or hasattr(self._local, "con"):
+            yield self.con
+        elif self._temp_tables:
+            self._sync_session()
+            yield self._con
+        else:
+            thread = threading.get_ident()
+            with self._pool.connection() as con, self._use_connection(con):
+                self._checked_out[thread] = con
+                try:
+                    self._sync_session()
+                    yield con
+                finally:
+                    del self._checked_out[thread]
+
+    @contextlib.contextmanager
+    def _use_connection(self, con: Any) -> Iterator[Any]:
+        """Route the queries of the current thread to `con`."""
+        local = self._local
+        previous = getattr(local, "con", None)
+        local.con = con
+        try:
+            yield con
+        finally:
+            if previous is None:
+                del local.con
+            else:
+                local.con = previous
+
+    def _session_state(self) -> dict[str, Any]:
+        """Return the state of the current thread's connection session."""
+        if self._pool is not None and (con := getattr(self._local, "con", None)):
+            return self._pool.state(con)
+        return self._session_info
+
+    def _sync_session(self) -> None:
+        """Upload and drop memtables so a pooled session matches the backend.
+
+        Memtables registered on another connection are uploaded again, and
+        those dropped since the session last synced are dropped from it.
+        """
+        if not self._session_memtables:
+            return
+        uploaded = self._session_state().setdefault("memtables", set())
+        memtables = self._memtables
+        for name in uploaded.difference(memtables):
+            uploaded.discard(name)
+            with contextlib.suppress(Exception):
+                self._clean_up_in_memory_table(name)
+        for name, finalizer in list(memtables.items()):
+            if name not in uploaded and (alive := finalizer.peek()) is not None:
+                if self._register_in_memory_table(alive[0]):
+                    uploaded.add(name)
+
     @property
     def dialect(self) -> sg.Dialect:
         return self.compiler.dialect
@@ -120,11 +286,102 @@ class SQLBackend(BaseBackend):
         **kwargs: Any,
     ):
         """Compile an Ibis expression to a SQL string."""
-        query = self._to_sqlglot(expr, limit=limit, params=params, **kwargs)
-        sql = query.sql(dialect=self.dialect, pretty=pretty, copy=False)
+        if limit == "default":
+            limit = ibis.options.sql.default_limit
+
+        key = self._compile_cache_key(
+            expr, limit=limit, params=params, pretty=pretty, **kwargs
+        )
+        if key is None or (sql := self._compile_cache.get(key)) is None:
+            query = self._to_sqlglot(expr, limit=limit, params=params, **kwargs)
+            sql = query.sql(dialect=self.dialect, pretty=pretty, copy=False)
+            if key is not None:
+                self._compile_cache[key] = sql
         self._log(sql)
         return sql
 
+    def _compile_cache_key(
+        self, expr: ir.Expr, *, limit, params, pretty: bool, **kwargs: Any
+    ) -> tuple | None:
+        """Construct the compiled SQL cache key for `expr`.
+
+        Returns `None` if any of the inputs are unhashable, in which case the
+        query isn't cached. Backends whose compilation output depends on
+        options should include those options in the key.
+        """
+        if params:
+            # include the type of the value to avoid conflating values that
+            # compare equal, like `1` and `True`
+            params = frozenset(
+                (param.op(), type(value), value) for param, value in params.items()
+            )
+        key = (expr.op(), limit, params or None, pretty, frozenset(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _compile_parameterized(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping | None = None,
+        limit: str | None = None,
+        **kwargs: Any,
+    ) -> tuple[str, dict[str, list]]:
+        """Compile `expr` along with the arguments needed to bind its parameters.
+
+        When `ibis.options.sql.bind_params` is enabled and the backend supports
+        it, scalar parameters are compiled to positional placeholders and their
+        values are returned as the `parameters` keyword argument of `raw_sql`.
+        Otherwise, or if any parameter has a type that drivers can't reliably
+        bind, the parameter values are inlined into the query and the returned
+        keyword arguments are empty.
+        """
+        op = expr.op()
+        if not (
+            params
+            and self.supports_bound_parameters
+            and ibis.options.sql.bind_params
+            and all(_is_bindable(node.dtype) for node in op.find(ops.ScalarParameter))
+        ):
+            return self.compile(expr, params=params, limit=limit, **kwargs), {}
+
+        values = self.compiler._prepare_params(params)
+
+        # number the parameters by creation order starting from one, this way
+        # equivalent queries compile to the same SQL regardless of which
+        # parameter objects they were built with
+        nodes = sorted(op.find(ops.ScalarParameter), key=lambda node: node.counter)
+        replacements = {
+            node: ops.ScalarParameter(node.dtype, counter=position)
+            for position, node in enumerate(nodes, start=1)
+        }
+        sql = self.compile(
+            op.replace(replacements).to_expr(),
+            params={node.to_expr(): BIND for node in replacements.values()},
+            limit=limit,
+            **kwargs,
+        )
+        parameters = [dt.normalize(node.dtype, values[node]) for node in nodes]
+        return sql, {"parameters": parameters}
+
+    def compile_cache_info(self) -> CacheInfo:
+        """Return statistics about this backend's compiled SQL cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of `hits`, `misses`, `maxsize` and `currsize`.
+
+        """
+        return self._compile_cache.info()
+
+    def clear_compile_cache(self) -> None:
+        """Remove all entries and reset statistics of the compiled SQL cache."""
+        self._compile_cache.clear()
+
     def _log(self, sql: str) -> None:
         """Log `sql`.
 
@@ -198,8 +455,112 @@ class SQLBackend(BaseBackend):
         return self.table(name, database=database)
 
     def _register_in_memory_tables(self, expr: ir.Expr) -> None:
-        for memtable in expr.op().find(ops.InMemoryTable):
-            self._register_in_memory_table(memtable)
+        with self._checkout():
+            self._drop_collected_memtables()
+
+            memtables = self._memtables
+            uploaded = self._session_state().setdefault("memtables", set())
+            for memtable in expr.op().find(ops.InMemoryTable):
+                if (name := memtable.name) in memtables:
+                    continue
+                # only tables created by the backend are tracked, so that an
+                # existing table of the same name is never dropped
+                if self._register_in_memory_table(memtable):
+                    # the finalizer must not reference the backend, otherwise
+                    # the memtable would keep the connection alive
+                    finalizer = weakref.finalize(
+                        memtable, self._collected_memtables.append, name
+                    )
+                    finalizer.atexit = False
+                    memtables[name] = finalizer
+                    uploaded.add(name)
+
+    def _drop_collected_memtables(self) -> None:
+        """Drop the uploaded memtables whose nodes have been collected.
+
+        Dropping is deferred to the next execution rather than done from the
+        finalizer, because the garbage collector may run while the connection
+        is in the middle of another statement.
+        """
+        collected = self._collected_memtables
+        while collected:
+            name = collected.pop()
+            if self._memtables.pop(name, None) is not None:
+                self._session_state().get("memtables", set()).discard(name)
+                with contextlib.suppress(Exception):
+                    self._clean_up_in_memory_table(name)
+
+    def _forget_memtables(self, *names: str) -> None:
+        """Remove `names`, or all memtables if none are given, from the registry.
+
+        Forgotten memtables are uploaded again the next time they're used.
+        """
+        memtables = self._memtables
+        for name in names or list(memtables):
+            if (finalizer := memtables.pop(name, None)) is not None:
+                finalizer.detach()
+
+    def _clean_up_in_memory_table(self, name: str) -> None:
+        self.drop_table(name, force=True)
+
+    def _insert_arrow(
+        self,
+        cursor,
+        table: sge.Table,
+        data: pa.Table,
+        columns: Iterable[str] | None = None,
+    ) -> None:
+        """Bulk load `data` into the existing `table` using `cursor`.
+
+        Rows are inserted with multi-row `INSERT ... VALUES` statements, each
+        binding as many parameters as the driver allows. Values are bound
+        column by column straight from the Arrow data. Backends with a faster
+        loading mechanism override this method.
+
+        Parameters
+        ----------
+        cursor
+            DB-API cursor to execute the statements with
+        table
+            Table to insert into
+        data
+            Rows to insert
+        columns
+            Names of the columns of `table` to insert into, defaults to the
+            column names of `data`
+
+        """
+        if not (ncols := data.num_columns) or not data.num_rows:
+            return
+
+        target = self._insert_target(table, data, columns)
+        chunksize = max(self._max_insert_params // ncols, 1)
+        if self._max_insert_rows is not None:
+            chunksize = min(chunksize, self._max_insert_rows)
+
+        row = f"({', '.join(repeat(self._insert_placeholder, ncols))})"
+        statements = {}
+        for batch in data.to_batches(max_chunksize=chunksize):
+            if not (nrows := batch.num_rows):
+                continue
+            try:
+                sql = statements[nrows]
+            except KeyError:
+                values = ", ".join(repeat(row, nrows))
+                sql = statements[nrows] = f"INSERT INTO {target} VALUES {values}"
+            cursor.execute(sql, _row_major_values(batch))
+
+    def _insert_target(
+        self, table: sge.Table, data: pa.Table, columns: Iterable[str] | None
+    ) -> str:
+        quoted = self.compiler.quoted
+        return sge.Schema(
+            this=table,
+            expressions=[
+                sg.to_identifier(name, quoted=quoted)
+                for name in (data.column_names if columns is None else columns)
+            ],
+        ).sql(self.dialect)
 
     def drop_view(
         self,
@@ -236,16 +597,61 @@ class SQLBackend(BaseBackend):
 
         self._run_pre_execute_hooks(expr)
         table = expr.as_table()
-        sql = self.compile(table, params=params, limit=limit, **kwargs)
+        sql, bound = self._compile_parameterized(
+            table, params=params, limit=limit, **kwargs
+        )
 
         schema = table.schema()
 
         # TODO(kszucs): these methods should be abstractmethods or this default
         # implementation should be removed
-        with self._safe_raw_sql(sql) as cur:
+        with self._safe_raw_sql(sql, **bound) as cur:
             result = self._fetch_from_cursor(cur, schema)
         return expr.__pandas_result__(result)
 
+    def _prepare_many(
+        self,
+        method: str,
+        expr: ir.Expr,
+        *,
+        params: Mapping | None = None,
+        limit: str | None = None,
+        **kwargs: Any,
+    ) -> tuple[Callable[[Any], Any], bool]:
+        self._run_pre_execute_hooks(expr)
+        # compiling populates the compile cache, which the execution reuses
+        self._compile_parameterized(
+            expr.as_table(), params=params, limit=limit, **kwargs
+        )
+        run = getattr(self, method)
+
+        def task(con):
+            if con is None:
+                return run(expr, params=params, limit=limit, **kwargs)
+            with self._use_connection(con):
+                return run(expr, params=params, limit=limit, **kwargs)
+
+        return task, True
+
+    def _thread_connection(self, thread: int) -> Any:
+        return self._checked_out.get(thread)
+
+    @property
+    def _concurrent_queries(self) -> bool:
+        return self._pool is not None and not self._temp_tables
+
+    @contextlib.contextmanager
+    def _worker_connection(self) -> Iterator[Any]:
+        if self._pool is None:
+            raise NotImplementedError(
+                f"{self.name} backend doesn't support concurrent queries "
+                "without a connection pool"
+            )
+        with self._pool.connection() as con:
+            with self._use_connection(con):
+                self._sync_session()
+            yield con
+
     def drop_table(
         self,
         name: str,
@@ -262,6 +668,8 @@ class SQLBackend(BaseBackend):
         )
         with self._safe_raw_sql(drop_stmt):
             pass
+        self._forget_memtables(name)
+        self._temp_tables.discard(name)
 
     def _cursor_batches(
         self,
@@ -272,9 +680,8 @@ class SQLBackend(BaseBackend):
     ) -> Iterable[list]:
         self._run_pre_execute_hooks(expr)
 
-        with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
-        ) as cursor:
+        sql, bound = self._compile_parameterized(expr, params=params, limit=limit)
+        with self._safe_raw_sql(sql, **bound) as cursor:
             while batch := cursor.fetchmany(chunk_size):
                 yield batch
 
@@ -352,20 +759,27 @@ class SQLBackend(BaseBackend):
         if overwrite:
             self.truncate_table(table_name, schema=schema, database=database)
 
+        compiler = self.compiler
+        quoted = compiler.quoted
+        table = sg.table(table_name, db=schema, catalog=database, quoted=quoted)
+        columns = self.get_schema(table_name).names
+
         if not isinstance(obj, ir.Table):
             obj = ibis.memtable(obj)
+            if self._bulk_insert:
+                op = obj.op()
+                with self.begin() as cur:
+                    self._insert_arrow(
+                        cur, table, op.data.to_pyarrow(op.schema), columns=columns
+                    )
+                return
 
         self._run_pre_execute_hooks(obj)
 
-        compiler = self.compiler
-        quoted = compiler.quoted
         query = sge.insert(
             expression=self.compile(obj),
-            into=sg.table(table_name, db=schema, catalog=database, quoted=quoted),
-            columns=[
-                sg.to_identifier(col, quoted=quoted)
-                for col in self.get_schema(table_name).names
-            ],
+            into=table,
+            columns=[sg.to_identifier(col, quoted=quoted) for col in columns],
             dialect=compiler.dialect,
         )
 
@@ -393,7 +807,15 @@ class SQLBackend(BaseBackend):
         with self._safe_raw_sql(f"TRUNCATE TABLE {ident}"):
             pass
 
+    def reconnect(self) -> None:
+        # memtables uploaded as temporary tables don't survive the old
+        # connection, make sure they are uploaded again
+        self._forget_memtables()
+        super().reconnect()
+
     def disconnect(self):
+        if self._pool is not None:
+            self._pool.close()
         # This is part of the Python DB-API specification so should work for
         # _most_ sqlglot backends
         self.con.close()
@@ -415,3 +837,16 @@ class SQLBackend(BaseBackend):
         raise NotImplementedError(
             f"pandas UDFs are not supported in the {self.name} backend"
         )
+
+
+def _is_bindable(dtype: dt.DataType) -> bool:
+    return not (dtype.is_nested() or dtype.is_geospatial() or dtype.is_interval())
+
+
+def _row_major_values(batch: pa.RecordBatch) -> list:
+    """Flatten `batch` into a list of its values in row-major order."""
+    ncols = batch.num_columns
+    values = [None] * (batch.num_rows * ncols)
+    for i, column in enumerate(batch.columns):
+        values[i::ncols] = column.to_pylist()
+    return values
@@ -0,0 +1,132 @@
+"""A bounded pool of DB-API connections."""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class ConnectionPool:
+    """A bounded pool of DB-API connections with health checks.
+
+    Idle connections are reused most recently used first, so that a lightly
+    loaded pool keeps using a few warm connections. A connection that has been
+    idle for longer than `ping_after` seconds is checked with `ping` before it
+    is handed out, and replaced by a new one if the check fails.
+
+    Each connection has a `state` dictionary, for information about its
+    session that the pool's user needs to keep track of.
+
+    Parameters
+    ----------
+    connect
+        Function that opens a new connection.
+    size
+        Maximum number of connections checked out at the same time.
+    ping
+        Function that raises an exception if a connection is unusable.
+    ping_after
+        Number of seconds a connection can be idle before it's pinged again.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        size: int,
+        ping: Callable[[Any], Any],
+        ping_after: float = 30.0,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"pool size must be at least 1, got {size}")
+        self.size = size
+        self._connect = connect
+        self._ping = ping
+        self._ping_after = ping_after
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        # (connection, last checkin time) pairs, most recently used last
+        self._idle: list[tuple[Any, float]] = []
+        self._state: dict[int, dict[str, Any]] = {}
+        self._closed = False
+
+    def acquire(self) -> Any:
+        """Check out a connection, waiting for one to be released if needed."""
+        self._slots.acquire()
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+                    con, since = self._idle.pop()
+                if time.monotonic() - since < self._ping_after or self._healthy(con):
+                    return con
+                self._discard(con)
+
+            con = self._connect()
+            with self._lock:
+                self._state[id(con)] = {}
+            return con
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, con: Any, *, check: bool = False) -> None:
+        """Return a checked out connection to the pool.
+
+        If `check` is true the connection is pinged first, and closed instead
+        of being reused if it's unusable.
+        """
+        try:
+            if self._closed or (check and not self._healthy(con)):
+                self._discard(con)
+            else:
+                with self._lock:
+                    self._idle.append((con, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Check out a connection for the duration of a `with` block."""
+        con = self.acquire()
+        try:
+            yield con
+        except BaseException:
+            self.release(con, check=True)
+            raise
+        else:
+            self.release(con)
+
+    def state(self, con: Any) -> dict[str, Any]:
+        """Return the session state of a connection opened by the pool."""
+        return self._state[id(con)]
+
+    def close(self) -> None:
+        """Close the idle connections.
+
+        Connections that are checked out are closed when they're released.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._closed = True
+        for con, _ in idle:
+            self._discard(con)
+
+    def _healthy(self, con: Any) -> bool:
+        try:
+            self._ping(con)
+        except Exception:  # noqa: BLE001
+            return False
+        return True
+
+    def _discard(self, con: Any) -> None:
+        with self._lock:
+            self._state.pop(id(con), None)
+        with contextlib.suppress(Exception):
+            con.close()
@@ -19,7 +19,7 @@ from ibis.common.deferred import var
 from ibis.common.graph import Graph
 from ibis.common.patterns import InstanceOf, Object, Pattern, _, replace
 from ibis.common.typing import VarTuple  # noqa: TCH001
-from ibis.expr.rewrites import d, p, replace_parameter
+from ibis.expr.rewrites import d, p
 from ibis.expr.schema import Schema
 
 if TYPE_CHECKING:
@@ -108,6 +108,24 @@ class Window(ops.Value):
 # can have tighter control over simplification logic.
 
 
+# parameter value marking parameters to keep as placeholders bound by the
+# driver at execution time, see `SQLBackend._compile_parameterized`
+BIND = object()
+
+
+@replace(p.ScalarParameter)
+def replace_parameter(_, params, **kwargs):
+    """Replace scalar parameters with their values.
+
+    Parameters whose value is `BIND` are kept, so that backends supporting it
+    can compile them to placeholders.
+    """
+    value = params[_]
+    if value is BIND:
+        return _
+    return ops.Literal(value=value, dtype=_.dtype)
+
+
 @replace(p.Project)
 def project_to_select(_, **kwargs):
     """Convert a Project node to a Select node."""
@@ -251,7 +269,7 @@ def sqlize(
     ctes = frozenset(extract_ctes(simplified))
 
     def wrap(node, _, **kwargs):
-        new = node.__recreate__(kwargs)
+        new = node.__rebuild__(kwargs)
         return CTE(new) if node in ctes else new
 
     result = simplified.replace(wrap)
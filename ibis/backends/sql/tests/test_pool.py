@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from ibis.backends.sql.pool import ConnectionPool
+
+
+def ping(con):
+    con.execute("SELECT 1").fetchall()
+
+
+@pytest.fixture
+def opened():
+    return []
+
+
+@pytest.fixture
+def make_pool(opened):
+    def connect():
+        con = sqlite3.connect(":memory:", check_same_thread=False)
+        opened.append(con)
+        return con
+
+    def make(size=2, ping_after=30.0):
+        return ConnectionPool(connect, size=size, ping=ping, ping_after=ping_after)
+
+    return make
+
+
+def test_invalid_size(make_pool):
+    with pytest.raises(ValueError, match="at least 1"):
+        make_pool(size=0)
+
+
+def test_reuse_most_recently_used(make_pool, opened):
+    pool = make_pool()
+
+    with pool.connection() as a, pool.connection() as b:
+        assert a is not b
+    assert len(opened) == 2
+
+    # a was released last, so it's handed out first
+    with pool.connection() as con:
+        assert con is a
+    assert len(opened) == 2
+
+
+def test_size_is_bounded(make_pool, opened):
+    pool = make_pool(size=1)
+    con = pool.acquire()
+    acquired = threading.Event()
+
+    def worker():
+        with pool.connection():
+            acquired.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.1)
+
+    pool.release(con)
+    thread.join()
+    assert acquired.is_set()
+    assert len(opened) == 1
+
+
+def test_unhealthy_idle_connection_is_replaced(make_pool, opened):
+    pool = make_pool(ping_after=0)
+
+    with pool.connection() as con:
+        pass
+    con.close()
+
+    with pool.connection() as new:
+        assert new is not con
+        ping(new)
+    assert len(opened) == 2
+
+
+def test_connection_is_checked_after_error(make_pool, opened):
+    pool = make_pool()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        with pool.connection() as con:
+            con.close()
+            con.execute("SELECT 1")
+
+    with pool.connection() as new:
+        assert new is not con
+
+    # a failed query on a healthy connection doesn't discard it
+    with pytest.raises(sqlite3.OperationalError):
+        with pool.connection() as con:
+            con.execute("SELECT * FROM missing")
+
+    with pool.connection() as same:
+        assert same is con
+
+
+def test_state(make_pool):
+    pool = make_pool()
+
+    with pool.connection() as con:
+        pool.state(con)["prepared"] = {"stmt"}
+
+    with pool.connection() as same:
+        assert same is con
+        assert pool.state(same) == {"prepared": {"stmt"}}
+
+
+def test_close(make_pool, opened):
+    pool = make_pool()
+    idle = pool.acquire()
+    busy = pool.acquire()
+    pool.release(idle)
+
+    pool.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        ping(idle)
+    ping(busy)
+
+    pool.release(busy)
+    with pytest.raises(sqlite3.ProgrammingError):
+        ping(busy)
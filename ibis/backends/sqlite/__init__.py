@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import functools
 import sqlite3
+import sys
 from typing import TYPE_CHECKING, Any
 
 import sqlglot as sg
@@ -38,6 +39,20 @@ def _init_sqlite3():
     sqlite3.register_adapter(pd.Timestamp, pd.Timestamp.isoformat)
 
 
+@functools.cache
+def _is_serialized() -> bool:
+    """Whether the sqlite library serializes the use of a connection.
+
+    Before Python 3.11 `sqlite3.threadsafety` is always 1, whatever the mode
+    the library was built with, so the mode is read from its compile options.
+    """
+    if sys.version_info >= (3, 11):
+        return sqlite3.threadsafety == 3
+    with contextlib.closing(sqlite3.connect(":memory:")) as con:
+        options = {option for (option,) in con.execute("PRAGMA compile_options")}
+    return "THREADSAFE=1" in options
+
+
 def _quote(name: str) -> str:
     return sg.to_identifier(name, quoted=True).sql("sqlite")
 
@@ -46,6 +61,8 @@ class Backend(SQLBackend, UrlFromPath):
     name = "sqlite"
     compiler = SQLiteCompiler()
     supports_python_udfs = True
+    # SQLITE_MAX_VARIABLE_NUMBER defaults to 32766 since 3.32.0
+    _max_insert_params = 32766 if sqlite3.sqlite_version_info >= (3, 32) else 999
 
     @property
     def current_database(self) -> str:
@@ -88,7 +105,12 @@ class Backend(SQLBackend, UrlFromPath):
         else:
             self._type_map = {}
 
-        self.con = sqlite3.connect(":memory:" if database is None else database)
+        self.con = sqlite3.connect(
+            ":memory:" if database is None else database,
+            # a serialized sqlite build can share the connection with the
+            # threads that run asynchronous queries
+            check_same_thread=not _is_serialized(),
+        )
 
         register_all(self.con)
         self.con.execute("PRAGMA case_sensitive_like=ON")
@@ -103,6 +125,19 @@ class Backend(SQLBackend, UrlFromPath):
         with contextlib.closing(self.raw_sql(*args, **kwargs)) as result:
             yield result
 
+    def _interrupt(self, con: Any = None) -> None:
+        self.con.interrupt()
+
+    async def _run_async(self, method: str, expr: ir.Expr, **kwargs: Any) -> Any:
+        if not _is_serialized():
+            # the connection can only be used from the thread that created
+            # it, so the query would block the event loop
+            raise com.UnsupportedOperationError(
+                "Asynchronous queries require a sqlite library built in "
+                "serialized mode (SQLITE_THREADSAFE=1)"
+            )
+        return await super()._run_async(method, expr, **kwargs)
+
     @contextlib.contextmanager
     def begin(self):
         cur = self.con.cursor()
@@ -287,23 +322,34 @@ class Backend(SQLBackend, UrlFromPath):
 
         return sge.Create(kind="TABLE", this=target)
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _is_ephemeral(self, op: ops.DatabaseTable) -> bool:
+        # in-memory and temporary databases have no file, and unqualified names
+        # are looked up in the temporary database first
+        with self._safe_raw_sql("SELECT name, file FROM pragma_database_list()") as cur:
+            files = dict(cur.fetchall())
+        if (database := op.namespace.database) is not None:
+            databases = [database]
+        else:
+            databases = ["temp", "main"]
+            databases += [name for name in files if name not in databases]
+        for database in databases:
+            query = f"SELECT 1 FROM {_quote(database)}.sqlite_master WHERE name = ?"
+            with contextlib.closing(self.con.execute(query, (op.name,))) as cur:
+                if cur.fetchone() is not None:
+                    return not files.get(database)
+        return True
+
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         # only register if we haven't already done so
         if op.name not in self.list_tables(database="temp"):
             table = sg.table(op.name, quoted=self.compiler.quoted, catalog="temp")
             create_stmt = self._generate_create_table(table, op.schema).sql(self.name)
-            df = op.data.to_frame()
-
-            data = df.itertuples(index=False)
-            cols = ", ".join(_quote(col) for col in op.schema.keys())
-            specs = ", ".join(["?"] * len(op.schema))
-            insert_stmt = (
-                f"INSERT INTO {table.sql(self.name)} ({cols}) VALUES ({specs})"
-            )
 
             with self.begin() as cur:
                 cur.execute(create_stmt)
-                cur.executemany(insert_stmt, data)
+                self._insert_arrow(cur, table, op.data.to_pyarrow(op.schema))
+            return True
+        return False
 
     def _define_udf_translation_rules(self, expr):
         """No-op, these are defined in the compiler."""
@@ -485,6 +531,7 @@ class Backend(SQLBackend, UrlFromPath):
         )
         with self._safe_raw_sql(drop_stmt):
             pass
+        self._forget_memtables(name)
 
     def create_view(
         self,
@@ -544,7 +591,15 @@ class Backend(SQLBackend, UrlFromPath):
         """
         table = sg.table(table_name, catalog=database, quoted=self.compiler.quoted)
         if not isinstance(obj, ir.Expr):
-            obj = ibis.memtable(obj)
+            op = ibis.memtable(obj).op()
+            columns = self.get_schema(table_name, database=database).names
+            with self.begin() as cur:
+                if overwrite:
+                    cur.execute(f"DELETE FROM {table.sql(self.name)}")
+                self._insert_arrow(
+                    cur, table, op.data.to_pyarrow(op.schema), columns=columns
+                )
+            return
 
         self._run_pre_execute_hooks(obj)
         expr = self._to_sqlglot(obj)
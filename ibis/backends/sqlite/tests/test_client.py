@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import gc
 import os
 import sqlite3
+import sys
 from pathlib import Path
 
+import pandas as pd
 import pytest
 from pytest import param
 
 import ibis
+import ibis.common.exceptions as com
+from ibis.backends.sqlite import _is_serialized
 from ibis.conftest import not_windows
 
 
@@ -75,3 +81,148 @@ def test_connect(url, ext, tmp_path):
     con = ibis.connect(url(path))
     one = ibis.literal(1)
     assert con.execute(one) == 1
+
+
+def test_memtable_register_in_chunks(monkeypatch):
+    con = ibis.sqlite.connect()
+    # force several statements, with a shorter final one
+    monkeypatch.setattr(con, "_max_insert_params", 7)
+
+    data = {
+        "a": list(range(25)),
+        "b": [None if i % 4 == 0 else str(i) for i in range(25)],
+        "c": [i / 2 for i in range(25)],
+    }
+    result = con.to_pyarrow(ibis.memtable(data).order_by("a"))
+    assert result.to_pydict() == data
+
+
+def test_insert_dataframe_in_bulk(mocker):
+    con = ibis.sqlite.connect()
+    con.create_table("t", schema=ibis.schema(dict(x="int64", y="string")))
+    spy = mocker.spy(con, "_insert_arrow")
+
+    # columns are matched by position, as when inserting from a table
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]})
+    con.insert("t", df)
+    con.insert("t", df.iloc[:1], overwrite=True)
+
+    assert spy.call_count == 2
+    assert con.table("t").to_pyarrow().to_pydict() == {"x": [1], "y": ["x"]}
+
+
+def test_is_serialized_before_py311(monkeypatch):
+    # sqlite3.threadsafety is hard-coded to 1 before python 3.11
+    monkeypatch.setattr(sys, "version_info", (3, 10))
+    monkeypatch.setattr(sqlite3, "threadsafety", 1)
+
+    with sqlite3.connect(":memory:") as con:
+        options = {option for (option,) in con.execute("PRAGMA compile_options")}
+    assert _is_serialized.__wrapped__() == ("THREADSAFE=1" in options)
+
+
+def test_execute_async_not_serialized(monkeypatch):
+    con = ibis.sqlite.connect()
+    monkeypatch.setattr("ibis.backends.sqlite._is_serialized", lambda: False)
+
+    with pytest.raises(com.UnsupportedOperationError, match="serialized mode"):
+        asyncio.run(con.execute_async(ibis.literal(1)))
+
+
+@pytest.mark.skipif(
+    not _is_serialized(), reason="sqlite build can't share connections across threads"
+)
+def test_execute_async_cancel():
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", pd.DataFrame({"x": range(30_000)}))
+    slow = t.cross_join(t.view().rename(y="x")).count()
+
+    async def run():
+        query = asyncio.ensure_future(con.execute_async(slow))
+        await asyncio.sleep(0.1)
+        query.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await query
+        return await con.execute_async(t.count())
+
+    assert asyncio.run(run()) == 30_000
+
+
+def test_memtable_registered_once(mocker):
+    con = ibis.sqlite.connect()
+    spy = mocker.spy(con, "list_tables")
+    t = ibis.memtable({"a": [1, 2, 3]})
+
+    for _ in range(3):
+        assert con.execute(t.count()) == 3
+
+    assert spy.call_count == 1
+
+
+@pytest.fixture
+def gc_disabled():
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def test_memtable_dropped_after_collection(gc_disabled):
+    con = ibis.sqlite.connect()
+    t = ibis.memtable({"a": [1, 2, 3]})
+    name = t.op().name
+    con.execute(t.select(b=t.a + 1).filter(lambda s: s.b > 1))
+    assert name in con.list_tables(database="temp")
+
+    # the compiled SQL cache references the expression; once that's cleared the
+    # memtable is freed by reference counting without a garbage collection
+    con.clear_compile_cache()
+    del t
+
+    # dropping is deferred until the next execution
+    con.execute(ibis.memtable({"b": [1]}))
+    assert name not in con.list_tables(database="temp")
+
+
+def test_memtable_existing_table_not_dropped(gc_disabled):
+    con = ibis.sqlite.connect()
+    con.raw_sql("CREATE TEMP TABLE orders (a INTEGER)").close()
+
+    # the existing table is used instead of uploading the memtable
+    t = ibis.memtable({"a": [1, 2, 3]}, name="orders")
+    assert con.execute(t.count()) == 0
+
+    con.clear_compile_cache()
+    del t
+    con.execute(ibis.memtable({"b": [1]}))
+    assert "orders" in con.list_tables(database="temp")
+
+
+def test_memtable_uploaded_again_after_drop():
+    con = ibis.sqlite.connect()
+    t = ibis.memtable({"a": [1, 2, 3]})
+    con.execute(t)
+
+    con.drop_table(t.op().name)
+    assert con.execute(t.count()) == 3
+
+    con.reconnect()
+    assert con.execute(t.count()) == 3
+
+
+def test_is_ephemeral(tmp_path):
+    con = ibis.sqlite.connect(tmp_path / "test.db")
+    con.create_table("p", schema=ibis.schema({"a": "int64"}))
+    con.create_table("t", schema=ibis.schema({"a": "int64"}), temp=True)
+    assert not con._is_ephemeral(con.table("p").op())
+    assert con._is_ephemeral(con.table("t").op())
+
+    # temporary tables shadow the tables of the main database
+    con.create_table("p", schema=ibis.schema({"a": "int64"}), temp=True)
+    assert con._is_ephemeral(con.table("p").op())
+
+    memory = ibis.sqlite.connect()
+    memory.create_table("p", schema=ibis.schema({"a": "int64"}))
+    assert memory._is_ephemeral(memory.table("p").op())
@@ -129,7 +129,7 @@ def test_column_to_pyarrow_table_schema(awards_players):
     assert array.type == pa.string() or array.type == pa.large_string()
 
 
-@pytest.mark.notimpl(["pandas", "dask", "datafusion", "flink"])
+@pytest.mark.notimpl(["pandas", "dask", "datafusion"])
 @pytest.mark.notyet(
     ["clickhouse"],
     raises=AssertionError,
@@ -144,7 +144,7 @@ def test_table_pyarrow_batch_chunk_size(awards_players):
         util.consume(batch_reader)
 
 
-@pytest.mark.notimpl(["pandas", "dask", "datafusion", "flink"])
+@pytest.mark.notimpl(["pandas", "dask", "datafusion"])
 @pytest.mark.notyet(
     ["clickhouse"],
     raises=AssertionError,
@@ -195,6 +195,17 @@ def test_to_pyarrow_batches_memtable(con):
     assert n == 3
 
 
+def test_to_pyarrow_many(con):
+    t = ibis.memtable({"x": [1, 2, 3]})
+    exprs = [t, t.x.sum(), t.x.max(), t.x.sum()]
+    results = con.to_pyarrow_many(exprs)
+    assert isinstance(results[0], pa.Table)
+    assert len(results[0]) == 3
+    assert [r.as_py() for r in results[1:]] == [6, 3, 6]
+    assert len(results.elapsed) == len(exprs)
+    assert results.elapsed[1] == results.elapsed[3]
+
+
 def test_table_to_parquet(tmp_path, backend, awards_players):
     outparquet = tmp_path / "out.parquet"
     awards_players.to_parquet(outparquet)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import contextlib
-from functools import cached_property
+from functools import cached_property, partial
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
@@ -35,6 +35,12 @@ class Backend(SQLBackend, CanListDatabases, NoUrl):
     compiler = TrinoCompiler()
     supports_create_or_replace = False
     supports_temporary_tables = False
+    # memtables are created as regular tables, visible to every connection
+    _session_memtables = False
+    _bulk_insert = True
+    # the client sends prepared statements to the server in an HTTP header,
+    # keep them well below the default header size limit
+    _max_insert_params = 500
 
     def raw_sql(self, query: str | sg.Expression) -> Any:
         """Execute a raw SQL query."""
@@ -58,20 +64,20 @@ class Backend(SQLBackend, CanListDatabases, NoUrl):
 
     @contextlib.contextmanager
     def begin(self):
-        con = self.con
-        cur = con.cursor()
-        try:
-            yield cur
-        except Exception:
-            if con.transaction is not None:
-                con.rollback()
-            raise
-        else:
-            if con.transaction is not None:
-                con.commit()
-        finally:
-            if cur._query:
-                cur.close()
+        with self._checkout() as con:
+            cur = con.cursor()
+            try:
+                yield cur
+            except Exception:
+                if con.transaction is not None:
+                    con.rollback()
+                raise
+            else:
+                if con.transaction is not None:
+                    con.commit()
+            finally:
+                if cur._query:
+                    cur.close()
 
     @contextlib.contextmanager
     def _safe_raw_sql(
@@ -90,12 +96,13 @@ class Backend(SQLBackend, CanListDatabases, NoUrl):
             The cursor of the executed query.
 
         """
-        cur = self.raw_sql(query)
-        try:
-            yield cur
-        finally:
-            if cur._query:
-                cur.close()
+        with self._checkout():
+            cur = self.raw_sql(query)
+            try:
+                yield cur
+            finally:
+                if cur._query:
+                    cur.close()
 
     def get_schema(
         self, table_name: str, schema: str | None = None, database: str | None = None
@@ -241,6 +248,7 @@ class Backend(SQLBackend, CanListDatabases, NoUrl):
         schema: str | None = None,
         source: str | None = None,
         timezone: str = "UTC",
+        pool_size: int | None = None,
         **kwargs,
     ) -> None:
         """Connect to Trino.
@@ -263,6 +271,9 @@ class Backend(SQLBackend, CanListDatabases, NoUrl):
             Application name passed to Trino
         timezone
             Timezone to use for the connection
+        pool_size
+            If given, run queries on a pool of at most this many connections,
+            so that multiple threads can use the backend at the same time.
         kwargs
             Additional keyword arguments passed directly to the
             `trino.dbapi.connect` API.
@@ -286,7 +297,8 @@ class Backend(SQLBackend, CanListDatabases, NoUrl):
         >>> con = ibis.trino.connect(database=catalog, schema=schema, source="my-app")
 
         """
-        self.con = trino.dbapi.connect(
+        connect = partial(
+            trino.dbapi.connect,
             user=user,
             auth=password,
             host=host,
@@ -297,6 +309,7 @@ class Backend(SQLBackend, CanListDatabases, NoUrl):
             timezone=timezone,
             **kwargs,
         )
+        self._init_connections(connect, pool_size)
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         name = util.gen_name(f"{self.name}_metadata")
@@ -497,7 +510,7 @@ class Backend(SQLBackend, CanListDatabases, NoUrl):
         df = TrinoPandasData.convert_table(df, schema)
         return df
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> bool:
         schema = op.schema
         if null_columns := [col for col, dtype in schema.items() if dtype.is_null()]:
             raise com.IbisTypeError(
@@ -528,11 +541,9 @@ class Backend(SQLBackend, CanListDatabases, NoUrl):
                 ),
             ).sql(self.name, pretty=True)
 
-            data = op.data.to_frame().itertuples(index=False)
-            specs = ", ".join("?" * len(schema))
-            table = sg.table(name, quoted=quoted).sql(self.name)
-            insert_stmt = f"INSERT INTO {table} VALUES ({specs})"
+            table = sg.table(name, quoted=quoted)
             with self.begin() as cur:
                 cur.execute(create_stmt)
-                for row in data:
-                    cur.execute(insert_stmt, row)
+                self._insert_arrow(cur, table, op.data.to_pyarrow(schema))
+            return True
+        return False
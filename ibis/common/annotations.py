@@ -221,6 +221,38 @@ class Argument(Annotation):
         )
 
 
+class Memoized:
+    """Attribute of an immutable class computed on first access.
+
+    In contrast to `Attribute`, which is computed when the instance is
+    constructed, the value is only derived if it's actually used and it's
+    stored on the instance afterwards. The owning class must be created by
+    `AnnotableMeta`, which allocates a slot for the value.
+
+    Parameters
+    ----------
+    func
+        Function computing the value from the instance.
+
+    """
+
+    def __init__(self, func: Callable):
+        self.func = func
+        self.slot = None
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.func(instance)
+            # assign through the slot descriptor to bypass immutability
+            self.slot.__set__(instance, value)
+            return value
+
+
 def attribute(pattern=_any, default=EMPTY):
     """Annotation to mark a field in a class."""
     if default is EMPTY and isinstance(pattern, (types.FunctionType, types.MethodType)):
@@ -229,6 +261,11 @@ def attribute(pattern=_any, default=EMPTY):
         return Attribute(pattern, default=default)
 
 
+def memoized(func):
+    """Decorator to mark a lazily computed attribute of an immutable class."""
+    return Memoized(func)
+
+
 def argument(pattern=_any, default=EMPTY, typehint=None):
     """Annotation type for all fields which should be passed as arguments."""
     return Argument(pattern, default=default, typehint=typehint)
@@ -532,6 +569,54 @@ class Signature(inspect.Signature):
 
         return this
 
+    def validate_changed(self, func, kwargs, previous):
+        """Validate the arguments which differ from already validated ones.
+
+        Arguments identical to the corresponding value in `previous` have
+        already been matched against their patterns, so they are passed
+        through as they are.
+
+        Parameters
+        ----------
+        func : Callable
+            Callable to validate the arguments for.
+        kwargs : dict
+            Keyword arguments, must contain all the parameters.
+        previous : dict
+            Previously validated keyword arguments.
+
+        Returns
+        -------
+        validated : dict
+            Dictionary of validated arguments.
+
+        """
+        this, errors = {}, []
+        for name, param in self.parameters.items():
+            value = kwargs[name]
+            if value is previous[name]:
+                this[name] = value
+                continue
+
+            pattern = param.annotation.pattern
+            result = pattern.match(value, this)
+            if result is NoMatch:
+                errors.append((name, value, pattern))
+            else:
+                this[name] = result
+
+        if errors:
+            raise SignatureValidationError(
+                "{call} has failed due to the following errors:{errors}\n\nExpected signature: {sig}",
+                sig=self,
+                func=func,
+                args=(),
+                kwargs=kwargs,
+                errors=errors,
+            )
+
+        return this
+
     def validate_return(self, func, value):
         """Validate the return value of a function.
 
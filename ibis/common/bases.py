@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import collections.abc
+import contextlib
+import weakref
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Optional
 from weakref import WeakValueDictionary
 
-from ibis.common.caching import WeakCache
+from ibis.common.caching import LRUCache
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
 
     from typing_extensions import Self
 
@@ -139,12 +142,14 @@ class Comparable(Abstract):
     only if the two instances are of the same type and the result is cached for
     future comparisons.
 
-    Since the class holds a global cache of comparison results, it is important
-    to make sure that the instances are not kept alive longer than necessary.
-    This is done automatically by using weak references for the compared objects.
+    The results are stored in a bounded, least recently used cache keyed by
+    the ids of the compared instances. Entries hold weak references to the
+    instances to detect reused ids, so the cache doesn't keep the instances
+    alive. Use `equality_cache` to collect the results in a cache that is
+    discarded at the end of a block instead.
     """
 
-    __cache__ = WeakCache()
+    __cache__ = LRUCache(maxsize=2**14)
 
     def __eq__(self, other) -> bool:
         try:
@@ -165,17 +170,57 @@ class Comparable(Abstract):
 
         # reduce space required for commutative operation
         if id(self) < id(other):
-            key = (self, other)
+            left, right = self, other
         else:
-            key = (other, self)
+            left, right = other, self
+        key = (id(left), id(right))
+
+        if (cache := _scoped_cache.get()) is None:
+            cache = self.__cache__
+
+        # the ids may have been reused by other objects since the entry was
+        # stored, so check that the entry refers to the compared objects;
+        # weak references without callbacks are shared per object so they
+        # don't allocate on repeated comparisons
+        entry = cache.get(key)
+        if entry is not None and entry[0]() is left and entry[1]() is right:
+            return entry[2]
+
+        result = self.__equals__(other)
+        cache[key] = (weakref.ref(left), weakref.ref(right), result)
+        return result
 
-        try:
-            result = self.__cache__[key]
-        except KeyError:
-            result = self.__equals__(other)
-            self.__cache__[key] = result
 
-        return result
+_scoped_cache: ContextVar[Optional[LRUCache]] = ContextVar(
+    "_scoped_cache", default=None
+)
+
+
+@contextlib.contextmanager
+def equality_cache(maxsize: int | None = None) -> Iterator[LRUCache]:
+    """Cache the equality comparisons of `Comparable` instances in a block.
+
+    The comparisons made inside the block are cached separately from the
+    global cache, and the cache is discarded at the end of the block.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of comparison results to cache, `None` means no limit.
+
+    Yields
+    ------
+    LRUCache
+        The cache used inside the block, its `info()` method returns hit,
+        miss and size statistics.
+
+    """
+    cache = LRUCache(maxsize=maxsize)
+    token = _scoped_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _scoped_cache.reset(token)
 
 
 class SlottedMeta(AbstractMeta):
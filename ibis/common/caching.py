@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import contextlib
 import functools
-import weakref
-from collections import Counter, defaultdict
+import os
+import tempfile
+import time
+from collections import Counter, OrderedDict, defaultdict
 from collections.abc import MutableMapping
-from typing import TYPE_CHECKING, Any, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple
 
 from bidict import bidict
 
@@ -13,6 +17,8 @@ from ibis.common.exceptions import IbisError
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    import pyarrow as pa
+
 
 def memoize(func: Callable) -> Callable:
     """Memoize a function."""
@@ -31,15 +37,33 @@ def memoize(func: Callable) -> Callable:
     return wrapper
 
 
-class WeakCache(MutableMapping):
-    __slots__ = ("_data",)
-    _data: dict
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
 
-    def __init__(self):
-        object.__setattr__(self, "_data", {})
+class LRUCache(MutableMapping):
+    """A mapping that evicts the least recently used entry when full.
 
-    def __setattr__(self, name, value):
-        raise TypeError(f"can't set {name}")
+    Lookups through `get` are counted as hits or misses, mirroring
+    `functools.lru_cache`'s `cache_info`.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of entries to hold. `None` means unbounded and `0`
+        disables caching altogether.
+    """
+
+    __slots__ = ("_data", "maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int | None = 128) -> None:
+        self._data = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
 
     def __len__(self) -> int:
         return len(self._data)
@@ -47,33 +71,196 @@ class WeakCache(MutableMapping):
     def __iter__(self) -> Iterator[Any]:
         return iter(self._data)
 
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
     def __setitem__(self, key, value) -> None:
-        # construct an alternative representation of the key using the id()
-        # of the key's components, this prevents infinite recursions
-        identifiers = tuple(id(item) for item in key)
+        if self.maxsize == 0:
+            return
+        data = self._data
+        data[key] = value
+        # another thread may be evicting concurrently, including the new entry
+        with contextlib.suppress(KeyError):
+            data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(data) > self.maxsize:
+                    data.popitem(last=False)
 
-        # create a function which removes the key from the cache
-        def callback(ref_):
-            return self._data.pop(identifiers, None)
+    def __delitem__(self, key) -> None:
+        del self._data[key]
 
-        # create weak references for the key's components with the callback
-        # to remove the cache entry if any of the key's components gets
-        # garbage collected
-        refs = tuple(weakref.ref(item, callback) for item in key)
+    def get(self, key, default=None):
+        # inlined __getitem__, this is on the hot path of equality comparisons
+        try:
+            value = self._data[key]
+            self._data.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        else:
+            self.hits += 1
+            return value
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit, miss and size statistics of the cache."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.info()})"
+
+
+class PersistentCache:
+    """A directory of Arrow tables addressed by string keys.
+
+    Entries are written to a temporary file first and atomically moved into
+    place, so multiple processes can share the same directory.
+
+    Parameters
+    ----------
+    directory
+        Directory to store the entries in, created on first write.
+    format
+        File format of the entries, either `"parquet"` or `"arrow"`.
+    max_size
+        Maximum total size of the entries in bytes. The least recently read
+        entries are removed when the limit is exceeded. `None` means no limit.
+    ttl
+        Number of seconds after being written that an entry expires. `None`
+        means entries never expire.
+    """
 
-        self._data[identifiers] = (value, refs)
+    __slots__ = ("directory", "format", "max_size", "ttl")
 
-    def __getitem__(self, key):
-        identifiers = tuple(id(item) for item in key)
-        value, _ = self._data[identifiers]
-        return value
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        format: Literal["parquet", "arrow"] = "parquet",
+        max_size: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.format = format
+        self.max_size = max_size
+        self.ttl = ttl
+
+    @property
+    def _suffix(self) -> str:
+        return f".{self.format}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self._suffix}"
 
-    def __delitem__(self, key):
-        identifiers = tuple(id(item) for item in key)
-        del self._data[identifiers]
+    def _expired(self, stat: os.stat_result, now: float) -> bool:
+        return self.ttl is not None and now - stat.st_mtime > self.ttl
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}({self._data})"
+    def __contains__(self, key: str) -> bool:
+        try:
+            stat = self._path(key).stat()
+        except FileNotFoundError:
+            return False
+        return not self._expired(stat, time.time())
+
+    def get(self, key: str) -> pa.Table | None:
+        """Return the table stored under `key`, or `None` if there isn't one."""
+        path = self._path(key)
+        now = time.time()
+        try:
+            stat = path.stat()
+            if self._expired(stat, now):
+                _remove(path)
+                return None
+            table = self._read(path)
+        except FileNotFoundError:
+            # evicted, possibly by another process
+            return None
+
+        # record the access for eviction while keeping the modification time,
+        # which is the time the entry was written, for expiration
+        with contextlib.suppress(OSError):
+            os.utime(path, (now, stat.st_mtime))
+        return table
+
+    def put(self, key: str, table: pa.Table) -> None:
+        """Store `table` under `key`, then evict entries over the size limit."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            self._write(table, tmp)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            _remove(tmp)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove expired entries and the least recently read entries over the size limit."""
+        now = time.time()
+        entries = []
+        for path in self.directory.glob(f"*{self._suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if self._expired(stat, now):
+                _remove(path)
+            else:
+                entries.append((stat.st_atime, stat.st_size, path))
+
+        if self.max_size is None:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            _remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob(f"*{self._suffix}"):
+            _remove(path)
+
+    def _read(self, path: Path) -> pa.Table:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.format == "parquet":
+            return pq.read_table(path)
+        # the table's buffers reference the memory map, which keeps it open
+        return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+
+    def _write(self, table: pa.Table, path: str) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.format == "parquet":
+            pq.write_table(table, path)
+        else:
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.directory)!r})"
+
+
+def _remove(path: str | Path) -> None:
+    # another process may have removed the file already, or on some platforms
+    # the file may still be in use
+    with contextlib.suppress(OSError):
+        os.remove(path)
 
 
 class RefCountedCache:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import operator
 from abc import abstractmethod
 from collections import deque
 from collections.abc import Iterable, Iterator, KeysView, Mapping, Sequence
@@ -115,7 +116,17 @@ def _recursive_lookup(obj: Any, dct: dict) -> Any:
 
     """
     if isinstance(obj, Node):
-        return dct.get(obj, obj)
+        result = dct.get(obj, obj)
+        # the results are keyed by one of possibly many equal instances, prefer
+        # the original object if it's unchanged so it isn't validated again
+        if (
+            result is not obj
+            and isinstance(result, Node)
+            and hash(result) == hash(obj)
+            and result == obj
+        ):
+            return obj
+        return result
     elif isinstance(obj, (tuple, list)):
         return tuple(_recursive_lookup(o, dct) for o in obj)
     elif isinstance(obj, (dict, frozendict)):
@@ -124,6 +135,41 @@ def _recursive_lookup(obj: Any, dct: dict) -> Any:
         return obj
 
 
+def _identical(new: Any, old: Any) -> bool:
+    """Check whether a rebuilt argument consists of the same objects as before.
+
+    The rewrite machinery always rebuilds the collections, so compare their items
+    by identity as well.
+
+    Examples
+    --------
+    >>> a = object()
+    >>> _identical((a, 1), (a, 1))
+    True
+    >>> _identical({"a": a}, frozendict(a=a))
+    True
+    >>> _identical({"a": a}, {"a": object()})
+    False
+    >>> _identical({"a": a, "b": 1}, frozendict(b=1, a=a))
+    False
+
+    """
+    # only the exact types the rewrite machinery rebuilds, not subclasses
+    kind = type(new)
+    if new is old:
+        return True
+    elif kind is tuple and isinstance(old, tuple):
+        return len(new) == len(old) and all(map(operator.is_, new, old))
+    elif kind is dict and isinstance(old, (dict, frozendict)):
+        # the order of the items is significant, e.g. for the columns of a relation
+        return len(new) == len(old) and all(
+            k1 == k2 and v1 is v2
+            for (k1, v1), (k2, v2) in zip(new.items(), old.items())
+        )
+    else:
+        return False
+
+
 def _coerce_finder(obj: FinderLike, context: Optional[dict] = None) -> Finder:
     """Coerce an object into a callable finder function.
 
@@ -179,9 +225,9 @@ def _coerce_replacer(obj: ReplacerLike, context: Optional[dict] = None) -> Repla
             # need to first reconstruct the node from the possible rewritten
             # children, so we can match on the new node containing the rewritten
             # child arguments, this way we can propagate the rewritten nodes
-            # upward in the hierarchy, using a specialized __recreate__ method
-            # improves the performance by 17% compared node.__class__(**kwargs)
-            recreated = node.__recreate__(kwargs)
+            # upward in the hierarchy, using a specialized __rebuild__ method
+            # which only validates the changed arguments
+            recreated = node.__rebuild__(kwargs)
             if (result := obj.match(recreated, ctx)) is NoMatch:
                 return recreated
             else:
@@ -193,7 +239,7 @@ def _coerce_replacer(obj: ReplacerLike, context: Optional[dict] = None) -> Repla
             try:
                 return obj[node]
             except KeyError:
-                return node.__recreate__(kwargs)
+                return node.__rebuild__(kwargs)
     elif callable(obj):
         fn = obj
     else:
@@ -210,6 +256,18 @@ class Node(Hashable):
         """Reconstruct the node from the given arguments."""
         return cls(**kwargs)
 
+    def __rebuild__(self, kwargs: Any) -> Self:
+        """Reconstruct the node from possibly rewritten arguments.
+
+        Used by the rewrite machinery, so unlike `__recreate__` it returns the
+        node itself if none of the arguments have changed. Subclasses may skip
+        validating the unchanged arguments.
+        """
+        for name, value in zip(self.__argnames__, self.__args__):
+            if not _identical(kwargs[name], value):
+                return self.__recreate__(kwargs)
+        return self
+
     @property
     @abstractmethod
     def __args__(self) -> tuple[Any, ...]:
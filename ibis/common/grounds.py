@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import operator
 from copy import copy
 from typing import (
     Any,
@@ -15,6 +16,7 @@ from ibis.common.annotations import (
     Annotation,
     Argument,
     Attribute,
+    Memoized,
     Signature,
 )
 from ibis.common.bases import (  # noqa: F401
@@ -26,6 +28,7 @@ from ibis.common.bases import (  # noqa: F401
     Singleton,
 )
 from ibis.common.collections import FrozenDict  # noqa: TCH001
+from ibis.common.graph import _identical
 from ibis.common.patterns import Pattern
 from ibis.common.typing import evaluate_annotations
 
@@ -62,7 +65,7 @@ class AnnotableMeta(AbstractMeta):
 
         # collect the newly defined annotations
         slots = list(dct.pop("__slots__", []))
-        namespace, arguments = {}, {}
+        namespace, arguments, memoized = {}, {}, {}
         for name, attrib in dct.items():
             if isinstance(attrib, Pattern):
                 arguments[name] = Argument(attrib)
@@ -73,6 +76,9 @@ class AnnotableMeta(AbstractMeta):
             elif isinstance(attrib, Attribute):
                 attributes[name] = attrib
                 slots.append(name)
+            elif isinstance(attrib, Memoized):
+                memoized[name] = attrib
+                slots.append(name)
             else:
                 namespace[name] = attrib
 
@@ -89,7 +95,14 @@ class AnnotableMeta(AbstractMeta):
             __signature__=signature,
             __slots__=tuple(slots),
         )
-        return super().__new__(metacls, clsname, bases, namespace, **kwargs)
+        cls = super().__new__(metacls, clsname, bases, namespace, **kwargs)
+
+        # wrap the slot descriptors of the memoized attributes, so the value is
+        # computed on the first access
+        for name, attrib in memoized.items():
+            attrib.slot = cls.__dict__[name]
+            setattr(cls, name, attrib)
+        return cls
 
     def __or__(self, other):
         # required to support `dt.Numeric | dt.Floating` annotation for python<3.10
@@ -124,6 +137,27 @@ class Annotable(Abstract, metaclass=AnnotableMeta):
         kwargs = cls.__signature__.validate_nobind(cls, kwargs)
         return super().__create__(**kwargs)
 
+    @classmethod
+    def __construct__(cls, kwargs: Any) -> Self:
+        # trusted construction path for arguments known to be valid already,
+        # e.g. nodes derived from other validated nodes, skips the validation
+        return super().__create__(**kwargs)
+
+    def __rebuild__(self, kwargs: Any) -> Self:
+        # construct a new instance from the keyword arguments of all parameters,
+        # arguments consisting of the current objects are already validated so
+        # only the changed ones are matched against their patterns
+        previous = dict(zip(self.__argnames__, self.__args__))
+        kwargs = {
+            name: value if _identical(new := kwargs[name], value) else new
+            for name, value in previous.items()
+        }
+        if all(map(operator.is_, kwargs.values(), previous.values())):
+            return self
+
+        kwargs = self.__signature__.validate_changed(self, kwargs, previous)
+        return super().__create__(**kwargs)
+
     def __init__(self, **kwargs: Any) -> None:
         # set the already validated arguments
         for name, value in kwargs.items():
@@ -233,4 +267,4 @@ class Concrete(Immutable, Comparable, Annotable):
         if unknown_args := overrides.keys() - kwargs.keys():
             raise AttributeError(f"Unexpected arguments: {unknown_args}")
         kwargs.update(overrides)
-        return self.__recreate__(kwargs)
+        return self.__rebuild__(kwargs)
@@ -16,8 +16,9 @@ from ibis.common.bases import (
     Immutable,
     Singleton,
     Slotted,
+    equality_cache,
 )
-from ibis.common.caching import WeakCache
+from ibis.common.caching import LRUCache
 
 
 def test_classes_are_based_on_abstract():
@@ -81,7 +82,7 @@ def test_immutable():
 
 class Node(Comparable):
     # override the default cache object
-    __cache__ = WeakCache()
+    __cache__ = LRUCache(maxsize=None)
     __slots__ = ("name",)
     num_equal_calls = 0
 
@@ -104,15 +105,21 @@ def cache():
     Node.num_equal_calls = 0
     cache = Node.__cache__
     yield cache
-    assert not cache
+    cache.clear()
 
 
 def pair(a, b):
     # for same ordering with comparable
     if id(a) < id(b):
-        return (a, b)
+        return (id(a), id(b))
     else:
-        return (b, a)
+        return (id(b), id(a))
+
+
+def entry(a, b, result):
+    if id(a) > id(b):
+        a, b = b, a
+    return (weakref.ref(a), weakref.ref(b), result)
 
 
 def test_comparable_basic(cache):
@@ -133,10 +140,10 @@ def test_comparable_caching(cache):
     d = Node(name="d")
     e = Node(name="e")
 
-    cache[pair(a, b)] = True
-    cache[pair(a, c)] = False
-    cache[pair(c, d)] = True
-    cache[pair(b, d)] = False
+    cache[pair(a, b)] = entry(a, b, True)
+    cache[pair(a, c)] = entry(a, c, False)
+    cache[pair(c, d)] = entry(c, d, True)
+    cache[pair(b, d)] = entry(b, d, False)
     assert len(cache) == 4
 
     assert a == b
@@ -155,24 +162,42 @@ def test_comparable_caching(cache):
     assert e != a
     assert Node.num_equal_calls == 1
     assert pair(a, e) in cache
+    assert cache.info()[:2] == (5, 1)
 
 
-def test_comparable_garbage_collection(cache):
+def test_comparable_cache_doesnt_keep_objects_alive(cache):
     a = Node(name="a")
     b = Node(name="b")
+    assert a != b
+    ref = weakref.ref(a)
+    del a
+    assert ref() is None
+
+
+def test_comparable_cache_detects_reused_ids(cache):
+    a = Node(name="a")
+    b = Node(name="a")
     c = Node(name="c")
     d = Node(name="d")
 
-    cache[pair(a, b)] = True
-    cache[pair(a, c)] = False
-    cache[pair(c, d)] = True
-    cache[pair(b, d)] = False
+    # simulate an entry left behind by objects that had the same ids
+    cache[pair(a, b)] = entry(c, d, False)
+    assert a == b
+    assert Node.num_equal_calls == 1
 
-    assert weakref.getweakrefcount(a) == 2
-    del c
-    assert weakref.getweakrefcount(a) == 1
-    del b
-    assert weakref.getweakrefcount(a) == 0
+
+def test_comparable_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(Node, "__cache__", LRUCache(maxsize=2))
+    nodes = [Node(name=str(i)) for i in range(4)]
+    for a, b in zip(nodes, nodes[1:]):
+        assert a != b
+    assert len(Node.__cache__) == 2
+    assert pair(nodes[0], nodes[1]) not in Node.__cache__
+
+    # evicted results are computed again
+    Node.num_equal_calls = 0
+    assert nodes[0] != nodes[1]
+    assert Node.num_equal_calls == 1
 
 
 def test_comparable_cache_reuse(cache):
@@ -195,13 +220,26 @@ def test_comparable_cache_reuse(cache):
 
     assert len(cache) == expected
 
-    # check that cache is evicted once nodes get collected
-    del nodes
-    assert len(cache) == 0
+    a = Node(name="a")
+    b = Node(name="a")
+    assert a == b
+
 
+def test_equality_cache(cache):
     a = Node(name="a")
     b = Node(name="a")
+
+    with equality_cache() as scoped:
+        assert a == b
+        assert b == a
+        assert scoped.info() == (1, 1, None, 1)
+    assert Node.num_equal_calls == 1
+    assert not cache
+
+    # the scoped results are discarded at the end of the block
     assert a == b
+    assert Node.num_equal_calls == 2
+    assert len(cache) == 1
 
 
 class OneAndOnly(Singleton):
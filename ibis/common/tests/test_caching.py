@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from ibis.common.caching import LRUCache, PersistentCache
+
+pa = pytest.importorskip("pyarrow")
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    # touch "a" so that "b" becomes the least recently used entry
+    assert cache["a"] == 1
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+    assert cache.info().currsize == 2
+
+
+def test_lru_cache_info():
+    cache = LRUCache(maxsize=None)
+    assert cache.get("a") is None
+    cache["a"] = 1
+    assert cache.get("a") == 1
+    assert cache.get("a") == 1
+    assert cache.info() == (2, 1, None, 1)
+
+    cache.clear()
+    assert cache.info() == (0, 0, None, 0)
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+    cache["a"] = 1
+    assert "a" not in cache
+    assert not cache
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_persistent_cache_roundtrip(tmp_path, format):
+    cache = PersistentCache(tmp_path / "cache", format=format)
+    table = pa.table({"a": [1, 2, None], "b": ["x", "y", "z"]})
+
+    assert cache.get("key") is None
+    cache.put("key", table)
+    assert "key" in cache
+    assert cache.get("key").equals(table)
+
+    cache.clear()
+    assert "key" not in cache
+    assert cache.get("key") is None
+
+
+def test_persistent_cache_ttl(tmp_path):
+    cache = PersistentCache(tmp_path, ttl=60)
+    cache.put("key", pa.table({"a": [1]}))
+    assert "key" in cache
+
+    # pretend the entry was written two minutes ago
+    path = tmp_path / "key.parquet"
+    written = time.time() - 120
+    os.utime(path, (written, written))
+
+    assert "key" not in cache
+    assert cache.get("key") is None
+    assert not path.exists()
+
+
+def test_persistent_cache_evicts_least_recently_read(tmp_path):
+    table = pa.table({"a": list(range(1000))})
+    cache = PersistentCache(tmp_path)
+    cache.put("a", table)
+    cache.put("b", table)
+    size = (tmp_path / "a.parquet").stat().st_size
+
+    # make "a" the most recently read entry
+    written = time.time() - 100
+    for key in "ab":
+        os.utime(tmp_path / f"{key}.parquet", (written, written))
+    assert cache.get("a") is not None
+
+    cache.max_size = 2 * size
+    cache.put("c", table)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
@@ -324,6 +324,29 @@ def test_recursive_lookup():
     )
 
 
+def test_replace_keeps_unchanged_nodes():
+    class Leaf(Concrete, Node):
+        name = InstanceOf(str)
+
+    class Branch(Concrete, Node):
+        children = TupleOf(InstanceOf(Node))
+        extra = InstanceOf(Node)
+
+    a, b = Leaf("a"), Leaf("b")
+    left, right = Branch((a,), a), Branch((b,), b)
+    root = Branch((left, right), b)
+
+    result = root.replace({a: Leaf("x")})
+    assert result == Branch((Branch((Leaf("x"),), Leaf("x")), right), b)
+    assert result.children[1] is right
+    assert result.extra is b
+
+    assert root.replace({Leaf("z"): a}) is root
+    # equal but distinct instances of unchanged nodes are kept as well
+    node = Branch((Leaf("a"), Leaf("a")), Leaf("a"))
+    assert node.replace({b: a}) is node
+
+
 def test_coerce_finder():
     f = _coerce_finder(int)
     assert f(1) is True
@@ -16,6 +16,7 @@ from ibis.common.annotations import (
     ValidationError,
     argument,
     attribute,
+    memoized,
     optional,
     varargs,
     varkwargs,
@@ -35,6 +36,7 @@ from ibis.common.patterns import (
     As,
     CoercedTo,
     Coercible,
+    Custom,
     InstanceOf,
     Option,
     Pattern,
@@ -651,6 +653,75 @@ def test_concrete_copy_with_unknown_argument_raise():
         t.copy(c=3, d=4)
 
 
+def test_concrete_rebuild_validates_changed_arguments_only():
+    calls = []
+
+    def check(value, context):
+        calls.append(value)
+        return value
+
+    class Bar(Concrete):
+        a = Custom(check)
+        b = Custom(check)
+
+    t = Bar(1, 2)
+    calls.clear()
+
+    assert t.copy() is t
+    assert t.__rebuild__({"a": 1, "b": 2}) is t
+    assert calls == []
+
+    u = t.copy(b=3)
+    assert calls == [3]
+    assert (u.a, u.b) == (1, 3)
+
+    with pytest.raises(ValidationError):
+        VariadicArgs(1, 2).copy(args=(1, "2"))
+
+    v = VariadicKeywords(a=1, b=2)
+    w = v.copy(kwargs={"b": 2, "a": 1})
+    assert w is not v
+    assert list(w.kwargs) == ["b", "a"]
+
+
+def test_concrete_construct_skips_validation():
+    t = BetweenWithCalculated.__construct__({"value": 1, "lower": 2, "upper": "3"})
+    assert t.upper == "3"
+    assert t.calculated == 3
+    assert t == BetweenWithCalculated.__construct__(
+        {"value": 1, "lower": 2, "upper": "3"}
+    )
+
+
+def test_concrete_memoized_attribute():
+    calls = []
+
+    class Point(Concrete):
+        x = is_int
+        y = is_int
+
+        @memoized
+        def norm(self):
+            """Squared length of the vector."""
+            calls.append(self)
+            return self.x**2 + self.y**2
+
+    p = Point(3, 4)
+    assert calls == []
+    assert p.norm == 25
+    assert p.norm == 25
+    assert calls == [p]
+    assert Point.norm.__doc__ == "Squared length of the vector."
+
+    with pytest.raises(AttributeError):
+        p.norm = 1
+
+    # memoized values aren't part of the identity of the instance
+    q = Point(3, 4)
+    assert p == q
+    assert hash(p) == hash(q)
+
+
 def test_concrete_pickling_variadic_arguments():
     v = VariadicArgs(1, 2, 3, 4, 5)
     assert v.args == (1, 2, 3, 4, 5)
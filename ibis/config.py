@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import contextlib
-from typing import Annotated, Any, Callable, Optional
+from pathlib import Path  # noqa: TCH003
+from typing import Annotated, Any, Callable, Literal, Optional, Union
 
 from public import public
 
@@ -66,11 +67,50 @@ class SQL(Config):
         explicit limit. [](`None`) means no limit.
     default_dialect : str
         Dialect to use for printing SQL when the backend cannot be determined.
+    compile_cache_size : int | None
+        Maximum number of compiled queries each SQL backend keeps around for
+        reuse. `0` disables the cache and [](`None`) means no limit. Takes
+        effect for backends connected after the option is set.
+    bind_params : bool
+        Compile scalar parameters to placeholders and bind their values at
+        execution time on backends that support it, instead of inlining them
+        as literals. The compiled query is then reused across parameter values.
 
     """
 
     default_limit: Optional[PosInt] = None
     default_dialect: str = "duckdb"
+    compile_cache_size: Optional[PosInt] = 128
+    bind_params: bool = False
+
+
+class Cache(Config):
+    """Options for persisting the results of `Table.cache`.
+
+    Attributes
+    ----------
+    directory : str | Path | None
+        Local directory where cached results are stored as files so they can
+        be shared across connections and processes. [](`None`), the default,
+        disables persistence and cached tables only live as long as their
+        connection.
+    format : str
+        File format of persisted results, either `"parquet"` or `"arrow"`
+        (Arrow IPC).
+    max_size : int | None
+        Maximum total size in bytes of the persisted results. The least
+        recently used results are removed once the limit is exceeded.
+        [](`None`) means no limit.
+    ttl : float | None
+        Number of seconds after which a persisted result is considered stale
+        and recomputed. [](`None`) means results never expire.
+
+    """
+
+    directory: Optional[Union[str, Path]] = None
+    format: Literal["parquet", "arrow"] = "parquet"
+    max_size: Optional[PosInt] = None
+    ttl: Optional[Union[int, float]] = None
 
 
 class Interactive(Config):
@@ -157,6 +197,8 @@ class Options(Config):
         Options related to time context adjustment.
     sql: SQL
         SQL-related options.
+    cache: Cache
+        Options for persisting the results of `Table.cache`.
     clickhouse : Config | None
         Clickhouse specific options.
     dask : Config | None
@@ -178,6 +220,7 @@ class Options(Config):
     default_backend: Optional[Any] = None
     context_adjustment: ContextAdjustment = ContextAdjustment()
     sql: SQL = SQL()
+    cache: Cache = Cache()
     clickhouse: Optional[Config] = None
     dask: Optional[Config] = None
     impala: Optional[Config] = None
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import datetime
+import decimal
+import enum
+import uuid
 from abc import abstractmethod
+from collections.abc import Mapping
 from typing import Generic, Optional
 
 from public import public
@@ -18,6 +23,8 @@ from ibis.common.typing import DefaultTypeVars
 
 @public
 class Node(Concrete, Traversable):
+    __slots__ = ("__fingerprint__",)
+
     def equals(self, other) -> bool:
         if not isinstance(other, Node):
             raise TypeError(
@@ -25,6 +32,35 @@ class Node(Concrete, Traversable):
             )
         return self.__cached_equals__(other)
 
+    def fingerprint(self) -> str:
+        """Return a digest of the node that is stable across processes.
+
+        Unlike `hash()`, which is randomized per process, the fingerprint only
+        depends on the structure of the expression: the operations, their
+        arguments including datatypes, schemas and literal values, the data of
+        in-memory tables and the identity of the backends of database tables.
+        It can be used as a key for caches shared between processes.
+
+        The fingerprint is computed bottom-up and memoized on the nodes.
+
+        Returns
+        -------
+        str
+            A 128-bit digest encoded as 32 hexadecimal characters.
+
+        Raises
+        ------
+        TypeError
+            If the expression references values that can't be fingerprinted,
+            such as Python UDFs.
+
+        """
+        try:
+            digest, _ = self.__fingerprint__
+        except AttributeError:
+            digest = _fingerprint(self)
+        return digest.hex()
+
     # Avoid custom repr for performance reasons
     __repr__ = object.__repr__
 
@@ -127,6 +163,128 @@ class Value(Node, Coercible, DefaultTypeVars, Generic[T, S]):
         return getattr(ir, typename)(self)
 
 
+def _fingerprint(root: Node) -> bytes:
+    import hashlib
+
+    from ibis.backends import BaseBackend
+    from ibis.common.graph import Graph
+    from ibis.expr.operations.generic import ScalarParameter
+    from ibis.expr.operations.relations import InMemoryTable, SelfReference
+    from ibis.expr.operations.udf import InputType
+    from ibis.formats import TableProxy
+
+    # arguments that are process-wide counters, renumbered in order of
+    # appearance, which makes the digest of nodes containing them depend on
+    # the enclosing expression
+    counters = {SelfReference: "identifier", ScalarParameter: "counter"}
+    renumbered = {}
+
+    def digest_of(value, schema=None) -> bytes:
+        if isinstance(value, Node):
+            return digests[value][0] if value in digests else value.__fingerprint__[0]
+
+        klass = type(value)
+        h = hashlib.blake2b(
+            f"{klass.__module__}.{klass.__qualname__}".encode(), digest_size=16
+        )
+        if isinstance(value, _FINGERPRINT_ATOMS):
+            h.update(repr(value).encode())
+        elif isinstance(value, dt.DataType):
+            h.update(str(value).encode())
+        elif isinstance(value, Mapping):
+            for k, v in value.items():
+                h.update(digest_of(k))
+                h.update(digest_of(v))
+        elif isinstance(value, (tuple, list)):
+            for v in value:
+                h.update(digest_of(v))
+        elif isinstance(value, (set, frozenset)):
+            for digest in sorted(map(digest_of, value)):
+                h.update(digest)
+        elif isinstance(value, Concrete):
+            for name, arg in zip(value.__argnames__, value.__args__):
+                h.update(name.encode())
+                h.update(digest_of(arg))
+        elif isinstance(value, BaseBackend):
+            h.update(value.db_identity.encode())
+        elif isinstance(value, TableProxy) and schema is not None:
+            h.update(_data_digest(value, schema))
+        else:
+            raise TypeError(f"Unable to fingerprint value of type {klass}")
+        return h.digest()
+
+    def is_pending(node):
+        # nodes whose digest doesn't depend on the enclosing expression are
+        # reused from previous computations
+        return not getattr(node, "__fingerprint__", (None, False))[1]
+
+    digests = {}
+    graph, _ = Graph.from_bfs(root, filter=is_pending).toposort()
+    for node in graph:
+        klass = type(node)
+        if getattr(node, "__input_type__", InputType.BUILTIN) != InputType.BUILTIN:
+            # the behavior of python udfs can't be captured
+            raise TypeError(f"Unable to fingerprint UDF {node.__func_name__}")
+
+        counter = counters.get(klass)
+        schema = node.schema if klass is InMemoryTable else None
+        h = hashlib.blake2b(
+            f"{klass.__module__}.{klass.__qualname__}".encode(), digest_size=16
+        )
+        for name, arg in zip(node.__argnames__, node.__args__):
+            if name == counter:
+                arg = renumbered.setdefault((klass, arg), len(renumbered))
+            elif schema is not None and name == "name":
+                # in-memory tables are identified by their data
+                continue
+            h.update(name.encode())
+            h.update(digest_of(arg, schema))
+
+        context_free = counter is None and all(
+            digests[child][1] if child in digests else True
+            for child in node.__children__
+        )
+        digests[node] = result = (h.digest(), context_free)
+        if context_free or node is root:
+            object.__setattr__(node, "__fingerprint__", result)
+
+    return digests[root][0]
+
+
+def _data_digest(proxy, schema) -> bytes:
+    import hashlib
+
+    import pyarrow as pa
+
+    try:
+        table = proxy.to_pyarrow(schema)
+    except pa.ArrowException as e:
+        raise TypeError(f"Unable to fingerprint {proxy!r}") from e
+
+    h = hashlib.blake2b(digest_size=16)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    h.update(sink.getvalue())
+    return h.digest()
+
+
+_FINGERPRINT_ATOMS = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    decimal.Decimal,
+    enum.Enum,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+)
+
+
 # convenience aliases
 Scalar = Value[T, ds.Scalar]
 Column = Value[T, ds.Columnar]
@@ -34,7 +34,7 @@ class Multiply(NumericBinary):
 
 @public
 class Power(NumericBinary):
-    @property
+    @attribute
     def dtype(self):
         dtypes = (arg.dtype for arg in self.args)
         if util.all_of(dtypes, dt.Integer):
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import itertools
 import typing
+import weakref
 from abc import abstractmethod
 from typing import Annotated, Any, Literal, Optional, TypeVar
 
@@ -9,7 +10,7 @@ from public import public
 
 import ibis.expr.datashape as ds
 import ibis.expr.datatypes as dt
-from ibis.common.annotations import attribute
+from ibis.common.annotations import attribute, memoized
 from ibis.common.collections import FrozenDict
 from ibis.common.exceptions import IbisTypeError, IntegrityError, RelationError
 from ibis.common.grounds import Concrete
@@ -58,14 +59,30 @@ class Relation(Node, Coercible):
         """
         ...
 
+    @memoized
+    def _field_refs(self) -> dict[str, weakref.ref]:
+        # fields reference their relation, so the relation only references
+        # them weakly to avoid a cycle that only the garbage collector frees
+        return {}
+
     @property
     def fields(self) -> FrozenDict[str, Column]:
         """A mapping of column names to fields of the relation.
 
         This calculated property shouldn't be overridden in subclasses since it
-        is mostly used for convenience.
+        is mostly used for convenience. The same field nodes are returned on
+        every access for as long as they're referenced elsewhere.
         """
-        return FrozenDict({k: Field(self, k) for k in self.schema})
+        return FrozenDict({name: self._field(name) for name in self.schema})
+
+    def _field(self, name: str) -> Field:
+        """Return the field `name`, which must be in the schema of the relation."""
+        refs = self._field_refs
+        if (ref := refs.get(name)) is None or (field := ref()) is None:
+            # the relation and the names of its schema are valid arguments
+            field = Field.__construct__({"rel": self, "name": name})
+            refs[name] = weakref.ref(field)
+        return field
 
     def to_expr(self):
         from ibis.expr.types import Table
@@ -23,7 +23,7 @@ class WindowingTVF(Relation):
     def values(self):
         return self.table.fields
 
-    @property
+    @attribute
     def schema(self):
         names = list(self.table.schema.names)
         types = list(self.table.schema.types)
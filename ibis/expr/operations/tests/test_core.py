@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from typing import Optional
 
 import pytest
@@ -231,3 +232,76 @@ def test_expression_class_aliases():
     assert ir.AnyValue is ir.Value
     assert ir.AnyScalar is ir.Scalar
     assert ir.AnyColumn is ir.Column
+
+
+_FINGERPRINT_SCRIPT = """
+import ibis
+t = ibis.table({"a": "int64", "b": "string"}, name="t")
+left, right = t.view(), t.view()
+expr = (
+    left.join(right, left.a == right.a)
+    .select(left.b, c=right.a + ibis.literal(1.5))
+    .union(ibis.memtable({"b": ["x"], "c": [2.5]}))
+)
+print(expr.op().fingerprint())
+"""
+
+
+def test_fingerprint_is_stable_across_processes():
+    import subprocess
+    import sys
+
+    results = {
+        subprocess.run(
+            [sys.executable, "-c", _FINGERPRINT_SCRIPT],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert len(results) == 1
+    (digest,) = results
+    assert len(digest) == 32
+
+
+def test_fingerprint():
+    expr = t.filter(t.a > 1).a.sum()
+    assert expr.op().fingerprint() == t.filter(t.a > 1).a.sum().op().fingerprint()
+    assert expr.op().fingerprint() != t.filter(t.a > 2).a.sum().op().fingerprint()
+    assert t.a.cast("int32").op().fingerprint() != t.a.cast("!int32").op().fingerprint()
+    assert (
+        ibis.table({"a": "int64"}, name="t").op().fingerprint()
+        != ibis.table({"a": "int32"}, name="t").op().fingerprint()
+    )
+
+
+def test_fingerprint_memtable_data():
+    pd = pytest.importorskip("pandas")
+
+    one = ibis.memtable(pd.DataFrame({"a": [1, 2]}))
+    assert one.op().fingerprint() == ibis.memtable({"a": [1, 2]}).op().fingerprint()
+    assert one.op().fingerprint() != ibis.memtable({"a": [1, 3]}).op().fingerprint()
+
+
+def test_fingerprint_self_references():
+    def join():
+        left, right = t.view(), t.view()
+        return left.join(right, left.a == right.a).select(x=left.a, y=right.a)
+
+    # the views get distinct identifiers on every call
+    assert join().op().fingerprint() == join().op().fingerprint()
+
+    left, right = t.view(), t.view()
+    swapped = left.join(right, left.a == right.a).select(x=right.a, y=left.a)
+    assert swapped.op().fingerprint() != join().op().fingerprint()
+
+
+def test_fingerprint_python_udf():
+    @ibis.udf.scalar.python
+    def add_one(x: int) -> int:
+        return x + 1
+
+    with pytest.raises(TypeError, match="add_one"):
+        add_one(t.a).op().fingerprint()
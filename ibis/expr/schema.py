@@ -4,7 +4,7 @@ from collections.abc import Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any, Union
 
 import ibis.expr.datatypes as dt
-from ibis.common.annotations import attribute
+from ibis.common.annotations import memoized
 from ibis.common.collections import FrozenDict, MapSet
 from ibis.common.dispatch import lazy_singledispatch
 from ibis.common.exceptions import InputTypeError, IntegrityError
@@ -55,15 +55,15 @@ class Schema(Concrete, Coercible, MapSet):
             return value
         return schema(value)
 
-    @attribute
+    @memoized
     def names(self):
         return tuple(self.keys())
 
-    @attribute
+    @memoized
     def types(self):
         return tuple(self.values())
 
-    @attribute
+    @memoized
     def _name_locs(self) -> dict[str, int]:
         return {v: i for i, v in enumerate(self.names)}
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import contextlib
+import gc
+import weakref
 
 import pytest
 
@@ -11,7 +13,7 @@ import ibis.expr.operations as ops
 import ibis.expr.types as ir
 from ibis import _
 from ibis.common.annotations import ValidationError
-from ibis.common.exceptions import IbisInputError, IntegrityError
+from ibis.common.exceptions import IbisInputError, IbisTypeError, IntegrityError
 from ibis.expr.operations import (
     Aggregate,
     Field,
@@ -49,6 +51,32 @@ def test_field():
     assert f.relations == frozenset([t.op()])
 
 
+def test_fields_are_reused():
+    node = t.op()
+    fields = node.fields
+    assert all(a is b for a, b in zip(fields.values(), node.fields.values()))
+    assert t.int_col.op() is fields["int_col"]
+    assert t[1].op() is fields["int_col"]
+
+    filtered = t.filter(t.bool_col).op()
+    assert all(a is b for a, b in zip(filtered.values.values(), fields.values()))
+
+    # fields only reference their relation, so no reference cycle is created
+    # and the relation is freed without a garbage collection
+    gc.disable()
+    try:
+        unbound = ops.UnboundTable("t", {"a": "int64"})
+        ref = weakref.ref(unbound)
+        assert unbound.to_expr().a.op().rel is unbound
+        del unbound
+        assert ref() is None
+    finally:
+        gc.enable()
+
+    with pytest.raises(IbisTypeError, match="Column 'missing' is not found"):
+        t._get_column("missing")
+
+
 def test_relation_coercion():
     assert ops.Relation.__coerce__(t) == t.op()
     assert ops.Relation.__coerce__(t.op()) == t.op()
@@ -371,6 +371,31 @@ class Expr(Immutable, Coercible):
             self, limit=limit, timecontext=timecontext, params=params, **kwargs
         )
 
+    @experimental
+    async def execute_async(
+        self,
+        limit: int | str | None = "default",
+        params: Mapping[ir.Value, Any] | None = None,
+        **kwargs: Any,
+    ):
+        """Execute an expression against its backend without blocking.
+
+        See `BaseBackend.execute_async` for how the query is run.
+
+        Parameters
+        ----------
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        params
+            Mapping of scalar parameter expressions to value
+        kwargs
+            Keyword arguments
+        """
+        return await self._find_backend(use_default=True).execute_async(
+            self, limit=limit, params=params, **kwargs
+        )
+
     def compile(
         self,
         limit: int | None = None,
@@ -473,6 +498,35 @@ class Expr(Immutable, Coercible):
             self, params=params, limit=limit, **kwargs
         )
 
+    @experimental
+    async def to_pyarrow_async(
+        self,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        **kwargs: Any,
+    ) -> pa.Table:
+        """Execute expression to a pyarrow table without blocking.
+
+        Parameters
+        ----------
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        Table
+            A pyarrow table holding the results of the executed expression.
+        """
+        return await self._find_backend(use_default=True).to_pyarrow_async(
+            self, params=params, limit=limit, **kwargs
+        )
+
     @experimental
     def to_polars(
         self,
@@ -124,8 +124,9 @@ def dereference_mapping_left(chain):
     subs = dereference_mapping(rels)
 
     # also allow to dereference fields of the join chain itself
+    fields = chain.fields
     for k, v in chain.values.items():
-        subs[ops.Field(chain, k)] = v
+        subs[fields[k]] = v
 
     return subs
 
@@ -133,7 +134,8 @@ def dereference_mapping_left(chain):
 def dereference_mapping_right(right):
     # the right table is wrapped in a JoinTable the uniqueness of the underlying
     # table which requires the predicates to be dereferenced to the wrapped
-    return {v: ops.Field(right, k) for k, v in right.values.items()}
+    fields = right.fields
+    return {v: fields[k] for k, v in right.values.items()}
 
 
 def dereference_sides(left, right, deref_left, deref_right):
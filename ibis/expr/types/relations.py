@@ -153,6 +153,7 @@ def dereference_mapping(parents):
             mapping[v] = v
 
     for parent in parents:
+        fields = parent.fields
         for k, v in parent.values.items():
             if isinstance(v, ops.Field):
                 # track down the field in the hierarchy until no modification
@@ -161,11 +162,11 @@ def dereference_mapping(parents):
                 # we want to dereference to, see the docstring of
                 # `dereference_values()` for more details
                 while isinstance(v, ops.Field) and v not in mapping:
-                    mapping[v] = ops.Field(parent, k)
+                    mapping[v] = fields[k]
                     v = v.rel.values.get(v.name)
             elif v.relations and v not in mapping:
                 # do not dereference literal expressions
-                mapping[v] = ops.Field(parent, k)
+                mapping[v] = fields[k]
 
     return mapping
 
@@ -536,7 +537,13 @@ class Table(Expr, _FixedTextJupyterMixin):
         """Get a column from the table."""
         if isinstance(name, int):
             name = self.schema().name_at_position(name)
-        return ops.Field(self, name).to_expr()
+        node = self.op()
+        if name in node.schema:
+            field = node._field(name)
+        else:
+            # let the constructor raise a descriptive error
+            field = ops.Field(node, name)
+        return field.to_expr()
 
     def __getitem__(self, what):
         """Select items from a table expression.
@@ -3347,6 +3354,13 @@ class Table(Expr, _FixedTextJupyterMixin):
         This method is idempotent: calling it multiple times in succession will
         return the same value as the first call.
 
+        Results can additionally be persisted to files in a local directory by
+        setting `ibis.options.cache.directory`. Persisted results are keyed by
+        the structure of the expression and the identity of its source tables
+        and are shared across connections and processes. Changes to the data
+        of source tables aren't detected, use `ibis.options.cache.ttl` to
+        bound how stale a persisted result can get.
+
         ::: {.callout-note}
         ## This method eagerly evaluates the expression prior to caching
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+import itertools
 import warnings
 from functools import partial
 from importlib.util import find_spec as _find_spec
@@ -34,6 +35,10 @@ if not _has_arrow_dtype:
 geospatial_supported = _find_spec("geopandas") is not None
 
 
+def _identity(value):
+    return value
+
+
 class PandasType(NumpyType):
     @classmethod
     def to_ibis(cls, typ, nullable=True):
@@ -127,14 +132,15 @@ class PandasData(DataMapper):
                 "schema column count does not match input data column count"
             )
 
-        columns = []
-        for (_, series), dtype in zip(df.items(), schema.types):
-            columns.append(cls.convert_column(series, dtype))
-        df = cls.concat(columns, axis=1)
-
         # return data with the schema's columns which may be different than the
         # input columns
-        df.columns = schema.names
+        columns = {
+            name: cls.convert_column(series, dtype)
+            for (_, series), (name, dtype) in zip(df.items(), schema.items())
+        }
+        # columns that didn't need any conversion share memory with the input,
+        # avoid the full copy a concatenation would make
+        df = pd.DataFrame(columns, index=df.index, copy=False)
 
         if geospatial_supported:
             from geopandas import GeoDataFrame
@@ -157,6 +163,8 @@ class PandasData(DataMapper):
     @classmethod
     def convert_column(cls, obj, dtype):
         pandas_type = PandasType.from_ibis(dtype)
+        if obj.dtype == pandas_type and cls._is_noop_dtype(dtype):
+            return obj
 
         method_name = f"convert_{dtype.__class__.__name__}"
         convert_method = getattr(cls, method_name, cls.convert_default)
@@ -165,6 +173,20 @@ class PandasData(DataMapper):
         assert not isinstance(result, np.ndarray), f"{convert_method} -> {type(result)}"
         return result
 
+    @staticmethod
+    def _is_noop_dtype(dtype):
+        # types whose conversion is a no-op once the column has the target
+        # pandas dtype; object-backed types like decimals, dates or nested
+        # values still need their values normalized
+        return (
+            dtype.is_boolean()
+            or dtype.is_integer()
+            or dtype.is_floating()
+            or dtype.is_string()
+            or dtype.is_timestamp()
+            or dtype.is_interval()
+        )
+
     @classmethod
     def convert_scalar(cls, obj, dtype):
         df = PandasData.convert_table(obj, sch.Schema({obj.columns[0]: dtype}))
@@ -294,13 +316,26 @@ class PandasData(DataMapper):
     @classmethod
     def get_element_converter(cls, dtype):
         name = f"convert_{type(dtype).__name__}_element"
-        funcgen = getattr(cls, name, lambda _: lambda x: x)
+        funcgen = getattr(cls, name, lambda _: _identity)
         return funcgen(dtype)
 
     @classmethod
     def convert_Struct_element(cls, dtype):
         converters = tuple(map(cls.get_element_converter, dtype.types))
 
+        if all(converter is _identity for converter in converters):
+
+            def convert(values, names=dtype.names):
+                if values is None:
+                    return values
+
+                items = (
+                    values.items() if isinstance(values, dict) else zip(names, values)
+                )
+                return dict(itertools.islice(items, len(names)))
+
+            return convert
+
         def convert(values, names=dtype.names, converters=converters):
             if values is None:
                 return values
@@ -361,6 +396,13 @@ class PandasData(DataMapper):
     def convert_Array_element(cls, dtype):
         convert_value = cls.get_element_converter(dtype.value_type)
 
+        if convert_value is _identity:
+
+            def convert(values):
+                return values if values is None else list(values)
+
+            return convert
+
         def convert(values):
             if values is None:
                 return values
@@ -376,6 +418,13 @@ class PandasData(DataMapper):
         convert_key = cls.get_element_converter(dtype.key_type)
         convert_value = cls.get_element_converter(dtype.value_type)
 
+        if convert_key is _identity and convert_value is _identity:
+
+            def convert(raw_row):
+                return raw_row if raw_row is None else dict(raw_row)
+
+            return convert
+
         def convert(raw_row):
             if raw_row is None:
                 return raw_row
@@ -431,3 +431,50 @@ def test_convert_dataframe_with_timezone():
     desired_schema = ibis.schema(dict(time='timestamp("EST")'))
     result = PandasData.convert_table(df.copy(), desired_schema)
     tm.assert_frame_equal(expected, result)
+
+
+def test_convert_table_skips_matching_columns():
+    df = pd.DataFrame(
+        {
+            "a": np.arange(3, dtype="int64"),
+            "b": [1.0, 2.0, None],
+            "c": ["x", None, "z"],
+            "d": [1, 2, 3],
+        }
+    )
+    schema = ibis.schema(dict(w="int64", x="float64", y="string", z="float32"))
+    result = PandasData.convert_table(df, schema)
+
+    assert list(result.columns) == ["w", "x", "y", "z"]
+    assert result.z.dtype == np.float32
+    # columns that already have the target dtype are passed through as-is
+    for src, dst in [("a", "w"), ("b", "x")]:
+        assert np.shares_memory(df[src].to_numpy(), result[dst].to_numpy())
+
+
+@pytest.mark.parametrize(
+    ("data", "dtype", "expected"),
+    [
+        param(
+            [np.array([1, 2]), None, np.array([], dtype="int64")],
+            dt.Array(dt.int64),
+            [[1, 2], None, []],
+            id="array",
+        ),
+        param(
+            [[("a", 1)], None, []],
+            dt.Map(dt.string, dt.int64),
+            [{"a": 1}, None, {}],
+            id="map",
+        ),
+        param(
+            [{"a": 1, "b": "x"}, None, (2, "y")],
+            dt.Struct(dict(a="int64", b="string")),
+            [{"a": 1, "b": "x"}, None, {"a": 2, "b": "y"}],
+            id="struct",
+        ),
+    ],
+)
+def test_convert_nested_column(data, dtype, expected):
+    result = PandasData.convert_column(pd.Series(data, dtype=object), dtype)
+    assert result.tolist() == expected
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+import ibis
+
+ROW_COUNTS = [10**3, 10**5, 10**7]
+"""Data sizes the execution benchmarks are parametrized over."""
+
+MAX_ROWS = int(float(os.environ.get("IBIS_BENCHMARK_MAX_ROWS", 10**5)))
+"""Largest data size to run, larger sizes are skipped."""
+
+MEMORY_BASELINE = os.environ.get("IBIS_BENCHMARK_MEMORY_BASELINE")
+"""Path to a pytest-benchmark JSON file to compare peak memory against."""
+
+MEMORY_THRESHOLD = float(os.environ.get("IBIS_BENCHMARK_MEMORY_THRESHOLD", 10))
+"""Allowed peak memory regression, in percent, relative to the baseline."""
+
+LOCAL_BACKENDS = ["duckdb", "sqlite", "pandas", "polars", "dask"]
+
+
+@functools.cache
+def generate_data(nrows: int, seed: int = 42) -> pa.Table:
+    """Generate a table of `nrows` rows with a mix of types and nulls."""
+    rng = np.random.default_rng(seed)
+    nulls = rng.random(nrows) < 0.1
+    return pa.table(
+        {
+            "key": rng.integers(0, 1_000, size=nrows),
+            "low_card_key": pa.array(
+                np.char.add("k", rng.integers(0, 30, size=nrows).astype(str))
+            ),
+            "value": pa.array(rng.random(nrows), mask=nulls),
+            "ints": pa.array(rng.integers(-(2**31), 2**31, size=nrows), mask=nulls),
+            "ts": pa.array(
+                np.datetime64("2023-05-05T16:37:57")
+                + rng.integers(0, 10**8, size=nrows).astype("timedelta64[s]")
+            ),
+        }
+    )
+
+
+@pytest.fixture(params=ROW_COUNTS, ids=lambda n: f"{n:.0e}")
+def rows(request):
+    if (nrows := request.param) > MAX_ROWS:
+        pytest.skip(f"{nrows} rows exceeds IBIS_BENCHMARK_MAX_ROWS={MAX_ROWS}")
+    return nrows
+
+
+@pytest.fixture
+def data(rows):
+    return generate_data(rows)
+
+
+@pytest.fixture(params=LOCAL_BACKENDS)
+def backend_name(request):
+    return request.param
+
+
+@pytest.fixture
+def con(backend_name):
+    pytest.importorskip(f"ibis.backends.{backend_name}")
+    return getattr(ibis, backend_name).connect()
+
+
+@pytest.fixture
+def table(con, data):
+    return con.create_table("t", data, overwrite=True)
+
+
+@functools.cache
+def _memory_baseline(path: str) -> dict[str, int]:
+    benchmarks = json.loads(Path(path).read_text())["benchmarks"]
+    return {
+        bench["fullname"]: peak
+        for bench in benchmarks
+        if (peak := bench["extra_info"].get("peak_memory_bytes")) is not None
+    }
+
+
+@pytest.fixture
+def measure_memory(benchmark, request):
+    """Record the peak Python heap usage of a benchmarked call.
+
+    The function is run once more under `tracemalloc` and the peak is stored
+    in `extra_info` so that it is saved alongside the timings. Allocations
+    made outside of the Python allocator (e.g. by Arrow or DuckDB) are not
+    accounted for.
+
+    If `IBIS_BENCHMARK_MEMORY_BASELINE` points to a saved benchmark run, the
+    test fails when the peak exceeds the baseline by more than
+    `IBIS_BENCHMARK_MEMORY_THRESHOLD` percent.
+    """
+
+    def measure(func, *args, **kwargs):
+        if benchmark.disabled:
+            return None
+
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        benchmark.extra_info["peak_memory_bytes"] = peak
+
+        if MEMORY_BASELINE is not None:
+            baseline = _memory_baseline(MEMORY_BASELINE).get(request.node.nodeid)
+            limit = baseline and baseline * (1 + MEMORY_THRESHOLD / 100)
+            if limit is not None and peak > limit:
+                pytest.fail(
+                    f"peak memory {peak} bytes exceeds the baseline of "
+                    f"{baseline} bytes by more than {MEMORY_THRESHOLD}%"
+                )
+        return peak
+
+    return measure
@@ -4,6 +4,7 @@ import copy
 import functools
 import inspect
 import itertools
+import operator
 import os
 import string
 
@@ -16,7 +17,10 @@ import ibis
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
+import ibis.selectors as s
+from ibis import _
 from ibis.backends import _get_backend_names
+from ibis.common.egraph import EGraph, Pattern, Variable
 
 pytestmark = pytest.mark.benchmark
 
@@ -321,6 +325,26 @@ def test_execute(benchmark, expression_fn, pt):
     benchmark(expr.execute)
 
 
+@pytest.fixture(scope="module")
+def pandas_pt(pt):
+    con = ibis.pandas.connect({"df": pt.to_pandas()})
+    return con.table("df")
+
+
+@pytest.mark.benchmark(group="execution")
+@pytest.mark.parametrize(
+    "expression_fn",
+    [
+        pytest.param(high_card_group_by, id="high_card_group_by"),
+        pytest.param(low_card_grouped_rolling, id="low_card_grouped_rolling"),
+        pytest.param(high_card_grouped_rolling, id="high_card_grouped_rolling"),
+    ],
+)
+def test_execute_pandas(benchmark, expression_fn, pandas_pt):
+    expr = expression_fn(pandas_pt)
+    benchmark(expr.execute)
+
+
 @pytest.fixture(scope="module")
 def part():
     return ibis.table(
@@ -527,7 +551,7 @@ def test_eq_datatypes(benchmark, dtypes):
 
 
 def multiple_joins(table, num_joins):
-    for _ in range(num_joins):
+    for _i in range(num_joins):
         table = table.mutate(dummy=ibis.literal(""))
         table = table.left_join(table, ["dummy"])[[table]]
 
@@ -811,3 +835,128 @@ def test_big_join_compile(benchmark, src, diff):
         warmup_rounds=1,
     )
     assert len(t)
+
+
+@pytest.fixture(scope="module")
+def wide_table():
+    types = ["int64", "float64", "string", "timestamp", "array<int64>"]
+    return ibis.table(
+        {f"col_{i}": types[i % len(types)] for i in range(1_000)}, name="wide"
+    )
+
+
+@pytest.mark.benchmark(group="selectors")
+@pytest.mark.parametrize(
+    "selector",
+    [
+        pytest.param(lambda: s.numeric(), id="numeric"),
+        pytest.param(lambda: s.of_type("string") | s.matches(r"_\d*7$"), id="union"),
+        pytest.param(lambda: s.startswith("col_1") & ~s.of_type("array"), id="mixed"),
+    ],
+)
+def test_selectors_expand(benchmark, wide_table, selector):
+    sel = selector()
+    benchmark(wide_table.select, sel)
+
+
+@pytest.mark.benchmark(group="selectors")
+def test_selectors_across(benchmark, wide_table):
+    benchmark(wide_table.mutate, s.across(s.numeric(), _ + 1))
+
+
+def wide_pipeline(t, steps):
+    for i in range(steps):
+        step = i % 5
+        if step == 0:
+            t = t.mutate(**{f"m{i}": t.col_0 + i})
+        elif step == 1:
+            t = t.filter(t.col_1 > i)
+        elif step == 2:
+            t = t.select(s.numeric(), **{f"x{i}": _.col_5 * 2})
+        elif step == 3:
+            t = t.mutate(s.across(s.c("col_6", "col_11"), _ + 1))
+        else:
+            t = t.drop(f"m{i - 4}")
+        assert t.columns
+    return t
+
+
+@pytest.mark.benchmark(group="construction")
+@pytest.mark.parametrize("steps", [10, 50])
+def test_wide_table_pipeline(benchmark, wide_table, steps):
+    benchmark(wide_pipeline, wide_table, steps)
+
+
+@pytest.fixture(scope="module")
+def egraph_rules():
+    a, b, c = Variable("a"), Variable("b"), Variable("c")
+    return [
+        Pattern(ops.Add, (a, b)) >> Pattern(ops.Add, (b, a)),
+        Pattern(ops.Add, (Pattern(ops.Add, (a, b)), c))
+        >> Pattern(ops.Add, (a, Pattern(ops.Add, (b, c)))),
+    ]
+
+
+@pytest.fixture(scope="module")
+def egraph_expr(wide_table):
+    cols = [wide_table[f"col_{i}"] for i in range(0, 40, 5)]
+    return functools.reduce(operator.add, cols).sum()
+
+
+@pytest.mark.benchmark(group="egraph")
+def test_egraph_add(benchmark, wide_table):
+    expr = functools.reduce(operator.add, s.numeric().expand(wide_table))
+
+    def add():
+        egraph = EGraph()
+        egraph.add(expr.op())
+
+    benchmark(add)
+
+
+@pytest.mark.benchmark(group="egraph")
+def test_egraph_saturate(benchmark, egraph_expr, egraph_rules):
+    def saturate():
+        egraph = EGraph()
+        node = egraph.add(egraph_expr.op())
+        egraph.run(egraph_rules, 4)
+        return egraph.extract(node)
+
+    result = benchmark(saturate)
+    assert isinstance(result, ops.Sum)
+
+
+@pytest.fixture(scope="module")
+def rewrite_expr(wide_table):
+    expr = wide_table
+    for i in range(5):
+        numeric = s.of_type("int64").expand(expr)[:50]
+        expr = expr.mutate(**{f"{c.get_name()}_{i}": c * 2 + i for c in numeric})
+        expr = expr.filter(_.col_0 > i)
+    return expr
+
+
+@pytest.mark.benchmark(group="rewrite")
+@pytest.mark.parametrize("method", ["__recreate__", "__rebuild__"])
+@pytest.mark.parametrize("target", ["none", "predicate", "table"])
+def test_rewrite_rebuild(benchmark, rewrite_expr, method, target):
+    node = rewrite_expr.op()
+    if target == "table":
+        # replacing the base table forces every node of the graph to be rebuilt
+        old = node.find(ops.UnboundTable)[0]
+        subs = {old: old.copy(name="other")}
+    elif target == "predicate":
+        # only the outermost filter and its predicate change
+        (old,) = node.predicates
+        subs = {old: old.copy(right=ops.Literal(-1, dtype="int8"))}
+    else:
+        subs = {}
+
+    def rebuild(node, _, **kwargs):
+        try:
+            return subs[node]
+        except KeyError:
+            return getattr(node, method)(kwargs)
+
+    result = benchmark(node.replace, rebuild)
+    assert (result == node) is (target == "none")
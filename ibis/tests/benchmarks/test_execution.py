@@ -0,0 +1,117 @@
+"""Execution benchmarks for the local backends over generated data.
+
+Each benchmark is parametrized over the backends in `LOCAL_BACKENDS` and the
+data sizes in `ROW_COUNTS`; set `IBIS_BENCHMARK_MAX_ROWS` to run the larger
+sizes.
+"""
+
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+
+import ibis
+from ibis import _
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.benchmark(group="fetch")
+def test_to_pyarrow(benchmark, measure_memory, con, table, rows):
+    result = benchmark(con.to_pyarrow, table)
+    measure_memory(con.to_pyarrow, table)
+    assert len(result) == rows
+
+
+@pytest.mark.benchmark(group="fetch")
+def test_to_pyarrow_batches(benchmark, measure_memory, con, table, rows):
+    def consume():
+        return sum(len(batch) for batch in con.to_pyarrow_batches(table))
+
+    result = benchmark(consume)
+    measure_memory(consume)
+    assert result == rows
+
+
+@pytest.mark.benchmark(group="convert")
+def test_to_pandas(benchmark, measure_memory, con, table, rows):
+    result = benchmark(con.execute, table)
+    measure_memory(con.execute, table)
+    assert len(result) == rows
+
+
+@pytest.mark.benchmark(group="memtable")
+def test_memtable_register(benchmark, measure_memory, con, data):
+    # every memtable gets a fresh name, so each call registers the data anew
+    def register():
+        return con.execute(ibis.memtable(data).count())
+
+    result = benchmark(register)
+    measure_memory(register)
+    assert result == len(data)
+
+
+@pytest.mark.benchmark(group="insert")
+@pytest.mark.parametrize("backend_name", ["duckdb", "sqlite"])
+def test_insert(benchmark, measure_memory, con, data):
+    schema = ibis.schema(data.schema)
+    con.create_table("dst", schema=schema, overwrite=True)
+    src = ibis.memtable(data)
+
+    benchmark(con.insert, "dst", src, overwrite=True)
+    measure_memory(con.insert, "dst", src, overwrite=True)
+    assert con.table("dst").count().execute() == len(data)
+
+
+@pytest.mark.benchmark(group="cache")
+def test_cache(benchmark, measure_memory, table):
+    expr = table.filter(_.value > 0.5).select("key", "value")
+
+    def cache():
+        cached = expr.cache()
+        cached.release()
+
+    benchmark(cache)
+    measure_memory(cache)
+
+
+@pytest.mark.benchmark(group="executor")
+def test_group_by(benchmark, measure_memory, con, table):
+    expr = table.group_by("low_card_key").agg(
+        total=_.value.sum(), n=_.count(), top=_.ints.max()
+    )
+    result = benchmark(con.execute, expr)
+    measure_memory(con.execute, expr)
+    assert len(result) == 30
+
+
+@pytest.mark.benchmark(group="executor")
+def test_window(benchmark, measure_memory, con, table, backend_name, rows):
+    if backend_name == "polars":
+        pytest.skip("polars doesn't support ordered window functions")
+
+    w = ibis.window(group_by="low_card_key", order_by="ts", preceding=10, following=0)
+    expr = table.mutate(rolling=_.value.mean().over(w))
+    result = benchmark(con.execute, expr)
+    measure_memory(con.execute, expr)
+    assert len(result) == rows
+
+
+@pytest.mark.benchmark(group="executor")
+def test_join(benchmark, measure_memory, con, table):
+    keys = con.create_table(
+        "keys",
+        pa.table({"key": range(0, 1_000, 2), "label": [f"k{i}" for i in range(500)]}),
+        overwrite=True,
+    )
+    expr = table.join(keys, "key").select("key", "label", "value")
+    result = benchmark(con.execute, expr)
+    measure_memory(con.execute, expr)
+    assert len(result) > 0
+
+
+@pytest.mark.benchmark(group="executor")
+def test_filter_sort_limit(benchmark, con, table):
+    expr = table.filter(_.ints.notnull()).order_by(_.ts.desc()).limit(100)
+    result = benchmark(con.execute, expr)
+    assert len(result) == 100